@@ -0,0 +1,177 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Benchmark of inserting candidate vectors (see parameter_layout).
+#
+# Generates a model with distinct values per consumer unit and inserts a batch
+# of perturbed candidates, once via IOModel.moea_insert_vector with a list and
+# once via ParameterLayout.insert with a NumPy array, reporting candidates per
+# second. Both paths have to result in the same model.
+#
+# Given the source directory of another checkout (e.g. of the commit before the
+# layout), its moea_insert_vector is timed as well, in a subprocess using that
+# huum_io, and used as the reference for the speedups. As timings on shared
+# machines are noisy, both are run alternately, taking the best of each.
+#
+# Usage:
+#   python bench_insert.py [number of holdings] [number of candidates]
+#       [source directory of the reference checkout]
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import copy
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# internal
+import generate_model
+
+# 1. Global vars ===============================================================
+num_repeat = 3  # best of n runs
+
+
+# 2. Functions =================================================================
+def insert_best_of(insert, candidates):
+
+    t_best = None
+    for _ in range(num_repeat):
+        t_start = time.perf_counter()
+        for vec in candidates:
+            insert(vec)
+        t_run = time.perf_counter() - t_start
+        if t_best is None or t_run < t_best:
+            t_best = t_run
+
+    return t_best
+
+
+def gen_population(n_holdings, n_candidates):
+
+    io_model = generate_model.gen_model(n_holdings, distinct=True)
+    vec, _, _ = io_model.moea_gen_vectors(False)  # sets the data extends
+
+    rng = np.random.default_rng(42)
+    population = np.array(vec) * rng.uniform(
+        0.95, 1.05, size=(n_candidates, len(vec)))
+
+    return io_model, population
+
+
+def tree_only(n_holdings, n_candidates):
+    # run in the reference checkout, which may lack parameter_layout
+
+    io_model, population = gen_population(n_holdings, n_candidates)
+    print(n_candidates /
+          insert_best_of(io_model.moea_insert_vector, population.tolist()))
+
+
+def reference_rate(dir_src, n_holdings, n_candidates):
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [os.path.abspath(dir_src),
+         os.path.dirname(os.path.abspath(__file__))])
+    result = subprocess.run([
+        sys.executable,
+        os.path.abspath(__file__),
+        str(n_holdings),
+        str(n_candidates), '--tree'
+    ],
+                            env=env,
+                            capture_output=True,
+                            text=True,
+                            check=True)
+
+    return float(result.stdout.split()[-1])
+
+
+def main(n_holdings, n_candidates, dir_reference=None):
+
+    from huum_io import parameter_layout
+
+    io_model, population = gen_population(n_holdings, n_candidates)
+    io_model_flat = copy.deepcopy(io_model)
+    layout = parameter_layout.ParameterLayout.compile(io_model_flat)
+
+    print(f'Generated model: {n_holdings} holdings, {len(layout)} parameters, '
+          f'{n_candidates} candidates\n')
+
+    # alternating, keeping the best rate of each
+    rates = {}
+    for _ in range(num_repeat if dir_reference else 1):
+        runs = [
+            ('moea_insert_vector', lambda: n_candidates / insert_best_of(
+                io_model.moea_insert_vector, population.tolist())),
+            ('ParameterLayout.insert', lambda: n_candidates /
+             insert_best_of(layout.insert, population)),
+        ]
+        if dir_reference:
+            runs.insert(0, ('reference tree insert', lambda: reference_rate(
+                dir_reference, n_holdings, n_candidates)))
+
+        for name, run in runs:
+            rates[name] = max(rates.get(name, 0.0), run())
+
+    results = list(rates.items())
+
+    # both need to end up with the same model
+    docs = [
+        dict((fn, render()) for fn, render in m.iter_documents('model.yaml'))
+        for m in (io_model, io_model_flat)
+    ]
+    if docs[0] != docs[1]:
+        raise RuntimeError('bench_insert: the inserted models differ.')
+
+    c_ref = results[0][1]
+    print(f'{"insert":<24}{"[cand/s]":>12}{"speedup":>10}')
+    for name, c_rate in results:
+        print(f'{name:<24}{c_rate:>12.1f}{c_rate / c_ref:>10.2f}')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    n = 1000
+    n_cand = 20
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        n_cand = int(sys.argv[2])
+    if len(sys.argv) > 3 and sys.argv[3] == '--tree':
+        tree_only(n, n_cand)
+    else:
+        main(n, n_cand, sys.argv[3] if len(sys.argv) > 3 else None)
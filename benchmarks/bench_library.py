@@ -0,0 +1,118 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Benchmark of writing with a shared library (see util.library).
+#
+# Generates a model, then writes it with one file per agent & appliance and
+# with a shared library, comparing the write time, number of files & output
+# size. The model is built from a few archetypes by default, as in scenario
+# batches; pass 'distinct' to give each consumer unit its own values.
+#
+# Usage:
+#   python bench_library.py [number of holdings] [distinct]
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# internal
+from huum_io import model_io
+from huum_io.util import library
+
+import generate_model
+
+# 1. Global vars ===============================================================
+num_repeat = 3  # best of n runs
+
+
+# 2. Functions =================================================================
+def write_best_of(huum, dir_out, use_library):
+
+    t_best = None
+    for _ in range(num_repeat):
+        shutil.rmtree(dir_out, ignore_errors=True)
+        lib = library.SharedLibrary() if use_library else None
+
+        t_start = time.perf_counter()
+        huum.write(os.path.join(dir_out, 'settings.yaml'),
+                   root_dir=os.path.join(dir_out, 'model') + '/',
+                   library=lib)
+        t_run = time.perf_counter() - t_start
+        if t_best is None or t_run < t_best:
+            t_best = t_run
+
+    num_files = 0
+    num_bytes = 0
+    for dir_sub, _, files in os.walk(dir_out):
+        num_files += len(files)
+        num_bytes += sum(os.path.getsize(os.path.join(dir_sub, fn))
+                         for fn in files)
+
+    return t_best, num_files, num_bytes
+
+
+def main(n_holdings, distinct):
+
+    huum = model_io.IOModelHUUM()
+    huum.settings = generate_model.gen_settings('')
+    huum.model = generate_model.gen_model(n_holdings, distinct=distinct)
+
+    with tempfile.TemporaryDirectory() as dir_tmp:
+        print(f'Generated model: {n_holdings} holdings, '
+              f'{"distinct" if distinct else "archetype"} values\n')
+
+        results = []
+        for name, use_library in (('one file per element', False),
+                                  ('shared library', True)):
+            dir_out = os.path.join(dir_tmp, f'out{len(results)}')
+            results.append((name, *write_best_of(huum, dir_out, use_library)))
+
+        t_ref = results[0][1]
+        print(f'{"model write":<24}{"[s]":>10}{"speedup":>10}{"files":>10}'
+              f'{"[kB]":>10}')
+        for name, t_write, num_files, num_bytes in results:
+            print(f'{name:<24}{t_write:>10.3f}{t_ref / t_write:>10.2f}'
+                  f'{num_files:>10}{num_bytes / 1024:>10.0f}')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    n = 1000
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+    main(n, len(sys.argv) > 2 and sys.argv[2] == 'distinct')
@@ -0,0 +1,149 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Benchmark of the numeric list emitter (see util.number_lists).
+#
+# Writes long random curves, as produced by an optimisation, as usage pattern
+# lists with str() and with the emitter in several formats, then parses them
+# back with the YAML loader. Reports write & parse throughput, output size and
+# the largest relative rounding error.
+#
+# Usage:
+#   python bench_number_lists.py [number of values]
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import io
+import random
+import sys
+import time
+
+# internal
+from huum_io.util import number_lists
+from huum_io.util import yaml_io
+
+# 1. Global vars ===============================================================
+num_repeat = 3  # best of n runs
+len_curve = 1000  # values per list
+
+_formats = (
+    ('flow, exact', None, 'flow'),
+    ('flow, 8 digits', 8, 'flow'),
+    ('flow, 4 digits', 4, 'flow'),
+    ('wrapped, 6 digits', 6, 'wrapped'),
+    ('block, 6 digits', 6, 'block'),
+)  # name, significant digits, style
+
+
+# 2. Functions =================================================================
+def best_of(func):
+
+    t_best = None
+    result = None
+    for _ in range(num_repeat):
+        t_start = time.perf_counter()
+        result = func()
+        t_run = time.perf_counter() - t_start
+        if t_best is None or t_run < t_best:
+            t_best = t_run
+
+    return t_best, result
+
+
+def write_str(curves):
+
+    f = io.StringIO()
+    f.write('%YAML 1.2\n---\n\nCurves:')
+    for curve in curves:
+        f.write('\n  - Usage_t:      ' + str(curve))
+
+    return f.getvalue()
+
+
+def write_emitter(curves):
+
+    f = io.StringIO()
+    f.write('%YAML 1.2\n---\n\nCurves:')
+    for curve in curves:
+        f.write('\n  -')
+        number_lists.write_list(f, ' Usage_t:      ', curve, '      ')
+
+    return f.getvalue()
+
+
+def max_error(curves, text):
+
+    back = yaml_io.parse(text)['Curves']
+    error = 0.0
+    for curve, curve_back in zip(curves, back):
+        curve_back = curve_back['Usage_t']
+        if len(curve_back) != len(curve):
+            raise ValueError('list length changed')
+        for x, x_back in zip(curve, curve_back):
+            if x != 0.0:
+                error = max(error, abs(x_back - x) / abs(x))
+
+    return error
+
+
+def main(n_values):
+
+    rng = random.Random(42)
+    curves = [[rng.uniform(0.0, 3600.0) for _ in range(len_curve)]
+              for _ in range(max(1, n_values // len_curve))]
+    n_values = len(curves) * len_curve
+
+    results = [('str(list)', ) + best_of(lambda: write_str(curves))]
+    for name, digits, style in _formats:
+        number_lists.set_format(digits, style)
+        results.append((name, ) + best_of(lambda: write_emitter(curves)))
+    number_lists.set_format()
+
+    print(f'{n_values} values in lists of {len_curve}, '
+          f'YAML backend: {"c" if yaml_io.has_c_loader() else "pure"}\n')
+    print(f'{"format":<20}{"write [Mval/s]":>16}{"parse [Mval/s]":>16}'
+          f'{"[kB]":>8}{"max rel. error":>16}')
+    for name, t_write, text in results:
+        t_parse, _ = best_of(lambda: yaml_io.parse(text))
+        print(f'{name:<20}{n_values / t_write / 1e6:>16.2f}'
+              f'{n_values / t_parse / 1e6:>16.3f}{len(text) / 1024:>8.0f}'
+              f'{max_error(curves, text):>16.1e}')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    n = 50000
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+    main(n)
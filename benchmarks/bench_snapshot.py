@@ -0,0 +1,127 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Benchmark of the binary model snapshots against loading the YAML files.
+#
+# Generates a model, then compares the full model load time from the YAML
+# files (C & pure Python parser) with loading a snapshot of the same model,
+# as well as the save times and the file sizes.
+#
+# Usage:
+#   python bench_snapshot.py [number of holdings]
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import glob
+import os
+import sys
+import tempfile
+import time
+
+# internal
+from huum_io import model_io
+from huum_io.util import yaml_io
+
+import generate_model
+
+# 1. Global vars ===============================================================
+num_repeat = 3  # best of n runs
+
+
+# 2. Functions =================================================================
+def best_of(func):
+
+    t_best = None
+    for _ in range(num_repeat):
+        t_start = time.perf_counter()
+        func()
+        t_run = time.perf_counter() - t_start
+        if t_best is None or t_run < t_best:
+            t_best = t_run
+
+    return t_best
+
+
+def main(n_holdings):
+
+    with tempfile.TemporaryDirectory() as dir_tmp:
+        fn_settings = generate_model.write_model(dir_tmp, n_holdings)
+        files = glob.glob(os.path.join(dir_tmp, '**', '*.yaml'),
+                          recursive=True)
+        size_yaml = sum(os.path.getsize(fn) for fn in files)
+
+        fn_snap = os.path.join(dir_tmp, 'model.snap')
+        fn_snap_z = os.path.join(dir_tmp, 'model_z.snap')
+        m = model_io.IOModelHUUM.load(fn_settings)
+
+        print(f'Generated model: {n_holdings} holdings, {len(files)} files\n')
+
+        results = []
+        for backend in ('pure', 'c'):
+            if backend == 'c' and not yaml_io.has_c_loader():
+                continue
+            yaml_io.set_backend(backend)
+            results.append((f'YAML ({backend})',
+                            best_of(lambda: model_io.IOModelHUUM.load(
+                                fn_settings)), size_yaml))
+
+        t_save = best_of(lambda: m.save_snapshot(fn_snap))
+        t_save_z = best_of(lambda: m.save_snapshot(fn_snap_z, compress=True))
+
+        results.append(
+            ('snapshot',
+             best_of(lambda: model_io.IOModelHUUM.load_snapshot(fn_snap)),
+             os.path.getsize(fn_snap)))
+        results.append(
+            ('snapshot (compressed)',
+             best_of(lambda: model_io.IOModelHUUM.load_snapshot(fn_snap_z)),
+             os.path.getsize(fn_snap_z)))
+
+        t_ref = results[-3][1]  # fastest YAML load
+        print(f'{"full model load":<24}{"[s]":>10}{"speedup":>10}{"[kB]":>10}')
+        for name, t_load, size in results:
+            print(f'{name:<24}{t_load:>10.4f}{t_ref / t_load:>10.1f}'
+                  f'{size / 1024:>10.0f}')
+
+        print(f'\n{"snapshot save":<24}{"[s]":>10}')
+        print(f'{"plain":<24}{t_save:>10.4f}')
+        print(f'{"compressed":<24}{t_save_z:>10.4f}')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    n = 200
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+    main(n)
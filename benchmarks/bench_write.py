@@ -0,0 +1,185 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Write throughput benchmark.
+#
+# Generates an in-memory model and times writing it as a model directory, for
+# the current code and for an earlier revision of the package (by default the
+# initial commit of the repository), checking that both outputs are identical.
+# Each version runs in its own process, using a copy of the package extracted
+# via 'git archive'.
+#
+# Usage:
+#   python bench_write.py [number of holdings] [git revision to compare with]
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import filecmp
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+# internal
+
+# 1. Global vars ===============================================================
+dir_bench = os.path.dirname(os.path.abspath(__file__))
+dir_src = os.path.join(os.path.dirname(dir_bench), 'src')
+
+
+# 2. Functions =================================================================
+def run_write(n_holdings, dir_out):
+    # runs in the child process, with the package to test on the path
+
+    import generate_model
+    from huum_io import model_io
+
+    huum = model_io.IOModelHUUM()
+    huum.settings = generate_model.gen_settings(
+        os.path.join(dir_out, 'model') + '/')
+    huum.model = generate_model.gen_model(n_holdings)
+
+    t_start = time.perf_counter()
+    huum.write(os.path.join(dir_out, 'settings.yaml'))
+    t_write = time.perf_counter() - t_start
+
+    num_files = 0
+    num_bytes = 0
+    for dir_sub, _, files in os.walk(dir_out):
+        num_files += len(files)
+        num_bytes += sum(os.path.getsize(os.path.join(dir_sub, fn))
+                         for fn in files)
+
+    print(json.dumps({'time': t_write, 'files': num_files, 'bytes': num_bytes}))
+
+
+def extract_revision(rev, dir_out):
+
+    os.makedirs(dir_out)
+    fn_tar = os.path.join(dir_out, 'src.tar')
+    subprocess.run(['git', 'archive', '-o', fn_tar, rev, 'src/huum_io'],
+                   cwd=os.path.dirname(dir_src),
+                   check=True)
+    with tarfile.open(fn_tar) as tar:
+        tar.extractall(dir_out)
+
+    return os.path.join(dir_out, 'src')
+
+
+def spawn(path_src, n_holdings, dir_out):
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([path_src, dir_bench])
+    result = subprocess.run(
+        [sys.executable, __file__, '--run',
+         str(n_holdings), dir_out],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True)
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def is_identical(dir_a, dir_b):
+
+    cmp = filecmp.dircmp(dir_a, dir_b)
+    if cmp.left_only or cmp.right_only or cmp.funny_files:
+        return False
+
+    _, mismatch, errors = filecmp.cmpfiles(dir_a, dir_b, cmp.common_files,
+                                           shallow=False)
+    if mismatch or errors:
+        return False
+
+    return all(
+        is_identical(os.path.join(dir_a, sub), os.path.join(dir_b, sub))
+        for sub in cmp.common_dirs)
+
+
+def main(n_holdings, rev):
+
+    with tempfile.TemporaryDirectory() as dir_tmp:
+        path_old = extract_revision(rev, os.path.join(dir_tmp, 'old'))
+
+        results = []
+        for name, path_src in ((f'revision {rev[:12]}', path_old),
+                               ('current', dir_src)):
+            dir_out = os.path.join(dir_tmp, f'out{len(results)}')
+            os.makedirs(dir_out)
+            results.append((name, spawn(path_src, n_holdings, dir_out),
+                            dir_out))
+
+        stats = results[0][1]
+        print(f'Generated model: {n_holdings} holdings, {stats["files"]} '
+              f'files, {stats["bytes"] / 2**20:.1f} MB\n')
+
+        t_ref = stats['time']
+        print(f'{"model write":<24}{"[s]":>10}{"files/s":>10}{"MB/s":>10}'
+              f'{"speedup":>10}')
+        for name, stats, _ in results:
+            print(f'{name:<24}{stats["time"]:>10.2f}'
+                  f'{stats["files"] / stats["time"]:>10.0f}'
+                  f'{stats["bytes"] / 2**20 / stats["time"]:>10.2f}'
+                  f'{t_ref / stats["time"]:>10.2f}')
+
+        # the settings files differ in the model root
+        identical = is_identical(os.path.join(results[0][2], 'model'),
+                                 os.path.join(results[1][2], 'model'))
+        print(f'\nidentical model files: {identical}')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--run':
+        run_write(int(sys.argv[2]), sys.argv[3])
+        sys.exit(0)
+
+    n = 10000
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+
+    if len(sys.argv) > 2:
+        rev = sys.argv[2]
+    else:
+        rev = subprocess.run(['git', 'rev-list', '--max-parents=0', 'HEAD'],
+                             cwd=dir_bench,
+                             check=True,
+                             capture_output=True,
+                             text=True).stdout.split()[0]
+
+    main(n, rev)
@@ -0,0 +1,118 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Benchmark of the YAML parser backends on a generated model.
+#
+# Compares the per-file parse time of the former behaviour (a new pure Python
+# loader for every file), a reused pure Python loader & a reused C loader, as
+# well as the resulting full model load times.
+#
+# Usage:
+#   python bench_yaml_backend.py [number of holdings]
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import glob
+import os
+import sys
+import tempfile
+import time
+
+import ruamel.yaml as YAML
+
+# internal
+from huum_io import model_io
+from huum_io.util import yaml_io
+
+import generate_model
+
+# 1. Global vars ===============================================================
+
+
+# 2. Functions =================================================================
+def time_files(files, parse):
+
+    t_start = time.perf_counter()
+    for fn in files:
+        with open(fn, 'r') as f:
+            parse(f)
+
+    return (time.perf_counter() - t_start) / len(files)
+
+
+def time_load(fn_settings, backend):
+
+    yaml_io.set_backend(backend)
+    t_start = time.perf_counter()
+    model_io.IOModelHUUM.load(fn_settings)
+
+    return time.perf_counter() - t_start
+
+
+def main(n_holdings):
+
+    with tempfile.TemporaryDirectory() as dir_tmp:
+        fn_settings = generate_model.write_model(dir_tmp, n_holdings)
+        files = glob.glob(os.path.join(dir_tmp, '**', '*.yaml'),
+                          recursive=True)
+
+        print(f'Generated model: {n_holdings} holdings, {len(files)} files')
+        print(f'C loader available: {yaml_io.has_c_loader()}\n')
+
+        t_old = time_files(
+            files, lambda f: YAML.YAML(typ='safe', pure=True).load(f))
+        t_pure = time_files(files, lambda f: yaml_io.parse(f, 'pure'))
+        results = [('new pure loader per file', t_old),
+                   ('reused pure loader', t_pure)]
+        if yaml_io.has_c_loader():
+            t_c = time_files(files, lambda f: yaml_io.parse(f, 'c'))
+            results.append(('reused C loader', t_c))
+
+        print(f'{"per file parse":<28}{"[ms]":>10}{"speedup":>10}')
+        for name, t_file in results:
+            print(f'{name:<28}{t_file * 1e3:>10.3f}{t_old / t_file:>10.2f}')
+
+        print(f'\n{"full model load":<28}{"[s]":>10}')
+        for backend in ('pure', 'c'):
+            if backend == 'c' and not yaml_io.has_c_loader():
+                continue
+            print(f'{backend:<28}{time_load(fn_settings, backend):>10.3f}')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    n = 200
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+    main(n)
@@ -0,0 +1,235 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Generates synthetic HUUM models of a given size for the benchmarks.
+#
+# Usage:
+#   python generate_model.py <output dir> [number of holdings]
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import os
+import random
+import sys
+
+# internal
+from huum_io import agent
+from huum_io import appliance
+from huum_io import consumer_unit
+from huum_io import holding
+from huum_io import model
+from huum_io import model_io
+from huum_io import room
+from huum_io import settings
+from huum_io.elements import lifecycle
+from huum_io.elements import usage_habit
+from huum_io.elements import usage_pattern
+from huum_io.elements import usage_template
+
+# 1. Global vars ===============================================================
+_appliance_classes = ['shower', 'washing_machine', 'toilet', 'tap']
+
+
+# 2. Functions =================================================================
+def gen_agent(name: str, rng: random.Random):
+
+    daemon = agent.IOAgent()
+    daemon.id = name
+
+    for lc_name, lc_next, mu in (('sleep', 'awake', 28800.0),
+                                 ('awake', 'sleep', 57600.0)):
+        entry = lifecycle.IOLifeCycle()
+        entry.load({
+            'Name': lc_name,
+            'Habit_Status': lc_name,
+            'Next': {
+                'Default': lc_next
+            },
+            'Changeover_Time': {
+                'Type': 'Gauss',
+                'Mu': mu + rng.randint(-3600, 3600),
+                'Sigma': 1800.0
+            }
+        })
+        daemon.lifecycle.append(entry)
+
+    habit = usage_habit.IOUsageHabit()
+    habit.load({
+        'Name': 'wash',
+        'Appliance': 'shower',
+        'Valid_When': 'awake',
+        'Valid_t_Start': '06:00',
+        'Valid_t_End': '09:00',
+        'Computation_Type': 'add',
+        'Data': {
+            'Type': 'Constant',
+            'Value': round(rng.uniform(0.2, 0.8), 3)
+        }
+    })
+    daemon.usage_habits.append(habit)
+
+    template = usage_template.IOUsageTemplate()
+    template.load({
+        'Name': 'morning',
+        'Appliance': 'shower',
+        'Valid_When': 'awake',
+        'Type': 'lifecycle',
+        'Duration': 3600,
+        'Computation_Type': 'add',
+        'Probability_t': [0, 600, 1200, 1800, 2400, 3000],
+        'Probability_Value': [0, 0.1, 0.3, 0.6, 0.2, 0]
+    })
+    daemon.habit_templates.append(template)
+
+    return daemon
+
+
+def gen_appliance(name: str, appliance_class: str, rng: random.Random):
+
+    item = appliance.IOAppliance()
+    item.name = name
+    item.appliance_class = appliance_class
+    item.block_length = 600
+
+    pattern = usage_pattern.IOUsagePattern()
+    n_points = 12
+    pattern.load({
+        'Name': 'default',
+        'Type': 'water',
+        'Usage_Length': 60 * n_points + 30,
+        'Usage_t': [60 * (i + 1) for i in range(n_points)],
+        'Usage_val': [0.0] + [
+            round(rng.uniform(0.05, 0.2), 3) for _ in range(n_points - 2)
+        ] + [0.0]
+    })
+    item.usage_patterns.append(pattern)
+
+    return item
+
+
+def gen_model(n_holdings: int,
+              n_cu: int = 2,
+              n_agents: int = 2,
+              n_appliances: int = 4,
+              distinct: bool = False,
+              seed: int = 42):
+    """
+    Generates an in-memory model.
+
+    Inputs:
+    n_holdings
+        number of holdings
+    n_cu
+        number of consumer units per holding
+    n_agents
+        number of agents per consumer unit
+    n_appliances
+        number of appliances per consumer unit (all in one room)
+    distinct
+        whether each consumer unit gets its own parameter values, or all
+        agents & appliances are identical copies of a few archetypes
+    seed
+        random seed
+    """
+
+    rng = random.Random(seed)
+
+    io_model = model.IOModel()
+    for i_hold in range(n_holdings):
+        unit = holding.IOHolding()
+        unit.id = f'H{i_hold}'
+
+        for i_cu in range(n_cu):
+            cu = consumer_unit.IOConsumerUnit()
+            cu.id = f'CU{i_cu}'
+
+            # identical archetypes, unless asked otherwise
+            rng_cu = rng if distinct else random.Random(seed)
+
+            for i_agent in range(n_agents):
+                cu.agents.append(gen_agent(f'agent{i_agent}', rng_cu))
+
+            chamber = room.IORoom()
+            chamber.name = 'bathroom'
+            for i_app in range(n_appliances):
+                app_class = _appliance_classes[i_app %
+                                               len(_appliance_classes)]
+                chamber.appliances.append(
+                    gen_appliance(f'{app_class}{i_app}', app_class, rng_cu))
+            cu.rooms.append(chamber)
+
+            unit.cu.append(cu)
+
+        io_model.holdings.append(unit)
+
+    return io_model
+
+
+def gen_settings(dir_model: str):
+
+    model_settings = settings.IOSettings()
+    model_settings.title = 'Generated benchmark model'
+    model_settings.fn_model = 'model.yaml'
+    model_settings.dir_modelRoot = dir_model
+    model_settings.dir_output = 'output/'
+    model_settings.time_start = '01/01/2020 00:00:00'
+    model_settings.time_end = '08/01/2020 00:00:00'
+    model_settings.t_step_min = 1
+    model_settings.t_step_max = 3600
+
+    return model_settings
+
+
+def write_model(dir_out: str, n_holdings: int, **kwargs):
+    """
+    Generates a model and writes it to the given directory.
+    Returns the path of the settings file.
+    """
+
+    huum = model_io.IOModelHUUM()
+    huum.settings = gen_settings(os.path.join(dir_out, 'model') + '/')
+    huum.model = gen_model(n_holdings, **kwargs)
+
+    fn_settings = os.path.join(dir_out, 'settings.yaml')
+    huum.write(fn_settings)
+
+    return fn_settings
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    n = 100
+    if len(sys.argv) > 2:
+        n = int(sys.argv[2])
+    print(write_model(sys.argv[1], n))
@@ -36,14 +36,17 @@
 # 0. Imports ===================================================================
 
 # general
+import io
 import os
-import ruamel.yaml as YAML
 
 # internal
 from .elements import lifecycle as lifecycle
 from .elements import usage_habit as usage_habit
 from .elements import usage_template as usage_template
 from .elements import common_parts as common_parts
+from .util import sources as sources
+from .util import utilities as util
+from .util import yaml_io as yaml_io
 
 # 1. Global vars ===============================================================
 
@@ -52,6 +55,8 @@ from .elements import common_parts as common_parts
 class IOAgent(common_parts.CommonParts
               ):  # class to hold both settings and the model data itself
 
+    moea_label = 'agent'  # label in parameter paths
+
     def __init__(self):
 
         super().__init__()
@@ -60,6 +65,9 @@ class IOAgent(common_parts.CommonParts
         self.lifecycle = []  # list of lifecycle objects
         self.usage_habits = []  # list of set usage habits
         self.habit_templates = []  # list of situational usage habits
+        self.shared_key = None  # content hash, if shared (see util.flyweight)
+        self.origin_key = None  # content hash of the shared object, if detached
+        self.source = None  # (file name, mtime) of the source file (see util.sources)
 
     def load(self, fn, dir_root, zfile=None):
         """
@@ -74,6 +82,8 @@ class IOAgent(common_parts.CommonParts
             zipfile object, if loading from zip
         """
 
+        self.source = sources.source_of(fn, dir_root, zfile)
+
         # sanity check
         if zfile is None:
             exists = os.path.isfile(dir_root + fn)
@@ -84,13 +94,77 @@ class IOAgent(common_parts.CommonParts
                 exit(255)
 
             # get data
-            f = open(dir_root + fn, 'r')
-            agent_data = YAML.YAML(typ='safe', pure=True).load(f)
-            f.close()
+            agent_data = yaml_io.load_file(dir_root + fn)
+
+        else:
+            agent_data = yaml_io.load_zip_member(zfile,
+                                                 f'{dir_root}{fn}')
+
+        self.load_data(agent_data)
+
+    def refresh(self, dir_root, changed, registry=None):
+        """
+        Reloads the agent if its file changed since loading. Shared
+        agents are never changed here, see the parent's refresh().
+
+        Inputs:
+        dir_root
+            model data structure root directory
+        changed
+            list collecting the (file name, element) pairs of reloaded files
+        registry
+            flyweight registry of the model (unused, private agents stay
+            private)
+        """
+
+        if not sources.is_changed(self, dir_root):
+            return self
+
+        fn = self.source[0]
+        self.__init__()
+        self.load(fn, dir_root)
+        changed.append((fn, self))
+
+        return self
+
+    @classmethod
+    def load_shared(cls, fn, dir_root, zfile, registry):
+        """
+        Loads an agent file via a flyweight registry, i.e. identical agent
+        files result in one shared (read-only) object.
+
+        Inputs:
+        fn
+            filename to load
+        dir_root
+            model data structure root directory
+        zfile
+            zipfile object, if loading from zip
+        registry
+            util.flyweight.FlyweightRegistry object
+        """
+
+        if zfile is None:
+            if not os.path.isfile(dir_root + fn):
+                print('')
+                print('\nHUUM agent file ' + dir_root + fn + ' does not exist')
+                print('Working dir: ' + str(os.getcwd()))
+                exit(255)
 
+            source = yaml_io.read_file(dir_root + fn)
         else:
-            with zfile.open(f'{dir_root}{fn}') as f_obj:
-                agent_data = YAML.YAML(typ='safe', pure=True).load(f_obj)
+            source = yaml_io.read_zip_member(zfile, f'{dir_root}{fn}')
+
+        return registry.get_or_create('agent', source, _from_data)
+
+    def load_data(self, agent_data):
+        """
+        loads the agent from the already parsed file content.
+
+        Inputs:
+        agent_data
+            dictionary with the file content
+        """
 
         self.id = agent_data['Name']
 
@@ -129,21 +203,41 @@ class IOAgent(common_parts.CommonParts
         # load common stuff
         self.load_common(agent_data)
 
+        self.mark_clean()
+
         return
 
     def check(self):
         print("holding.check: Not yet implemented")
         exit(255)
 
-    def write(self, dir_root, dir_file):
+    def write(self, dir_root, dir_file, only_modified=False):
+        util.write_documents(dir_root,
+                             self.iter_documents(dir_file, only_modified))
+        self.mark_clean(recursive=True)
+
+    def iter_documents(self, dir_file, only_modified=False):
+        """
+        Yields (file path relative to the model root, function returning the
+        file content) for the agent file.
+
+        Inputs:
+        dir_file
+            directory of the agent file, relative to the model root
+        only_modified
+            whether only the files of modified elements are included (see
+            BaseMOEA.is_modified, default: False)
+        """
+
+        if not only_modified or self.is_modified():
+            yield (dir_file + self.id + '.yaml', self.render)
 
-        # assure that the output directory exists
-        dir_local = os.path.join(dir_root, dir_file)
-        if not os.path.exists(dir_local):
-            os.makedirs(dir_local)
+    def render(self):
+        """
+        Returns the content of the agent file.
+        """
 
-        # write file
-        f = open(os.path.join(dir_local, self.id + '.yaml'), 'w')
+        f = io.StringIO()
 
         # write header
         f.write("%YAML 1.2\n---\n")
@@ -168,7 +262,25 @@ class IOAgent(common_parts.CommonParts
 
         f.write('\n')
 
-        f.close()
+        return f.getvalue()
+
+    def moea_parts(self):
+        """
+        Yields the elements contributing to the optimisation vector in vector
+        order, as (element, timeseries_adjustment to pass on) pairs, None for
+        elements not taking the flag (see parameter_layout).
+        """
+
+        for lf in self.lifecycle:
+            yield lf, None
+
+        for uh in self.usage_habits:
+            yield uh, None
+
+        for ht in self.habit_templates:
+            yield ht, None
+
+        yield from self.common_moea_parts()
 
     def moea_gen_vectors(self, vec_debug):
 
@@ -243,6 +355,13 @@ class IOAgent(common_parts.CommonParts
 
 
 # 2. Functions =================================================================
+def _from_data(agent_data):
+
+    daemon = IOAgent()
+    daemon.load_data(agent_data)
+
+    return daemon
+
 
 # 3. Main Exec =================================================================
 if __name__ == '__main__':
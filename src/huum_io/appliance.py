@@ -36,11 +36,13 @@
 # 0. Imports ===================================================================
 
 # general
+import io
 import os
-import ruamel.yaml as YAML
 
 # internal
 from .util import utilities as util
+from .util import sources as sources
+from .util import yaml_io as yaml_io
 from .elements import usage_pattern as usage_pattern
 from .elements import common_parts as common_parts
 
@@ -51,6 +53,8 @@ from .elements import common_parts as common_parts
 class IOAppliance(common_parts.CommonParts
                   ):  # class  to hold both settings and the model data itself
 
+    moea_label = 'appliance'  # label in parameter paths
+
     def __init__(self):
 
         super().__init__()
@@ -60,6 +64,9 @@ class IOAppliance(common_parts.CommonParts
         self.block_length = None  # for how long using the appliance blocks the user
         self.block_user = False  # How long the user is being blocked
         self.usage_patterns = []  # list of usage patterns
+        self.shared_key = None  # content hash, if shared (see util.flyweight)
+        self.origin_key = None  # content hash of the shared object, if detached
+        self.source = None  # (file name, mtime) of the source file (see util.sources)
 
     def load(self, fn, dir_root, zfile=None):
         """
@@ -74,6 +81,8 @@ class IOAppliance(common_parts.CommonParts
             zipfile object, if loading from zip
         """
 
+        self.source = sources.source_of(fn, dir_root, zfile)
+
         # sanity check
         if zfile is None:
             exists = os.path.basename(
@@ -86,12 +95,77 @@ class IOAppliance(common_parts.CommonParts
                 exit(255)
 
             # get data
-            f = open(os.path.join(dir_root, fn), 'r')
-            appliance_data = YAML.YAML(typ='safe', pure=True).load(f)
-            f.close()
+            appliance_data = yaml_io.load_file(os.path.join(dir_root, fn))
         else:
-            with zfile.open(f'{dir_root}{fn}') as f_obj:
-                appliance_data = YAML.YAML(typ='safe', pure=True).load(f_obj)
+            appliance_data = yaml_io.load_zip_member(zfile,
+                                                     f'{dir_root}{fn}')
+
+        self.load_data(appliance_data)
+
+    def refresh(self, dir_root, changed, registry=None):
+        """
+        Reloads the appliance if its file changed since loading. Shared
+        appliances are never changed here, see the parent's refresh().
+
+        Inputs:
+        dir_root
+            model data structure root directory
+        changed
+            list collecting the (file name, element) pairs of reloaded files
+        registry
+            flyweight registry of the model (unused, private appliances stay
+            private)
+        """
+
+        if not sources.is_changed(self, dir_root):
+            return self
+
+        fn = self.source[0]
+        self.__init__()
+        self.load(fn, dir_root)
+        changed.append((fn, self))
+
+        return self
+
+    @classmethod
+    def load_shared(cls, fn, dir_root, zfile, registry):
+        """
+        Loads an appliance file via a flyweight registry, i.e. identical
+        appliance files result in one shared (read-only) object.
+
+        Inputs:
+        fn
+            filename to load
+        dir_root
+            model data structure root directory
+        zfile
+            zipfile object, if loading from zip
+        registry
+            util.flyweight.FlyweightRegistry object
+        """
+
+        if zfile is None:
+            fn_full = os.path.join(dir_root, fn)
+            if not os.path.isfile(fn_full):
+                print('')
+                print('\nHUUM appliance file ' + fn_full + ' does not exist')
+                print('Working dir: ' + str(os.getcwd()))
+                exit(255)
+
+            source = yaml_io.read_file(fn_full)
+        else:
+            source = yaml_io.read_zip_member(zfile, f'{dir_root}{fn}')
+
+        return registry.get_or_create('appliance', source, _from_data)
+
+    def load_data(self, appliance_data):
+        """
+        loads the appliance from the already parsed file content.
+
+        Inputs:
+        appliance_data
+            dictionary with the file content
+        """
 
         self.name = util.safe_get_dict_item(appliance_data, 'Name',
                                             'Appliance.load')
@@ -115,19 +189,39 @@ class IOAppliance(common_parts.CommonParts
         # load common stuff
         self.load_common(appliance_data)
 
+        self.mark_clean()
+
     def check(self):
         print("Room.check: Not yet implemented")
         exit(255)
 
-    def write(self, dir_root, dir_file):
+    def write(self, dir_root, dir_file, only_modified=False):
+        util.write_documents(dir_root,
+                             self.iter_documents(dir_file, only_modified))
+        self.mark_clean(recursive=True)
+
+    def iter_documents(self, dir_file, only_modified=False):
+        """
+        Yields (file path relative to the model root, function returning the
+        file content) for the appliance file.
+
+        Inputs:
+        dir_file
+            directory of the appliance file, relative to the model root
+        only_modified
+            whether only the files of modified elements are included (see
+            BaseMOEA.is_modified, default: False)
+        """
+
+        if not only_modified or self.is_modified():
+            yield (dir_file + self.name + '.yaml', self.render)
 
-        # assure that the output directory exists
-        dir_local = f'{dir_root}/{dir_file}'
-        if not os.path.exists(dir_local):
-            os.makedirs(dir_local)
+    def render(self):
+        """
+        Returns the content of the appliance file.
+        """
 
-        # write file
-        f = open(f'{dir_local}{self.name}.yaml', 'w')
+        f = io.StringIO()
 
         # write header
         f.write("%YAML 1.2\n---\n")
@@ -149,7 +243,21 @@ class IOAppliance(common_parts.CommonParts
         self.write_common(f)
 
         f.write('\n')
-        f.close()
+
+        return f.getvalue()
+
+    def moea_parts(self, timeseries_adjustment: bool = True):
+        """
+        Yields the elements contributing to the optimisation vector in vector
+        order, as (element, timeseries_adjustment to pass on) pairs, None for
+        elements not taking the flag (see parameter_layout).
+        """
+
+        if (timeseries_adjustment):
+            for pattern in self.usage_patterns:
+                yield pattern, None
+
+        yield from self.common_moea_parts()
 
     def moea_gen_vectors(self, vec_debug, timeseries_adjustment: bool = True):
 
@@ -205,6 +313,13 @@ class IOAppliance(common_parts.CommonParts
 
 
 # 2. Functions =================================================================
+def _from_data(appliance_data):
+
+    item = IOAppliance()
+    item.load_data(appliance_data)
+
+    return item
+
 
 # 3. Main Exec =================================================================
 if __name__ == '__main__':
@@ -36,12 +36,17 @@
 # 0. Imports ===================================================================
 
 # general
+import functools
+import io
 import os
-import ruamel.yaml as YAML
 
 # internal
 from .elements import common_parts as common_parts
+from .util import flyweight as flyweight
+from .util import lazy as lazy
+from .util import sources as sources
 from .util import utilities as util
+from .util import yaml_io as yaml_io
 from . import agent
 from . import room
 
@@ -59,8 +64,9 @@ class IOConsumerUnit(
         self.id = None
         self.agents = []
         self.rooms = []
+        self.source = None  # (file name, mtime) of the source file (see util.sources)
 
-    def load(self, fn, dir_root, zfile=None):
+    def load(self, fn, dir_root, zfile=None, registry=None):
         """
         loads the holdings file and (optionally) it's consumer_unit constituents.
 
@@ -71,8 +77,12 @@ class IOConsumerUnit(
             model data structure root directory
         zfile
             zipfile object, if loading from zip
+        registry
+            flyweight registry for sharing identical agents & appliances (default: None)
         """
 
+        self.source = sources.source_of(fn, dir_root, zfile)
+
         # sanity check
         if zfile is None:
             exists = os.path.isfile(dir_root + fn)
@@ -84,12 +94,10 @@ class IOConsumerUnit(
                 exit(255)
 
             # get data
-            f = open(dir_root + fn, 'r')
-            consumer_unit_data = YAML.YAML(typ='safe', pure=True).load(f)
-            f.close()
+            consumer_unit_data = yaml_io.load_file(dir_root + fn)
         else:
-            with zfile.open(f'{dir_root}{fn}') as f_obj:
-                consumer_unit_data = YAML.YAML(typ='safe', pure=True).load(f_obj)
+            consumer_unit_data = yaml_io.load_zip_member(zfile,
+                                                         f'{dir_root}{fn}')
 
         # Get general data
         self.id = util.safe_get_dict_item(consumer_unit_data, 'Name',
@@ -100,31 +108,199 @@ class IOConsumerUnit(
             room_list = consumer_unit_data['Rooms']
             for fn_room in room_list:
                 chamber = room.IORoom()
-                chamber.load(fn_room, dir_root, zfile)
+                chamber.load(fn_room, dir_root, zfile, registry)
                 self.rooms.append(chamber)
 
         # deal with agents
         for fn_agent in consumer_unit_data['Agents']:
-            daemon = agent.IOAgent()
-            daemon.load(fn_agent, dir_root, zfile)
+            if registry is None:
+                daemon = agent.IOAgent()
+                daemon.load(fn_agent, dir_root, zfile)
+            else:
+                daemon = agent.IOAgent.load_shared(fn_agent, dir_root, zfile,
+                                                   registry)
             self.agents.append(daemon)
 
         # load common stuff
         self.load_common(consumer_unit_data)
 
+        self.mark_clean()
+
+    @classmethod
+    def lazy(cls, fn, dir_root, zfile=None, registry=None):
+        """
+        Returns a proxy for the consumer unit, which loads the file and its
+        constituents on first attribute access (see util.lazy).
+
+        Inputs: as for load()
+        """
+
+        def loader():
+            cu = IOConsumerUnit()
+            cu.load(fn, dir_root, zfile, registry)
+            return cu
+
+        return lazy.LazyProxy(loader, IOConsumerUnit, fn)
+
+    def refresh(self, dir_root, changed, registry=None):
+        """
+        Reloads the consumer unit if its file changed since loading (reusing
+        the unchanged rooms & agents), otherwise refreshes its rooms & agents.
+
+        Inputs:
+        dir_root
+            model data structure root directory
+        changed
+            list collecting the (file name, element) pairs of reloaded files
+        registry
+            flyweight registry of the model, if loaded with dedup: changed
+            agent & appliance files are loaded as shared objects (default:
+            None)
+        """
+
+        if self.source is None:
+            return self
+
+        def load_room(fn_room):
+            chamber = room.IORoom()
+            chamber.load(fn_room, dir_root, registry=registry)
+            return chamber
+
+        def load_agent(fn_agent):
+            if registry is not None:
+                return agent.IOAgent.load_shared(fn_agent, dir_root, None,
+                                                 registry)
+            daemon = agent.IOAgent()
+            daemon.load(fn_agent, dir_root)
+            return daemon
+
+        if sources.is_changed(self, dir_root):
+            fn = self.source[0]
+            changed.append((fn, self))
+
+            self.source = sources.source_of(fn, dir_root)
+            consumer_unit_data = yaml_io.load_file(dir_root + fn)
+
+            common_parts.CommonParts.__init__(self)
+            self.id = util.safe_get_dict_item(consumer_unit_data, 'Name',
+                                              'consumer_unit.refresh')
+            self.rooms = sources.splice_list(
+                self.rooms, consumer_unit_data.get('Rooms', []), dir_root,
+                changed, load_room, registry)
+            self.agents = sources.splice_list(self.agents,
+                                              consumer_unit_data['Agents'],
+                                              dir_root, changed, load_agent,
+                                              registry)
+            self.load_common(consumer_unit_data)
+            self.mark_clean()
+
+        else:
+            self.rooms = sources.refresh_list(self.rooms, dir_root, changed,
+                                              registry)
+
+            # shared agents can only be matched via the file list
+            if sources.has_shared(self.agents):
+                consumer_unit_data = yaml_io.load_file(dir_root +
+                                                       self.source[0])
+                self.agents = sources.splice_list(
+                    self.agents, consumer_unit_data['Agents'], dir_root,
+                    changed, load_agent, registry)
+            else:
+                self.agents = sources.refresh_list(self.agents, dir_root,
+                                                   changed, registry)
+
+        return self
+
     def check(self):
         print("consumer_unit.check: Not yet implemented")
         exit(255)
 
-    def write(self, dir_root, dir_file):
+    def detach_agent(self, index):
+        """
+        Replaces a shared agent by a private copy (copy-on-write) and returns
+        it. Needs to be called before modifying an agent loaded with
+        deduplication.
 
-        # assure that the output directory exists
-        dir_local = os.path.join(dir_root, dir_file)
-        if not os.path.exists(dir_local):
-            os.makedirs(dir_local)
+        Inputs:
+        index
+            position of the agent in .agents
+        """
+
+        self.agents[index] = flyweight.detach(self.agents[index])
+
+        return self.agents[index]
 
-        # write file
-        f = open(os.path.join(dir_local, 'cu.yaml'), 'w')
+    def write(self, dir_root, dir_file, only_modified=False, library=None):
+        documents = self.iter_documents(dir_file, only_modified, library)
+        if library is not None:
+            documents = library.filter(documents)
+
+        util.write_documents(dir_root, documents)
+        self.mark_clean(recursive=True)
+
+    def iter_documents(self, dir_file, only_modified=False, library=None):
+        """
+        Yields (file path relative to the model root, function returning the
+        file content) for the consumer unit file and the files of all its constituents.
+
+        Inputs:
+        dir_file
+            directory of the consumer unit, relative to the model root
+        only_modified
+            whether only the files of modified elements are included (see
+            BaseMOEA.is_modified, default: False)
+        library
+            util.library.SharedLibrary storing identical agent & appliance
+            files once (default: None, each element gets its own file)
+        """
+
+        if library is None:
+            if not only_modified or self.is_modified():
+                yield (dir_file + 'cu.yaml',
+                       functools.partial(self.render, dir_file))
+
+            for chamber in self.rooms:
+                yield from chamber.iter_documents(dir_file + 'rooms/',
+                                                  only_modified)
+
+            for daemon in self.agents:
+                yield from daemon.iter_documents(dir_file + 'agents/',
+                                                 only_modified)
+            return
+
+        for chamber in self.rooms:
+            yield from chamber.iter_documents(dir_file + 'rooms/',
+                                              only_modified, library)
+
+        # the consumer unit file references the content of its agents
+        write_cu = not only_modified or self.is_modified() or any(
+            daemon.is_modified() for daemon in self.agents)
+
+        fn_agents = []
+        for daemon in self.agents:
+            if write_cu or daemon.is_modified():
+                path, render = library.document('agents', daemon.id,
+                                                daemon.render())
+                fn_agents.append(path)
+                yield (path, render)
+
+        if write_cu:
+            yield (dir_file + 'cu.yaml',
+                   functools.partial(self.render, dir_file, fn_agents))
+
+    def render(self, dir_file, fn_agents=None):
+        """
+        Returns the content of the consumer unit file.
+
+        Inputs:
+        dir_file
+            directory of the consumer unit, relative to the model root
+        fn_agents
+            agent file paths to reference, relative to the model root
+            (default: None, the files in the agents/ subdirectory)
+        """
+
+        f = io.StringIO()
 
         # write header
         f.write("%YAML 1.2\n---\n")
@@ -137,17 +313,33 @@ class IOConsumerUnit(
             f.write('\n\nRooms:\n')
             for chamber in self.rooms:
                 f.write('- ' + dir_file + 'rooms/' + chamber.name + '.yaml\n')
-                chamber.write(dir_root, dir_file + 'rooms/')
 
         f.write('\n\nAgents:\n')
-        for daemon in self.agents:
-            f.write('- ' + dir_file + 'agents/' + daemon.id + '.yaml\n')
-            daemon.write(dir_root, dir_file + 'agents/')
+        if fn_agents is None:
+            fn_agents = [dir_file + 'agents/' + daemon.id + '.yaml'
+                         for daemon in self.agents]
+        for fn_agent in fn_agents:
+            f.write('- ' + fn_agent + '\n')
 
         # Common Data
         self.write_common(f)
 
-        f.close()
+        return f.getvalue()
+
+    def moea_parts(self, timeseries_adjustment: bool = True):
+        """
+        Yields the elements contributing to the optimisation vector in vector
+        order, as (element, timeseries_adjustment to pass on) pairs, None for
+        elements not taking the flag (see parameter_layout).
+        """
+
+        for daemon in self.agents:
+            yield daemon, None
+
+        for chamber in self.rooms:
+            yield chamber, timeseries_adjustment
+
+        yield from self.common_moea_parts()
 
     def moea_gen_vectors(self,
                          vec_debug: bool,
@@ -197,8 +389,10 @@ class IOConsumerUnit(
 
         # insert data - nothing to do for self
 
-        # insert data - holdings
-        for daemon in self.agents:
+        # insert data - agents, shared ones get copied first
+        for i, daemon in enumerate(self.agents):
+            if flyweight.is_shared(daemon):
+                daemon = self.detach_agent(i)
             num += daemon.moea_insert_vector(vec[num:num +
                                                  daemon.get_data_extend()])
 
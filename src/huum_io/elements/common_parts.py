@@ -49,7 +49,9 @@ from ..util import base_optimisation as base_optimisation
 
 # 1.1 Classes ------------------------------------------------------------------
 class CommonParts(base_optimisation.BaseMOEA):
-    
+
+    own_file = True     # all extending classes are stored in files of their own
+
     def __init__(self):
 
         base_optimisation.BaseMOEA.__init__(self)
@@ -123,6 +125,23 @@ class CommonParts(base_optimisation.BaseMOEA):
         f.write('')
 
 
+    def common_moea_parts(self):
+        """
+        Yields the common elements contributing to the optimisation vector,
+        in the order of gen_common_vectors (see moea_parts).
+        """
+
+        # gen_common_vectors is called without timeseries_adjustment
+        for e in self.events:
+            yield e, True
+
+        for depot in self.storages:
+            yield depot, None
+
+        for timed_depot in self.timed_storages:
+            yield timed_depot, None
+
+
     def gen_common_vectors(self,
                            vec_debug: bool,
                            timeseries_adjustment: bool = True):
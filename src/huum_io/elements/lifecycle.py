@@ -50,6 +50,9 @@ from ..util import utilities as util
 
 # 1.1 Classes ------------------------------------------------------------------
 class IOLifeCycle(base_optimisation.BaseMOEA):
+
+    moea_label = 'lifecycle'  # label in parameter paths
+
     def __init__(self):
 
         super().__init__()
@@ -135,6 +138,36 @@ class IOLifeCycle(base_optimisation.BaseMOEA):
                 occurance.write(f, '    ')
 
 
+    def moea_names(self):
+
+        names = []
+        if not (self.min_duration is None):
+            names.append('min_duration')
+
+        names += base_optimisation.prefix_names('changeover.',
+                                                self.probability.moea_names())
+
+        for e in self.events:
+            names += base_optimisation.prefix_names(e.moea_segment() + '/',
+                                                    e.moea_names())
+
+        return names
+
+
+    def moea_slots(self):
+
+        slots = []
+        if not (self.min_duration is None):
+            slots.append((self, ('min_duration', ), 1))
+
+        slots += self.probability.moea_slots()
+
+        for e in self.events:
+            slots += e.moea_slots()
+
+        return slots
+
+
     def moea_gen_vectors(self, vec_debug):
 
         vec_var      = []
@@ -181,8 +214,7 @@ class IOLifeCycle(base_optimisation.BaseMOEA):
 
         # insert data for self
         if not (self.min_duration is None):
-            self.min_duration = vec[num]
-            num += 1
+            num += self.moea_assign(('min_duration', ), vec, num)
 
         # insert data - probability
         num += self.probability.moea_insert_vector(
@@ -124,6 +124,34 @@ class IOProbability(base_optimisation.BaseMOEA):
             exit(255)
 
 
+    def moea_names(self):
+
+        if (self.type == 'Constant'):
+            return ['constant']
+
+        elif (self.type == 'Uniform'):
+            return ['range_from', 'range_to']
+
+        elif (self.type == 'Gauss'):
+            return ['mu', 'sigma']
+
+        return []
+
+
+    def moea_slots(self):
+
+        if (self.type == 'Constant'):
+            return [(self, ('constant', ), 1)]
+
+        elif (self.type == 'Uniform'):
+            return [(self, ('range_from', 'range_to'), 2)]
+
+        elif (self.type == 'Gauss'):
+            return [(self, ('mu', 'sigma'), 2)]
+
+        return []
+
+
     def moea_gen_vectors(self, vec_debug):
 
         vec_var      = []
@@ -168,18 +196,13 @@ class IOProbability(base_optimisation.BaseMOEA):
 
         # dealing with itself
         if (self.type == 'Constant'):
-            self.constant = vec[0]
-            num           = 1
+            num = self.moea_assign(('constant', ), vec)
 
         elif (self.type == 'Uniform'):
-            self.range_from = vec[0]
-            self.range_to   = vec[1]
-            num             = 2
+            num = self.moea_assign(('range_from', 'range_to'), vec)
 
         elif (self.type == 'Gauss'):
-            self.mu    = vec[0]
-            self.sigma = vec[1]
-            num        = 2
+            num = self.moea_assign(('mu', 'sigma'), vec)
 
         elif (self.type == 'Function'):
             num = 0
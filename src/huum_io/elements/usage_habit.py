@@ -49,6 +49,8 @@ from ..util import utilities as util
 # 1.1 Classes ------------------------------------------------------------------
 class IOUsageHabit(base_optimisation.BaseMOEA):
 
+    moea_label = 'habit'  # label in parameter paths
+
     def __init__(self):
 
         base_optimisation.BaseMOEA.__init__(self)
@@ -129,6 +131,22 @@ class IOUsageHabit(base_optimisation.BaseMOEA):
             exit(255)
 
 
+    def moea_names(self):
+
+        if (self.data_type == 'Constant'):
+            return ['data_value']
+
+        return []
+
+
+    def moea_slots(self):
+
+        if (self.data_type == 'Constant'):
+            return [(self, ('data_value', ), 1)]
+
+        return []
+
+
     def moea_gen_vectors(self, vec_debug):
 
         vec_var      = []
@@ -166,8 +184,7 @@ class IOUsageHabit(base_optimisation.BaseMOEA):
 
         # working on itself
         if (self.data_type == 'Constant'):
-            self.data_value = vec[num]
-            num += 1
+            num += self.moea_assign(('data_value', ), vec, num)
         
         elif (self.data_type == 'Function'):
             pass
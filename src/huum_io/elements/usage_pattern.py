@@ -37,9 +37,11 @@
 # 0. Imports ===================================================================
 
 # general
+import itertools
 
 # internal
 from ..util import base_optimisation as base_optimisation
+from ..util import number_lists as number_lists
 from ..util import utilities as util
 
 # 1. Global vars ===============================================================
@@ -48,6 +50,8 @@ from ..util import utilities as util
 # 1.1 Classes ------------------------------------------------------------------
 class IOUsagePattern(base_optimisation.BaseMOEA):
 
+    moea_label = 'pattern'  # label in parameter paths
+
     def __init__(self):
 
         base_optimisation.BaseMOEA.__init__(self)
@@ -105,8 +109,23 @@ class IOUsagePattern(base_optimisation.BaseMOEA):
         f.write('\n' + prefix + '    Name:         ' + self.name)
         f.write('\n' + prefix + '    Type:         ' + self.demand_type)
         f.write('\n' + prefix + '    Usage_Length: ' + str(self.usage_length))
-        f.write('\n' + prefix + '    Usage_t:      ' + str(self.usage_t))
-        f.write('\n' + prefix + '    Usage_val:    ' + str(self.usage_value))
+        number_lists.write_list(f, '\n' + prefix + '    Usage_t:      ',
+                                self.usage_t, prefix + '      ')
+        number_lists.write_list(f, '\n' + prefix + '    Usage_val:    ',
+                                self.usage_value, prefix + '      ')
+
+
+    def moea_names(self):
+
+        # usage_t as t0 & deltas, the inner usage values, then the duration
+        names  = [f'usage_t[{i}]' for i in range(len(self.usage_t))]
+        names += [
+            f'usage_value[{i}]' for i in range(1,
+                                               len(self.usage_value) - 1)
+        ]
+        names += ['usage_length']
+
+        return names
 
 
     def moea_gen_vectors(self, vec_debug):
@@ -147,39 +166,67 @@ class IOUsagePattern(base_optimisation.BaseMOEA):
         return vec_var, vec_boundary, vec_epsilon
 
 
-    def moea_insert_vector(self, vec):
+    def moea_slots(self):
 
-        num = 0  # number of data places already inserted
+        # written as a whole, the times being rebuilt from the deltas
+        return [(self, self._insert_values, self.get_data_extend())]
+
+
+    def moea_insert_vector(self, vec):
 
         # sanity bounds check
         self.moea_check_vec_bounds(vec, 'UsagePattern')
 
         # working on itself
+        num = self._insert_values(vec, 0)
 
-        # deal with the two arrays:
-        #   _t, work as t0 + deltas
-        self.usage_t[0] = vec[0]
-        for i in range(num + 1, (num + len(self.usage_t) - 1)):
-            self.usage_t[i] = max(vec[i] + self.usage_t[i - 1], 1.0)
+        # sanity_check
+        self.moea_check_vec_extend(num, 'usage_pattern', vec)
+
+        return num
+
+
+    def _insert_values(self, vec, num):
+        # inserts the values starting at vec[num], returns the position after
+        # them (shared by moea_insert_vector & the setter slot)
+
+        # deal with the two arrays, written in place:
+        #   _t, work as t0 + deltas (the last time is kept), at least 1.0
+        num_t   = max(len(self.usage_t) - 1, 1)
+        usage_t = list(itertools.accumulate(vec[num:num + num_t]))
+        if not min(usage_t[1:], default=1.0) >= 1.0:
+            usage_t = list(
+                itertools.accumulate(vec[num:num + num_t], _add_time_step))
         num += len(self.usage_t)
 
         #   _Val, assume first and last are always 0, then enter the rest
-        for i in range(num, (num + len(self.usage_value) - 2)):
-            self.usage_value[i - num + 1] = vec[i]
+        inner = vec[num:(num + len(self.usage_value) - 2)]
         num += max(len(self.usage_value) - 2, 0)
 
         # duration = delta last time entry and given duration
         # added last for easier back conversion
-        self.usage_length = self.usage_t[-1] + vec[num]
+        t_last = self.usage_t[-1] if len(self.usage_t) > 1 else usage_t[-1]
+        usage_length = t_last + vec[num]
         num += 1
 
-        # sanity_check
-        self.moea_check_vec_extend(num, 'usage_pattern', vec)
+        # compared before writing, as long as not modified anyway
+        if self.moea_needs_compare() and not (
+                base_optimisation.is_same_items(self.usage_t, usage_t) and
+                base_optimisation.is_same_items(self.usage_value, inner, 1)
+                and base_optimisation.is_same(self.usage_length,
+                                              usage_length)):
+            self.mark_modified()
+
+        self.usage_t[:num_t] = usage_t
+        self.usage_value[1:1 + len(inner)] = inner
+        self.usage_length = usage_length
 
         return num
 
 
 # 2. Functions =================================================================
+def _add_time_step(t, delta):
+    return max(delta + t, 1.0)
 
 
 # 3. Main Exec =================================================================
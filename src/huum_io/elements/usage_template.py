@@ -37,9 +37,11 @@
 # 0. Imports ===================================================================
 
 # general
+import itertools
 
 # internal
 from ..util import base_optimisation as base_optimisation
+from ..util import number_lists as number_lists
 from ..util import utilities as util
 
 # 1. Global vars ===============================================================
@@ -48,6 +50,8 @@ from ..util import utilities as util
 # 1.1 Classes ------------------------------------------------------------------
 class IOUsageTemplate(base_optimisation.BaseMOEA):
 
+    moea_label = 'template'  # label in parameter paths
+
     def __init__(self):
 
         base_optimisation.BaseMOEA.__init__(self)
@@ -121,10 +125,25 @@ class IOUsageTemplate(base_optimisation.BaseMOEA):
         f.write('\n' + prefix + '    Buffer:            ' + str(self.buffer))
         f.write('\n' + prefix + '    Computation_Type:  ' +
                 self.computation_type)
-        f.write('\n' + prefix + '    Probability_t:     ' +
-                str(self.probability_t))
-        f.write('\n' + prefix + '    Probability_Value: ' +
-                str(self.probability_value))
+        number_lists.write_list(f, '\n' + prefix + '    Probability_t:     ',
+                                self.probability_t, prefix + '      ')
+        number_lists.write_list(f, '\n' + prefix + '    Probability_Value: ',
+                                self.probability_value, prefix + '      ')
+
+
+    def moea_names(self):
+
+        # probability_t as t0 & deltas, the inner values, then the duration
+        names  = [
+            f'probability_t[{i}]' for i in range(len(self.probability_t))
+        ]
+        names += [
+            f'probability_value[{i}]'
+            for i in range(1, len(self.probability_value) - 1)
+        ]
+        names += ['duration']
+
+        return names
 
 
     def moea_gen_vectors(self, vec_debug):
@@ -168,34 +187,59 @@ class IOUsageTemplate(base_optimisation.BaseMOEA):
         return vec_var, vec_boundary, vec_epsilon
 
 
-    def moea_insert_vector(self, vec):
+    def moea_slots(self):
+
+        # written as a whole, the times being rebuilt from the deltas
+        return [(self, self._insert_values, self.get_data_extend())]
 
-        num = 0  # number of data places already inserted
+
+    def moea_insert_vector(self, vec):
 
         # sanity bounds check
         self.moea_check_vec_bounds(vec, 'UsageTemplate')
 
         # working on itself
+        num = self._insert_values(vec, 0)
 
-        # deal with the two arrays:
-        #   _t, work as t0 + deltas
-        self.probability_t[0] = vec[0]
-        for i in range(num + 1, (num + len(self.probability_t) - 1)):
-            self.probability_t[i] = vec[i] + self.probability_t[i - 1]
+        # sanity_check
+        self.moea_check_vec_extend(num, 'usage_template', vec)
+
+        return num
+
+
+    def _insert_values(self, vec, num):
+        # inserts the values starting at vec[num], returns the position after
+        # them (shared by moea_insert_vector & the setter slot)
+
+        # deal with the two arrays, written in place:
+        #   _t, work as t0 + deltas (the last time is kept)
+        num_t         = max(len(self.probability_t) - 1, 1)
+        probability_t = list(itertools.accumulate(vec[num:num + num_t]))
         num += len(self.probability_t)
 
         #   _Val, assume first and last are always 0, then enter the rest
-        for i in range(num, (num + len(self.probability_t) - 2)):
-            self.probability_value[i - num + 1] = vec[i]
+        inner = vec[num:(num + len(self.probability_t) - 2)]
         num += max(len(self.probability_value) - 2, 0)
 
         # duration = delta last time entry and given duration
         # added last for easier back conversion
-        self.duration = self.probability_t[-1] + vec[num]
+        t_last = (self.probability_t[-1]
+                  if len(self.probability_t) > 1 else probability_t[-1])
+        duration = t_last + vec[num]
         num += 1
 
-        # sanity_check
-        self.moea_check_vec_extend(num, 'usage_template', vec)
+        # compared before writing, as long as not modified anyway
+        if self.moea_needs_compare() and not (
+                base_optimisation.is_same_items(self.probability_t,
+                                                probability_t) and
+                base_optimisation.is_same_items(self.probability_value,
+                                                inner, 1) and
+                base_optimisation.is_same(self.duration, duration)):
+            self.mark_modified()
+
+        self.probability_t[:num_t] = probability_t
+        self.probability_value[1:1 + len(inner)] = inner
+        self.duration = duration
 
         return num
 
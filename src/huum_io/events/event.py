@@ -50,6 +50,8 @@ from ..util import utilities as util
 # 1.1 Classes ------------------------------------------------------------------
 class IOEvent(base_optimisation.BaseMOEA):
 
+    moea_label = 'event'  # label in parameter paths
+
     def __init__(self):
 
         base_optimisation.BaseMOEA.__init__(self)
@@ -112,6 +114,32 @@ class IOEvent(base_optimisation.BaseMOEA):
             effect.write(f, prefix)
 
 
+    def moea_names(self, timeseries_adjustment: bool = True):
+
+        names = []
+        if not (self.probability is None):
+            names += base_optimisation.prefix_names(
+                'probability.', self.probability.moea_names())
+
+        for i, effect in enumerate(self.effects):
+            names += base_optimisation.prefix_names(
+                f'effect:{i}/', effect.moea_names(timeseries_adjustment))
+
+        return names
+
+
+    def moea_slots(self, timeseries_adjustment: bool = True):
+
+        slots = []
+        if not (self.probability is None):
+            slots += self.probability.moea_slots()
+
+        for effect in self.effects:
+            slots += effect.moea_slots(timeseries_adjustment)
+
+        return slots
+
+
     def moea_gen_vectors(self,
                          vec_debug: bool,
                          timeseries_adjustment: bool = True):
@@ -154,6 +154,35 @@ class IOEventEffect(base_optimisation.BaseMOEA):
             exit()
 
 
+    def moea_names(self, timeseries_adjustment: bool = True):
+
+        if (self.effect_type == 'Probability'):
+            return base_optimisation.prefix_names(
+                'probability.', self.effect_data.moea_names())
+
+        elif (self.effect_type == 'Event_Usage_Habit_Template'
+              or (self.effect_type == 'Usage_Pattern'
+                  and timeseries_adjustment)):
+            return base_optimisation.prefix_names(
+                self.effect_data.moea_segment() + '/',
+                self.effect_data.moea_names())
+
+        return []
+
+
+    def moea_slots(self, timeseries_adjustment: bool = True):
+
+        if (self.effect_type == 'Event_Usage_Habit_Template'
+                or self.effect_type == 'Probability'):
+            return self.effect_data.moea_slots()
+
+        elif (self.effect_type == 'Usage_Pattern'):
+            if (timeseries_adjustment):
+                return self.effect_data.moea_slots()
+
+        return []
+
+
     def moea_gen_vectors(self,
                          vec_debug: bool,
                          timeseries_adjustment: bool = True):
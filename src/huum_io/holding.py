@@ -36,13 +36,17 @@
 # 0. Imports ===================================================================
 
 # general
+import functools
+import io
 import os
-import ruamel.yaml as YAML
 
 # internal
 from . import consumer_unit
 from .elements import common_parts as common_parts
+from .util import lazy as lazy
+from .util import sources as sources
 from .util import utilities as util
+from .util import yaml_io as yaml_io
 
 # 1. Global vars ===============================================================
 
@@ -56,8 +60,14 @@ class IOHolding(common_parts.CommonParts
         super().__init__()
         self.id = None
         self.cu = []
-
-    def load(self, fn, dir_root, zfile=None, only_consumer_units=False):
+        self.source = None  # (file name, mtime) of the source file (see util.sources)
+
+    def load(self,
+             fn,
+             dir_root,
+             zfile=None,
+             only_consumer_units=False,
+             registry=None):
         """
         loads the holdings file and (optionally) it's consumer_unit constituents.
 
@@ -68,10 +78,16 @@ class IOHolding(common_parts.CommonParts
             model data structure root directory
         zfile
             zip file object when loading from a zip
-        only_holdings
-            whether only the holdings file should be loaded or the parts as well (default:False)
+        only_consumer_units
+            whether only the holdings file should be loaded, with the consumer
+            units loaded on first access (lazy proxies), or the parts as well
+            (default:False)
+        registry
+            flyweight registry for sharing identical agents & appliances (default: None)
         """
 
+        self.source = sources.source_of(fn, dir_root, zfile)
+
         # sanity check
         if zfile is None:
             exists = os.path.isfile(dir_root + fn)
@@ -83,38 +99,138 @@ class IOHolding(common_parts.CommonParts
                 exit(255)
 
             # get data
-            f = open(dir_root + fn, 'r')
-            holding_data = YAML.YAML(typ='safe', pure=True).load(f)
-            f.close()
+            holding_data = yaml_io.load_file(dir_root + fn)
 
         else:
-            with zfile.open(f'{dir_root}{fn}') as f_obj:
-                holding_data = YAML.YAML(typ='safe', pure=True).load(f_obj)
+            holding_data = yaml_io.load_zip_member(zfile,
+                                                   f'{dir_root}{fn}')
 
         # Get general data
         self.id = util.safe_get_dict_item(holding_data, 'Name', 'holding.load')
 
         for fn_cu in holding_data['Consumer_Units']:
-            cu = consumer_unit.IOConsumerUnit()
-            cu.load(fn_cu, dir_root, zfile)
+            if only_consumer_units:
+                cu = consumer_unit.IOConsumerUnit.lazy(fn_cu, dir_root, zfile,
+                                                       registry)
+            else:
+                cu = consumer_unit.IOConsumerUnit()
+                cu.load(fn_cu, dir_root, zfile, registry=registry)
             self.cu.append(cu)
 
         # load common stuff
         self.load_common(holding_data)
 
+        self.mark_clean()
+
+    @classmethod
+    def lazy(cls, fn, dir_root, zfile=None, registry=None):
+        """
+        Returns a proxy for the holding, which loads the holdings file and its
+        constituents on first attribute access (see util.lazy).
+
+        Inputs: as for load()
+        """
+
+        def loader():
+            unit = IOHolding()
+            unit.load(fn, dir_root, zfile, registry=registry)
+            return unit
+
+        return lazy.LazyProxy(loader, IOHolding, fn)
+
+    def refresh(self, dir_root, changed, registry=None):
+        """
+        Reloads the holding if its file changed since loading (reusing the
+        unchanged consumer units), otherwise refreshes its consumer units.
+
+        Inputs:
+        dir_root
+            model data structure root directory
+        changed
+            list collecting the (file name, element) pairs of reloaded files
+        registry
+            flyweight registry of the model, if loaded with dedup: changed
+            agent & appliance files are loaded as shared objects (default:
+            None)
+        """
+
+        if self.source is None:
+            return self
+
+        if sources.is_changed(self, dir_root):
+            fn = self.source[0]
+            changed.append((fn, self))
+
+            self.source = sources.source_of(fn, dir_root)
+            holding_data = yaml_io.load_file(dir_root + fn)
+
+            def load_cu(fn_cu):
+                cu = consumer_unit.IOConsumerUnit()
+                cu.load(fn_cu, dir_root, registry=registry)
+                return cu
+
+            common_parts.CommonParts.__init__(self)
+            self.id = util.safe_get_dict_item(holding_data, 'Name',
+                                              'holding.refresh')
+            self.cu = sources.splice_list(self.cu,
+                                          holding_data['Consumer_Units'],
+                                          dir_root, changed, load_cu,
+                                          registry)
+            self.load_common(holding_data)
+            self.mark_clean()
+
+        else:
+            self.cu = sources.refresh_list(self.cu, dir_root, changed,
+                                           registry)
+
+        return self
+
     def check(self):
         print("holding.check: Not yet implemented")
         exit(255)
 
-    def write(self, dir_root, dir_file):
+    def write(self, dir_root, dir_file, only_modified=False, library=None):
+        documents = self.iter_documents(dir_file, only_modified, library)
+        if library is not None:
+            documents = library.filter(documents)
+
+        util.write_documents(dir_root, documents)
+        self.mark_clean(recursive=True)
 
-        # assure that the output directory exists
-        dir_local = os.path.join(dir_root, dir_file)
-        if not os.path.exists(dir_local):
-            os.makedirs(dir_local)
+    def iter_documents(self, dir_file, only_modified=False, library=None):
+        """
+        Yields (file path relative to the model root, function returning the
+        file content) for the holding file and the files of all its constituents.
 
-        # write file
-        f = open(os.path.join(dir_local, 'holding.yaml'), 'w')
+        Inputs:
+        dir_file
+            directory of the holding, relative to the model root
+        only_modified
+            whether only the files of modified elements are included (see
+            BaseMOEA.is_modified, default: False)
+        library
+            util.library.SharedLibrary storing identical agent & appliance
+            files once (default: None, each element gets its own file)
+        """
+
+        if not only_modified or self.is_modified():
+            yield (dir_file + '/holding.yaml',
+                   functools.partial(self.render, dir_file))
+
+        for unit in self.cu:
+            yield from unit.iter_documents(dir_file + '/' + unit.id + '/',
+                                           only_modified, library)
+
+    def render(self, dir_file):
+        """
+        Returns the content of the holding file.
+
+        Inputs:
+        dir_file
+            directory of the holding, relative to the model root
+        """
+
+        f = io.StringIO()
 
         # write header
         f.write("%YAML 1.2\n---\n")
@@ -126,12 +242,23 @@ class IOHolding(common_parts.CommonParts
         f.write('\nConsumer_Units:\n')
         for unit in self.cu:
             f.write('- ' + dir_file + '/' + unit.id + '/cu.yaml\n')
-            unit.write(dir_root, dir_file + '/' + unit.id + '/')
 
         # Common Data
         self.write_common(f)
 
-        f.close()
+        return f.getvalue()
+
+    def moea_parts(self, timeseries_adjustment: bool = True):
+        """
+        Yields the elements contributing to the optimisation vector in vector
+        order, as (element, timeseries_adjustment to pass on) pairs, None for
+        elements not taking the flag (see parameter_layout).
+        """
+
+        for cu in self.cu:
+            yield cu, timeseries_adjustment
+
+        yield from self.common_moea_parts()
 
     def moea_gen_vectors(self,
                          vec_debug: bool,
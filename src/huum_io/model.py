@@ -36,15 +36,23 @@
 # 0. Imports ===================================================================
 
 # general
+import concurrent.futures
+import io
 import os
-import ruamel.yaml as YAML
+import zipfile
 
 # internal
 from . import holding
 from .elements import common_parts as common_parts
+from .util import flyweight as flyweight
+from .util import number_lists as number_lists
+from .util import sources as sources
+from .util import utilities as util
+from .util import yaml_io as yaml_io
 
 # 1. Global vars ===============================================================
-
+_worker_zfile = None  # per-process zip file handle when loading in parallel
+_worker_registry = None  # per-process flyweight registry when loading in parallel
 
 # 1.1 Classes ------------------------------------------------------------------
 class IOModel(common_parts.CommonParts
@@ -55,9 +63,18 @@ class IOModel(common_parts.CommonParts
         common_parts.CommonParts.__init__(self)
 
         self.holdings = []
+        self.source = None  # (file name, mtime) of the source file (see util.sources)
+        self.dir_root = None  # model root directory, if loaded from files (see refresh)
+        self.registry = None  # flyweight registry, if loaded with dedup (see refresh)
 
     @classmethod
-    def load(cls, fn, dir_root, only_model=False):
+    def load(cls,
+             fn,
+             dir_root,
+             only_model=False,
+             workers=None,
+             pool='process',
+             dedup=False):
         """
         loads the model file and (optionally) it's holding constituents.
 
@@ -67,61 +84,279 @@ class IOModel(common_parts.CommonParts
         dir_root
             model data structure root directory
         only_model
-            whether only the model file should be loaded or the parts as well (default:False)
+            whether only the model file should be loaded, with the holdings
+            loaded on first access (lazy proxies), or the parts as well (default:False)
+        workers
+            number of parallel workers for loading the holdings (default: None, serial)
+        pool
+            'process' or 'thread', kind of worker pool used when workers > 1
+        dedup
+            whether identical agent & appliance files are loaded as one shared
+            object (see util.flyweight, default: False)
         """
 
-        # sanity check
-        input_file = os.path.join(os.path.normcase(dir_root), fn)
-        exists = os.path.isfile(input_file)
-        if not exists:
-            print('')
-            print('\nHUUM model file ' + input_file + ' does not exist')
-            print('Working dir: ' + str(os.getcwd()))
-            exit(255)
-
         # get data
-        f = open(input_file, 'r')
-        cls = IOModel.from_fileobject(f, dir_root)
-        f.close()
+        source = sources.source_of(fn, dir_root)
+        model_data = _load_model_file(fn, dir_root)
+        cls = IOModel.from_data(model_data,
+                                dir_root,
+                                only_model=only_model,
+                                workers=workers,
+                                pool=pool,
+                                dedup=dedup)
+        cls.source = source
+        cls.dir_root = dir_root
+        cls.mark_clean()
 
         return cls
 
     @classmethod
-    def from_zip(cls, fn: str, zfile, base_dir):
-
-        with zfile.open(f'{base_dir}{fn}') as f_obj:
-            cls = IOModel.from_fileobject(f_obj, base_dir, zfile)
+    def from_zip(cls,
+                 fn: str,
+                 zfile,
+                 base_dir,
+                 only_model=False,
+                 workers=None,
+                 pool='process',
+                 dedup=False,
+                 holdings=None):
+
+        model_data = yaml_io.load_zip_member(zfile, f'{base_dir}{fn}')
+        cls = IOModel.from_data(model_data,
+                                base_dir,
+                                zfile,
+                                only_model=only_model,
+                                workers=workers,
+                                pool=pool,
+                                dedup=dedup,
+                                holdings=holdings)
 
         return cls
 
     @classmethod
-    def from_fileobject(cls, f_obj, dir_root, zfile=None):
+    def from_fileobject(cls,
+                        f_obj,
+                        dir_root,
+                        zfile=None,
+                        only_model=False,
+                        workers=None,
+                        pool='process',
+                        dedup=False):
+
+        model_data = yaml_io.parse(f_obj)
+
+        return IOModel.from_data(model_data,
+                                 dir_root,
+                                 zfile,
+                                 only_model=only_model,
+                                 workers=workers,
+                                 pool=pool,
+                                 dedup=dedup)
+
+    @classmethod
+    def from_data(cls,
+                  model_data,
+                  dir_root,
+                  zfile=None,
+                  only_model=False,
+                  workers=None,
+                  pool='process',
+                  dedup=False,
+                  holdings=None):
+        """
+        creates the model from the parsed model file.
+
+        Inputs:
+        model_data
+            dictionary with the model file content
+        holdings
+            list of holding files to load instead of all the ones listed in
+            the model file (default: None, all)
+        other inputs
+            see load()
+        """
 
         cls = IOModel()
 
-        model_data = YAML.YAML(typ='safe', pure=True).load(f_obj)
-        for hold in model_data['Holdings']:
-            unit = holding.IOHolding()
-            unit.load(hold, dir_root, zfile)
-            cls.holdings.append(unit)
+        if holdings is None:
+            holdings = model_data['Holdings']
+
+        registry = flyweight.FlyweightRegistry() if dedup else None
+        if only_model or workers is None or workers <= 1:
+            for hold in holdings:
+                if only_model:
+                    unit = holding.IOHolding.lazy(hold, dir_root, zfile,
+                                                  registry)
+                else:
+                    unit = holding.IOHolding()
+                    unit.load(hold, dir_root, zfile, registry=registry)
+                cls.holdings.append(unit)
+        else:
+            cls.holdings = load_holdings_parallel(holdings,
+                                                  dir_root, zfile, workers,
+                                                  pool, dedup, registry)
+        cls.registry = registry
 
         # load common stuff
         cls.load_common(model_data)
 
+        cls.mark_clean()
+
         return cls
 
+    @classmethod
+    def iter_holdings(cls, fn, dir_root, zfile=None, dedup=False):
+        """
+        Generator yielding the fully loaded holdings of a model one at a time,
+        without keeping the model in memory. Peak memory is thus bound by the
+        largest holding, as long as the caller drops its references.
+
+        Inputs:
+        fn
+            model filename
+        dir_root
+            model data structure root directory
+        zfile
+            zip file object when loading from a zip
+        dedup
+            whether identical agent & appliance files are loaded as one shared
+            object (see util.flyweight, default: False)
+        """
+
+        if zfile is None:
+            model_data = _load_model_file(fn, dir_root)
+        else:
+            model_data = yaml_io.load_zip_member(zfile, f'{dir_root}{fn}')
+
+        registry = flyweight.FlyweightRegistry() if dedup else None
+        for hold in model_data['Holdings']:
+            unit = holding.IOHolding()
+            unit.load(hold, dir_root, zfile, registry=registry)
+            yield unit
+
+    def refresh(self):
+        """
+        Re-reads the model files changed since loading (or the last refresh)
+        and splices the new elements into the model. Unchanged files are not
+        parsed again; holdings not loaded yet (see only_model) are left alone.
+
+        Returns:
+            list of (file name, element) pairs of the reloaded files, in
+            model order
+        """
+
+        if self.source is None:
+            raise ValueError(
+                'model.refresh: model was not loaded from a model directory.')
+
+        changed = []
+        dir_root = self.dir_root
+
+        if sources.is_changed(self, dir_root):
+            fn = self.source[0]
+            changed.append((fn, self))
+
+            self.source = sources.source_of(fn, dir_root)
+            model_data = _load_model_file(fn, dir_root)
+
+            def load_holding(fn_holding):
+                unit = holding.IOHolding()
+                unit.load(fn_holding, dir_root, registry=self.registry)
+                return unit
+
+            common_parts.CommonParts.__init__(self)
+            self.holdings = sources.splice_list(self.holdings,
+                                                model_data['Holdings'],
+                                                dir_root, changed,
+                                                load_holding, self.registry)
+            self.load_common(model_data)
+            self.mark_clean()
+
+        else:
+            self.holdings = sources.refresh_list(self.holdings, dir_root,
+                                                 changed, self.registry)
+
+        return changed
+
     def check(self):
         print("model.check: Not yet implemented")
         exit(255)
 
-    def write(self, dir_out, fn):
+    def write(self,
+              dir_out,
+              fn,
+              workers=None,
+              pool='thread',
+              only_modified=False,
+              library=None):
+        """
+        Writes the model file and the files of all holdings.
+
+        Inputs:
+        dir_out
+            model root directory to write to
+        fn
+            filename of the model file
+        workers
+            number of parallel workers for writing the holdings (default: None, serial)
+        pool
+            'thread' or 'process', kind of worker pool used when workers > 1
+        only_modified
+            whether only the files of modified elements are written (see
+            BaseMOEA.is_modified, default: False)
+        library
+            util.library.SharedLibrary storing identical agent & appliance
+            files once (default: None, each element gets its own file)
+        """
+
+        if workers is None or workers <= 1:
+            documents = self.iter_documents(fn, only_modified, library)
+            if library is not None:
+                documents = library.filter(documents)
+
+            util.write_documents(dir_out, documents)
+
+        else:
+            # assure that the output directory exists
+            if not os.path.exists(dir_out):
+                os.makedirs(dir_out)
+
+            if not only_modified or self.is_modified():
+                util.write_file(os.path.join(dir_out, fn), self.render())
+            write_holdings_parallel(self.holdings, dir_out, workers, pool,
+                                    only_modified, library)
 
-        # assure that the output directory exists
-        if not os.path.exists(dir_out):
-            os.makedirs(dir_out)
+        # process workers only clean their own copies
+        self.mark_clean(recursive=True)
 
-        # write file
-        f = open(os.path.join(dir_out, fn), 'w')
+    def iter_documents(self, fn, only_modified=False, library=None):
+        """
+        Yields (file path relative to the model root, function returning the
+        file content) for the model file and the files of all holdings.
+
+        Inputs:
+        fn
+            filename of the model file
+        only_modified
+            whether only the files of modified elements are included (see
+            BaseMOEA.is_modified, default: False)
+        library
+            util.library.SharedLibrary storing identical agent & appliance
+            files once (default: None, each element gets its own file)
+        """
+
+        if not only_modified or self.is_modified():
+            yield (fn, self.render)
+
+        for unit in self.holdings:
+            yield from unit.iter_documents(unit.id, only_modified, library)
+
+    def render(self):
+        """
+        Returns the content of the model file.
+        """
+
+        f = io.StringIO()
 
         # write header
         f.write("%YAML 1.2\n---\n")
@@ -129,12 +364,23 @@ class IOModel(common_parts.CommonParts
         f.write('\nHoldings:\n')
         for unit in self.holdings:
             f.write('- ' + unit.id + '/holding.yaml\n')
-            unit.write(dir_out, unit.id)
 
         # Common Data
         self.write_common(f)
 
-        f.close()
+        return f.getvalue()
+
+    def moea_parts(self, timeseries_adjustment: bool = True):
+        """
+        Yields the elements contributing to the optimisation vector in vector
+        order, as (element, timeseries_adjustment to pass on) pairs, None for
+        elements not taking the flag (see parameter_layout).
+        """
+
+        for hold in self.holdings:
+            yield hold, timeseries_adjustment
+
+        yield from self.common_moea_parts()
 
     def moea_gen_vectors(self,
                          vec_debug: bool,
@@ -212,6 +458,233 @@ class IOModel(common_parts.CommonParts
 
 
 # 2. Functions =================================================================
+def load_holdings_parallel(fn_holdings: list,
+                           dir_root: str,
+                           zfile=None,
+                           workers: int = 2,
+                           pool: str = 'process',
+                           dedup: bool = False,
+                           registry=None):
+    """
+    Loads the given holdings (and their subtrees) concurrently.
+    The returned list keeps the order of fn_holdings.
+
+    Inputs:
+    fn_holdings
+        list of holding filenames, relative to dir_root
+    dir_root
+        model data structure root directory
+    zfile
+        zip file object when loading from a zip
+    workers
+        number of workers
+    pool
+        'process' or 'thread'
+    dedup
+        whether identical agent & appliance files are loaded as one shared
+        object. Process workers share objects within their own chunk only.
+    registry
+        flyweight registry to use with dedup (default: None, a new one).
+        The shared objects loaded by process workers are adopted by it.
+    """
+
+    # process workers need to reopen the archive themselves
+    fn_zip = None
+    if zfile is not None:
+        fn_zip = zfile.filename
+        if fn_zip is None:
+            pool = 'thread'
+
+    if dedup and registry is None:
+        registry = flyweight.FlyweightRegistry()
+
+    if pool == 'thread':
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            return list(
+                executor.map(
+                    lambda fn: _load_holding(fn, dir_root, zfile, registry),
+                    fn_holdings))
+
+    elif pool == 'process':
+        chunksize = max(1, len(fn_holdings) // (workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+                workers,
+                initializer=_init_worker,
+                initargs=(fn_zip, yaml_io.get_cache_dir(),
+                          yaml_io.get_backend(), dedup)) as executor:
+            holdings = list(
+                executor.map(_load_holding_worker,
+                             fn_holdings,
+                             [dir_root] * len(fn_holdings),
+                             chunksize=chunksize))
+
+        if dedup:
+            _adopt_shared(holdings, registry)
+
+        return holdings
+
+    else:
+        raise ValueError(f'Unknown pool type {pool}, use process or thread.')
+
+
+def write_holdings_parallel(holdings: list,
+                            dir_out: str,
+                            workers: int = 2,
+                            pool: str = 'thread',
+                            only_modified: bool = False,
+                            library=None):
+    """
+    Writes the given holdings (and their subtrees) concurrently. All
+    directories are created up front, the output is identical to writing the
+    holdings one after the other.
+
+    Inputs:
+    holdings
+        list of IOHolding objects
+    dir_out
+        model root directory to write to
+    workers
+        number of workers
+    pool
+        'thread' or 'process'. Threads suffice in most cases, as the time is
+        mostly spent in file system calls; process workers get a pickled copy
+        of their holdings and the number format (see util.number_lists).
+    only_modified
+        whether only the files of modified elements are written (see
+        BaseMOEA.is_modified, default: False)
+    library
+        util.library.SharedLibrary storing identical agent & appliance files
+        once (default: None). Only supported with thread workers.
+    """
+
+    if pool not in ('thread', 'process'):
+        raise ValueError(f'Unknown pool type {pool}, use process or thread.')
+    if pool == 'process' and library is not None:
+        raise ValueError('A shared library requires thread workers.')
+
+    # create all directories in one pass
+    dirs = set()
+    for unit in holdings:
+        if library is None:
+            for path, _ in unit.iter_documents(unit.id, only_modified):
+                dirs.add(os.path.dirname(path))
+        else:
+            dirs.update(_library_dirs(unit, only_modified, library))
+
+    for dir_file in sorted(dirs):
+        os.makedirs(os.path.join(dir_out, dir_file), exist_ok=True)
+
+    if pool == 'thread':
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            list(
+                executor.map(
+                    lambda unit: _write_holding(unit, dir_out, only_modified,
+                                                library), holdings))
+
+    else:
+        chunksize = max(1, len(holdings) // (workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+                workers,
+                initializer=_init_write_worker,
+                initargs=(number_lists.get_format(), )) as executor:
+            list(
+                executor.map(_write_holding,
+                             holdings, [dir_out] * len(holdings),
+                             [only_modified] * len(holdings),
+                             chunksize=chunksize))
+
+
+def _load_model_file(fn, dir_root):
+
+    # sanity check
+    input_file = os.path.join(os.path.normcase(dir_root), fn)
+    exists = os.path.isfile(input_file)
+    if not exists:
+        print('')
+        print('\nHUUM model file ' + input_file + ' does not exist')
+        print('Working dir: ' + str(os.getcwd()))
+        exit(255)
+
+    return yaml_io.load_file(input_file)
+
+
+def _load_holding(fn, dir_root, zfile, registry=None):
+
+    unit = holding.IOHolding()
+    unit.load(fn, dir_root, zfile, registry=registry)
+
+    return unit
+
+
+def _adopt_shared(holdings, registry):
+
+    for unit in holdings:
+        for cu in unit.cu:
+            for daemon in cu.agents:
+                if flyweight.is_shared(daemon):
+                    registry.adopt('agent', daemon)
+            for chamber in cu.rooms:
+                for device in chamber.appliances:
+                    if flyweight.is_shared(device):
+                        registry.adopt('appliance', device)
+
+
+def _library_dirs(unit, only_modified, library):
+    # Directories written to in library mode, taken from the element paths:
+    # iter_documents would render every agent & appliance to find the names of
+    # their shared files (and count the references in the library).
+
+    if not only_modified or unit.is_modified():
+        yield unit.id
+
+    for cu in unit.cu:
+        dir_cu = unit.id + '/' + cu.id
+
+        for chamber in cu.rooms:
+            if not only_modified or chamber.is_modified() or any(
+                    app.is_modified() for app in chamber.appliances):
+                yield dir_cu + '/rooms'
+                if chamber.appliances:
+                    yield library.dir_library + 'appliances'
+
+        if not only_modified or cu.is_modified() or any(
+                daemon.is_modified() for daemon in cu.agents):
+            yield dir_cu
+            if cu.agents:
+                yield library.dir_library + 'agents'
+
+
+def _write_holding(unit, dir_out, only_modified=False, library=None):
+
+    documents = unit.iter_documents(unit.id, only_modified, library)
+    if library is not None:
+        documents = library.filter(documents)
+
+    # directories are already created by write_holdings_parallel
+    for path, render in documents:
+        util.write_file(os.path.join(dir_out, path), render())
+
+
+def _init_worker(fn_zip, dir_cache, backend, dedup):
+
+    global _worker_zfile, _worker_registry
+    yaml_io.set_cache_dir(dir_cache)
+    yaml_io.set_backend(backend)
+    if dedup:
+        _worker_registry = flyweight.FlyweightRegistry()
+    if fn_zip is not None:
+        _worker_zfile = zipfile.ZipFile(fn_zip, 'r')
+
+
+def _init_write_worker(number_format):
+
+    # spawned workers start with the default format
+    number_lists.set_format(**number_format)
+
+
+def _load_holding_worker(fn, dir_root):
+    return _load_holding(fn, dir_root, _worker_zfile, _worker_registry)
+
 
 # 3. Main Exec =================================================================
 if __name__ == '__main__':
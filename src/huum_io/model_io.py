@@ -36,13 +36,19 @@
 # 0. Imports ===================================================================
 
 # general
+import concurrent.futures
+import copy
 import logging
 import os
+import time
 import zipfile
 
 # internal
 from . import model
 from . import settings
+from . import snapshot
+from . import zip_index
+from .util import yaml_io as yaml_io
 
 # 1. Global vars ===============================================================
 mod_logger = logging.getLogger(__name__)
@@ -60,10 +66,53 @@ class IOModelHUUM(object
     def load(cls,
              filename,
              force_modelroot: str = '',
-             add_modelroot: str = ''):
+             add_modelroot: str = '',
+             workers: int = None,
+             pool: str = 'process',
+             cache_dir: str = None,
+             yaml_backend: str = None,
+             dedup: bool = False,
+             only_model: bool = False):
+        """
+        Loads a full model, either from a settings file or a zip archive.
+
+        Inputs:
+        filename
+            settings file or zip archive to load
+        force_modelroot
+            use this model root instead of the one given in the settings
+        add_modelroot
+            prefix for the model root given in the settings
+        workers
+            number of parallel workers for loading the holdings (default: None, serial)
+        pool
+            'process' or 'thread', kind of worker pool used when workers > 1
+        cache_dir
+            if given, enables the on-disk parse cache in this directory (also
+            for later loads, see util.yaml_io.set_cache_dir)
+        yaml_backend
+            if given, selects the YAML parser: 'auto', 'c' or 'pure' (also for
+            later loads, see util.yaml_io.set_backend)
+        dedup
+            whether identical agent & appliance files are loaded as one shared
+            object (see util.flyweight, default: False)
+        only_model
+            whether the holdings are only loaded on first access (lazy proxies,
+            see util.lazy, default: False)
+        """
+
+        if cache_dir is not None:
+            yaml_io.set_cache_dir(cache_dir)
+
+        if yaml_backend is not None:
+            yaml_io.set_backend(yaml_backend)
 
         if zipfile.is_zipfile(filename):
-            cls = IOModelHUUM.load_zip(filename)
+            cls = IOModelHUUM.load_zip(filename,
+                                       only_model=only_model,
+                                       workers=workers,
+                                       pool=pool,
+                                       dedup=dedup)
         else:
             cls = IOModelHUUM()
             cls.load_settings(filename)
@@ -77,58 +126,154 @@ class IOModelHUUM(object
             if force_modelroot is None:
                 force_modelroot = ''
 
-            cls.load_model(force_modelroot)
+            cls.load_model(force_modelroot,
+                           only_model=only_model,
+                           workers=workers,
+                           pool=pool,
+                           dedup=dedup)
 
         return cls
 
     @classmethod
-    def load_zip(cls, fn: str):
+    def load_zip(cls,
+                 fn: str,
+                 only_model: bool = False,
+                 workers: int = None,
+                 pool: str = 'process',
+                 dedup: bool = False,
+                 holdings: list = None,
+                 index_sidecar: bool = True):
         """
-        Loads a zipped full model.
+        Loads a zipped full model, or only the given holdings of it.
+
+        Inputs:
+        fn
+            zip archive to load
+        only_model
+            whether the holdings are only loaded on first access (default: False)
+        workers
+            number of parallel workers for loading the holdings (default: None, serial)
+        pool
+            'process' or 'thread', kind of worker pool used when workers > 1
+        dedup
+            whether identical agent & appliance files are loaded as one shared
+            object (see util.flyweight, default: False)
+        holdings
+            names of the holdings to load, looked up via the zip index
+            (default: None, all holdings)
+        index_sidecar
+            whether the zip index is cached in a sidecar file next to the
+            archive (see zip_index.ZipIndex, default: True)
         """
 
-        # checks
-        if not zipfile.is_zipfile(fn):
-            raise TypeError(f'Given file {fn} is not a zip archive.')
-
-        # check for structure
-        zf = zipfile.ZipFile(fn, 'r')
-
-        # get numer of top level domains
-        top = list({item.split('/')[0] for item in zf.namelist()})
-        if len(top) != 1:
-            raise RuntimeError('Archive has more than one top-level directory')
-
-        dir_top = top[0]
-
-        # get settings file
-        files_first_level = []
-        for item in zf.namelist():
-            tail, head = os.path.split(item)
-            if '.yaml' in head and tail == dir_top:
-                files_first_level.append(item)
-        if len(files_first_level) != 1:
-            raise RuntimeError(
-                'Number of .yaml files in the top directory is unequal 1.')
-
         cls = IOModelHUUM()
+        zf, cls.settings, base_dir = open_zip(fn)
 
-        # load settings
-        with zf.open(files_first_level[0]) as f_obj:
-            cls.settings = settings.IOSettings.from_fileobject(f_obj)
+        # find the requested holdings
+        fn_holdings = None
+        if holdings is not None:
+            index = zip_index.ZipIndex.load_or_build(zf, base_dir,
+                                                     cls.settings.fn_model,
+                                                     index_sidecar)
+            fn_holdings = [index.holding_member(name) for name in holdings]
 
         # and the rest
         cls.model = model.IOModel.from_zip(
             cls.settings.fn_model,
             zfile=zf,
-            base_dir=f'{dir_top}/{cls.settings.dir_modelRoot}')
+            base_dir=base_dir,
+            only_model=only_model,
+            workers=workers,
+            pool=pool,
+            dedup=dedup,
+            holdings=fn_holdings)
+
+        return cls
+
+    @classmethod
+    def iter_holdings(cls,
+                      filename,
+                      force_modelroot: str = '',
+                      dedup: bool = False):
+        """
+        Generator yielding the fully loaded holdings of a model (settings file
+        or zip archive) one at a time, see IOModel.iter_holdings.
+
+        Inputs:
+        filename
+            settings file or zip archive to load
+        force_modelroot
+            use this model root instead of the one given in the settings
+        dedup
+            whether identical agent & appliance files are loaded as one shared
+            object (see util.flyweight, default: False)
+        """
+
+        if zipfile.is_zipfile(filename):
+            zf, model_settings, base_dir = open_zip(filename)
+            with zf:
+                yield from model.IOModel.iter_holdings(model_settings.fn_model,
+                                                       base_dir,
+                                                       zfile=zf,
+                                                       dedup=dedup)
+
+        else:
+            model_settings = settings.IOSettings.load(filename)
+            if force_modelroot:
+                modelroot = force_modelroot
+            else:
+                modelroot = model_settings.dir_modelRoot
+
+            yield from model.IOModel.iter_holdings(model_settings.fn_model,
+                                                   modelroot,
+                                                   dedup=dedup)
+
+    @classmethod
+    def load_snapshot(cls, fn: str):
+        """
+        Loads a full model from a binary snapshot (see save_snapshot).
+
+        Inputs:
+        fn
+            snapshot file to load
+        """
+
+        cls = snapshot.load(fn)
+        if not isinstance(cls, IOModelHUUM):
+            raise TypeError(f'Snapshot {fn} does not hold a full model.')
 
         return cls
 
+    def save_snapshot(self, fn: str, compress: bool = False):
+        """
+        Saves the full model (settings & model data) as a binary snapshot,
+        which loads much faster than the YAML files (see snapshot).
+
+        Inputs:
+        fn
+            snapshot file to write
+        compress
+            whether the structure part of the snapshot is zlib compressed
+            (default: False)
+        """
+
+        # sanity checks
+        if (self.settings is None) or (self.model is None):
+            raise ValueError(
+                'model_io.save_snapshot: settings and model data required.')
+
+        snapshot.save(self, fn, compress=compress)
+
     def load_settings(self, filename):
         self.settings = settings.IOSettings.load(filename)
 
-    def load_model(self, force_modelroot: str, add_modelroot: str = ''):
+    def load_model(self,
+                   force_modelroot: str,
+                   add_modelroot: str = '',
+                   only_model: bool = False,
+                   workers: int = None,
+                   pool: str = 'process',
+                   dedup: bool = False):
 
         # sanity check
         if (self.settings is None):
@@ -141,7 +286,38 @@ class IOModelHUUM(object
         else:
             modelroot = self.settings.dir_modelRoot
 
-        self.model = model.IOModel.load(self.settings.fn_model, modelroot)
+        self.model = model.IOModel.load(self.settings.fn_model,
+                                        modelroot,
+                                        only_model=only_model,
+                                        workers=workers,
+                                        pool=pool,
+                                        dedup=dedup)
+
+    def refresh(self):
+        """
+        Re-reads the changed model files, see model.IOModel.refresh().
+        """
+
+        # sanity check
+        if (self.model is None):
+            raise ValueError('model_io.refresh: no model loaded.')
+
+        return self.model.refresh()
+
+    def write_zip(self,
+                  fn: str,
+                  compression: int = zipfile.ZIP_DEFLATED,
+                  compresslevel: int = None,
+                  workers: int = None,
+                  dir_top: str = None,
+                  model_root: str = 'model/'):
+        """
+        Writes the full model straight into a zip archive, loadable via
+        load_zip(). See write_zip() of this module for the inputs.
+        """
+
+        write_zip(self, fn, compression, compresslevel, workers, dir_top,
+                  model_root)
 
     def write_settings(self, filename):
 
@@ -153,7 +329,11 @@ class IOModelHUUM(object
 
         self.settings.write(filename)
 
-    def write_model(self):
+    def write_model(self,
+                    workers: int = None,
+                    pool: str = 'thread',
+                    only_modified: bool = False,
+                    library=None):
 
         # sanity check
         if (self.settings is None):
@@ -161,9 +341,46 @@ class IOModelHUUM(object
                 'model_io.write_model: writing model without set settings.')
             exit(255)
 
-        self.model.write(self.settings.dir_modelRoot, self.settings.fn_model)
-
-    def write(self, filename, root_dir=None, manual_data_dir=''):
+        self.model.write(self.settings.dir_modelRoot,
+                         self.settings.fn_model,
+                         workers=workers,
+                         pool=pool,
+                         only_modified=only_modified,
+                         library=library)
+
+    def write(self,
+              filename,
+              root_dir=None,
+              manual_data_dir='',
+              workers: int = None,
+              pool: str = 'thread',
+              only_modified: bool = False,
+              library=None):
+        """
+        Writes the settings file and the model files.
+
+        Inputs:
+        filename
+            settings file to write
+        root_dir
+            model root directory to write the model files to (default: the
+            one given in the settings)
+        manual_data_dir
+            model root directory written into the settings file instead
+        workers
+            number of parallel workers for writing the holdings (default: None, serial)
+        pool
+            'thread' or 'process', kind of worker pool used when workers > 1
+        only_modified
+            whether only the model files of elements modified since loading
+            or the last write are written (see BaseMOEA.is_modified,
+            default: False). The settings file is always written.
+        library
+            util.library.SharedLibrary storing identical agent & appliance
+            files once in its directory below the model root, referenced by
+            the consumer unit & room files (default: None, each element gets
+            its own file)
+        """
 
         # sanity checks
         flag = False
@@ -190,10 +407,139 @@ class IOModelHUUM(object
         else:
             self.write_settings(filename)
 
-        self.write_model()
+        self.write_model(workers=workers,
+                         pool=pool,
+                         only_modified=only_modified,
+                         library=library)
 
 
 # 2. Functions =================================================================
+def write_zip(huum,
+              fn: str,
+              compression: int = zipfile.ZIP_DEFLATED,
+              compresslevel: int = None,
+              workers: int = None,
+              dir_top: str = None,
+              model_root: str = 'model/'):
+    """
+    Writes a full model straight into a zip archive, in the layout expected
+    by IOModelHUUM.load_zip(): one top directory holding the settings file,
+    with the model files below the (relative) model root.
+
+    Inputs:
+    huum
+        IOModelHUUM object to write
+    fn
+        zip archive to write
+    compression
+        zipfile compression method (default: zipfile.ZIP_DEFLATED)
+    compresslevel
+        compression level, see zipfile.ZipFile (default: None)
+    workers
+        number of threads rendering the holdings in parallel (default: None,
+        serial)
+    dir_top
+        name of the top directory (default: archive name without extension)
+    model_root
+        model root directory within the top directory (default: 'model/')
+    """
+
+    # sanity checks
+    if (huum.settings is None) or (huum.model is None):
+        raise ValueError('model_io.write_zip: settings and model data required.')
+
+    if model_root.strip('/') == '':
+        raise ValueError(
+            'model_io.write_zip: the model root has to be a sub directory.')
+
+    if not model_root.endswith('/'):
+        model_root += '/'
+
+    if dir_top is None:
+        dir_top = os.path.splitext(os.path.basename(fn))[0]
+
+    # settings pointing to the model root within the archive
+    zip_settings = copy.copy(huum.settings)
+    zip_settings.dir_modelRoot = model_root
+
+    prefix = f'{dir_top}/{model_root}'
+    date_time = time.localtime()[:6]
+
+    def member(name):
+        info = zipfile.ZipInfo(name, date_time)
+        info.compress_type = compression
+        info.external_attr = 0o644 << 16
+        return info
+
+    with zipfile.ZipFile(fn, 'w', compression,
+                         compresslevel=compresslevel) as zf:
+        zf.writestr(member(f'{dir_top}/settings.yaml'), zip_settings.render())
+        zf.writestr(member(prefix + zip_settings.fn_model),
+                    huum.model.render())
+
+        # rendering in parallel, the members are compressed & written in order
+        holdings = huum.model.holdings
+        if workers is None or workers <= 1:
+            for unit in holdings:
+                for path, render in unit.iter_documents(unit.id):
+                    zf.writestr(member(prefix + path), render())
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            for documents in executor.map(_render_holding, holdings):
+                for path, content in documents:
+                    zf.writestr(member(prefix + path), content)
+
+
+def _render_holding(unit):
+
+    return [(path, render()) for path, render in unit.iter_documents(unit.id)]
+
+
+def open_zip(fn: str):
+    """
+    Opens a zipped full model and reads its settings.
+
+    Inputs:
+    fn
+        zip archive to open
+
+    Returns:
+        the opened zipfile.ZipFile, the IOSettings object & the model root
+        directory within the archive
+    """
+
+    # checks
+    if not zipfile.is_zipfile(fn):
+        raise TypeError(f'Given file {fn} is not a zip archive.')
+
+    # check for structure
+    zf = zipfile.ZipFile(fn, 'r')
+    names = zf.namelist()
+
+    # get numer of top level domains
+    top = list({item.split('/')[0] for item in names})
+    if len(top) != 1:
+        raise RuntimeError('Archive has more than one top-level directory')
+
+    dir_top = top[0]
+
+    # get settings file
+    files_first_level = []
+    for item in names:
+        tail, head = os.path.split(item)
+        if '.yaml' in head and tail == dir_top:
+            files_first_level.append(item)
+    if len(files_first_level) != 1:
+        raise RuntimeError(
+            'Number of .yaml files in the top directory is unequal 1.')
+
+    # load settings
+    with zf.open(files_first_level[0]) as f_obj:
+        model_settings = settings.IOSettings.from_fileobject(f_obj)
+
+    return zf, model_settings, f'{dir_top}/{model_settings.dir_modelRoot}'
+
 
 # 3. Main Exec =================================================================
 if __name__ == '__main__':
@@ -0,0 +1,533 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# SQLite based model store.
+#
+# Exports an IOModel tree into a local SQLite database and reads it back, either
+# as a whole or partially via indexed queries (e.g. "all showers within the
+# holdings H10 to H20"), without loading the complete model.
+#
+# Every element type has its own table, with columns for the queryable
+# properties (names, classes, types), the parent ids and the position within
+# the parent list. The holding id is stored in all tables below the holding, so
+# that any query can be limited to a set of holdings. The element content itself
+# is stored as a binary snapshot (see snapshot) in the 'data' column: holdings,
+# consumer units & rooms without their children, agents & appliances as a whole.
+# Lifecycles & usage patterns are only stored as queryable rows, their content
+# being part of the parent agent / appliance.
+#
+# Objects shared between several parents (see util.flyweight) are stored once
+# per parent & are not shared any longer when read back.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import copy
+import sqlite3
+
+# internal
+from . import model
+from . import snapshot
+from .util import flyweight as flyweight
+from .util import lazy as lazy
+
+# 1. Global vars ===============================================================
+_store_version = 1
+
+# table name -> [(column name, column definition)]
+_tables = {
+    'meta': [('key', 'TEXT PRIMARY KEY'), ('value', 'BLOB')],
+    'holding': [('id', 'INTEGER PRIMARY KEY'), ('name', 'TEXT'),
+                ('pos', 'INTEGER'), ('data', 'BLOB')],
+    'consumer_unit': [('id', 'INTEGER PRIMARY KEY'),
+                      ('holding_id', 'INTEGER'), ('name', 'TEXT'),
+                      ('pos', 'INTEGER'), ('data', 'BLOB')],
+    'room': [('id', 'INTEGER PRIMARY KEY'), ('holding_id', 'INTEGER'),
+             ('cu_id', 'INTEGER'), ('name', 'TEXT'), ('pos', 'INTEGER'),
+             ('data', 'BLOB')],
+    'agent': [('id', 'INTEGER PRIMARY KEY'), ('holding_id', 'INTEGER'),
+              ('cu_id', 'INTEGER'), ('name', 'TEXT'), ('pos', 'INTEGER'),
+              ('data', 'BLOB')],
+    'lifecycle': [('id', 'INTEGER PRIMARY KEY'), ('holding_id', 'INTEGER'),
+                  ('agent_id', 'INTEGER'), ('name', 'TEXT'),
+                  ('habit_status', 'TEXT'), ('changeover_type', 'TEXT'),
+                  ('pos', 'INTEGER')],
+    'appliance': [('id', 'INTEGER PRIMARY KEY'), ('holding_id', 'INTEGER'),
+                  ('room_id', 'INTEGER'), ('name', 'TEXT'),
+                  ('appliance_class', 'TEXT'), ('pos', 'INTEGER'),
+                  ('data', 'BLOB')],
+    'usage_pattern': [('id', 'INTEGER PRIMARY KEY'),
+                      ('holding_id', 'INTEGER'), ('appliance_id', 'INTEGER'),
+                      ('name', 'TEXT'), ('demand_type', 'TEXT'),
+                      ('usage_length', 'REAL'), ('pos', 'INTEGER')],
+}
+
+# (table, column) pairs to index
+_indexes = [
+    ('holding', 'name'),
+    ('consumer_unit', 'holding_id'),
+    ('consumer_unit', 'name'),
+    ('room', 'holding_id'),
+    ('room', 'cu_id'),
+    ('room', 'name'),
+    ('agent', 'holding_id'),
+    ('agent', 'cu_id'),
+    ('agent', 'name'),
+    ('lifecycle', 'holding_id'),
+    ('lifecycle', 'agent_id'),
+    ('lifecycle', 'name'),
+    ('lifecycle', 'changeover_type'),
+    ('appliance', 'holding_id'),
+    ('appliance', 'room_id'),
+    ('appliance', 'name'),
+    ('appliance', 'appliance_class'),
+    ('usage_pattern', 'holding_id'),
+    ('usage_pattern', 'appliance_id'),
+    ('usage_pattern', 'name'),
+    ('usage_pattern', 'demand_type'),
+]
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ModelStore(object):
+
+    def __init__(self, fn: str):
+        """
+        Opens (or creates) a model store.
+
+        Inputs:
+        fn
+            SQLite database file, ':memory:' for an in-memory store
+        """
+
+        self.fn = fn  # database file
+        self.connection = sqlite3.connect(fn)  # open database connection
+
+        self._create_tables()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    @classmethod
+    def from_model(cls, mdl, fn: str):
+        """
+        Creates a model store holding the given model.
+
+        Inputs:
+        mdl
+            IOModel object to store
+        fn
+            SQLite database file to write
+        """
+
+        cls = ModelStore(fn)
+        cls.save_model(mdl)
+
+        return cls
+
+    def save_model(self, mdl):
+        """
+        Stores the given model, replacing any content of the store.
+
+        Inputs:
+        mdl
+            IOModel object to store
+        """
+
+        rows = {name: [] for name in _tables if name != 'meta'}
+
+        shell = _shell(mdl, 'holdings')
+        shell.registry = None  # elements aren't shared when read back
+
+        for pos_h, hold in enumerate(mdl.holdings):
+            hold = lazy.resolve(hold)
+            id_h = len(rows['holding']) + 1
+            rows['holding'].append(
+                (id_h, hold.id, pos_h, snapshot.dumps(_shell(hold, 'cu'))))
+
+            for pos_cu, cu in enumerate(hold.cu):
+                cu = lazy.resolve(cu)
+                id_cu = len(rows['consumer_unit']) + 1
+                rows['consumer_unit'].append(
+                    (id_cu, id_h, cu.id, pos_cu,
+                     snapshot.dumps(_shell(cu, 'agents', 'rooms'))))
+
+                for pos_a, agt in enumerate(cu.agents):
+                    id_a = len(rows['agent']) + 1
+                    rows['agent'].append((id_a, id_h, id_cu, agt.id, pos_a,
+                                          snapshot.dumps(agt)))
+
+                    for pos_l, lc in enumerate(agt.lifecycle):
+                        changeover_type = None
+                        if lc.probability is not None:
+                            changeover_type = lc.probability.type
+                        rows['lifecycle'].append(
+                            (len(rows['lifecycle']) + 1, id_h, id_a, lc.name,
+                             lc.habit_status, changeover_type, pos_l))
+
+                for pos_r, rm in enumerate(cu.rooms):
+                    id_r = len(rows['room']) + 1
+                    rows['room'].append(
+                        (id_r, id_h, id_cu, rm.name, pos_r,
+                         snapshot.dumps(_shell(rm, 'appliances'))))
+
+                    for pos_ap, app in enumerate(rm.appliances):
+                        id_ap = len(rows['appliance']) + 1
+                        rows['appliance'].append(
+                            (id_ap, id_h, id_r, app.name, app.appliance_class,
+                             pos_ap, snapshot.dumps(app)))
+
+                        for pos_p, pat in enumerate(app.usage_patterns):
+                            rows['usage_pattern'].append(
+                                (len(rows['usage_pattern']) + 1, id_h, id_ap,
+                                 pat.name, pat.demand_type, pat.usage_length,
+                                 pos_p))
+
+        with self.connection:
+            for name in _tables:
+                self.connection.execute(f'DELETE FROM {name}')
+
+            self.connection.executemany(
+                'INSERT INTO meta VALUES (?, ?)',
+                [('version', _store_version), ('model', snapshot.dumps(shell))])
+
+            for name, values in rows.items():
+                marks = ', '.join('?' * len(_tables[name]))
+                self.connection.executemany(
+                    f'INSERT INTO {name} VALUES ({marks})', values)
+
+    def load_model(self, holdings=None, holding_range=None):
+        """
+        Reads the stored model, optionally only a part of its holdings.
+
+        Inputs:
+        holdings
+            (Optional) list of the holding names to read
+        holding_range
+            (Optional) (first, last) holding names, reads all holdings
+            in between (inclusive, in model order)
+        """
+
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'model'").fetchone()
+        if row is None:
+            raise ValueError(f'Model store {self.fn} holds no model.')
+
+        mdl = snapshot.loads(row[0])
+        if not isinstance(mdl, model.IOModel):
+            raise TypeError(f'Model store {self.fn} holds no IOModel.')
+
+        where, params = self._holding_filter('holding', 'id', holdings,
+                                             holding_range)
+        mdl.holdings = [
+            self._load_holding(id_h, data) for id_h, data in
+            self.connection.execute(
+                f'SELECT id, data FROM holding {where} ORDER BY pos', params)
+        ]
+
+        return mdl
+
+    def load_holding(self, name: str):
+        """
+        Reads a single holding (with all its consumer units).
+
+        Inputs:
+        name
+            name of the holding
+        """
+
+        row = self.connection.execute(
+            'SELECT id, data FROM holding WHERE name = ?', (name, )).fetchone()
+        if row is None:
+            raise KeyError(f'Holding {name} not in model store {self.fn}.')
+
+        return self._load_holding(*row)
+
+    def holding_names(self):
+        return [
+            row[0] for row in self.connection.execute(
+                'SELECT name FROM holding ORDER BY pos')
+        ]
+
+    def appliances(self,
+                   name=None,
+                   appliance_class=None,
+                   holdings=None,
+                   holding_range=None):
+        """
+        Returns the IOAppliance objects matching all given criteria.
+
+        Inputs:
+        name
+            (Optional) appliance name or list of names
+        appliance_class
+            (Optional) appliance class or list of classes
+        holdings
+            (Optional) list of holding names to search in
+        holding_range
+            (Optional) (first, last) holding names, searches all holdings
+            in between (inclusive, in model order)
+        """
+
+        where, params = self._where('appliance', {
+            'name': name,
+            'appliance_class': appliance_class
+        }, holdings, holding_range)
+
+        return [
+            _load_element(row[0]) for row in self.connection.execute(
+                f'SELECT data FROM appliance {where} ORDER BY id', params)
+        ]
+
+    def agents(self,
+               name=None,
+               changeover_type=None,
+               holdings=None,
+               holding_range=None):
+        """
+        Returns the IOAgent objects matching all given criteria.
+
+        Inputs:
+        name
+            (Optional) agent name or list of names
+        changeover_type
+            (Optional) changeover time type (e.g. 'Gauss') or list of types,
+            of which at least one lifecycle of the agent has to use one
+        holdings
+            (Optional) list of holding names to search in
+        holding_range
+            (Optional) (first, last) holding names, searches all holdings
+            in between (inclusive, in model order)
+        """
+
+        where, params = self._where('agent', {'name': name}, holdings,
+                                    holding_range)
+
+        if changeover_type is not None:
+            where_lc, params_lc = self._where(
+                'lifecycle', {'changeover_type': changeover_type})
+            where = (where + ' AND ' if where else 'WHERE ') + \
+                f'id IN (SELECT agent_id FROM lifecycle {where_lc})'
+            params += params_lc
+
+        return [
+            _load_element(row[0]) for row in self.connection.execute(
+                f'SELECT data FROM agent {where} ORDER BY id', params)
+        ]
+
+    def columns(self,
+                table: str,
+                names: list,
+                holdings=None,
+                holding_range=None,
+                **criteria):
+        """
+        Returns column values of the rows of a table matching the criteria,
+        without reading any element data.
+
+        Example: columns('appliance', ['name', 'holding_id'],
+                         appliance_class='shower')
+
+        Inputs:
+        table
+            table name, e.g. 'appliance' or 'lifecycle'
+        names
+            list of the column names to return
+        holdings
+            (Optional) list of holding names to search in
+        holding_range
+            (Optional) (first, last) holding names, searches all holdings
+            in between (inclusive, in model order)
+        criteria
+            column name = value (or list of values) pairs to match
+
+        Returns:
+            dict of column name -> list of the column values
+        """
+
+        for name in names:
+            _check_column(table, name)
+
+        where, params = self._where(table, criteria, holdings, holding_range)
+        rows = self.connection.execute(
+            f'SELECT {", ".join(names)} FROM {table} {where} ORDER BY id',
+            params).fetchall()
+
+        return {name: [row[i] for row in rows] for i, name in enumerate(names)}
+
+    def _create_tables(self):
+
+        with self.connection:
+            for name, columns in _tables.items():
+                definition = ', '.join(f'{col} {kind}' for col, kind in columns)
+                self.connection.execute(
+                    f'CREATE TABLE IF NOT EXISTS {name} ({definition})')
+
+            for table, column in _indexes:
+                self.connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_{table}_{column} '
+                    f'ON {table} ({column})')
+
+    def _load_holding(self, id_h, data):
+
+        hold = snapshot.loads(data)
+        hold.cu = []
+        for id_cu, data_cu in self.connection.execute(
+                'SELECT id, data FROM consumer_unit WHERE holding_id = ? '
+                'ORDER BY pos', (id_h, )).fetchall():
+
+            cu = snapshot.loads(data_cu)
+            cu.agents = [
+                _load_element(row[0]) for row in self.connection.execute(
+                    'SELECT data FROM agent WHERE cu_id = ? ORDER BY pos',
+                    (id_cu, ))
+            ]
+            cu.rooms = []
+            for id_r, data_r in self.connection.execute(
+                    'SELECT id, data FROM room WHERE cu_id = ? ORDER BY pos',
+                (id_cu, )).fetchall():
+
+                rm = snapshot.loads(data_r)
+                rm.appliances = [
+                    _load_element(row[0]) for row in self.connection.execute(
+                        'SELECT data FROM appliance WHERE room_id = ? '
+                        'ORDER BY pos', (id_r, ))
+                ]
+                cu.rooms.append(rm)
+
+            hold.cu.append(cu)
+
+        return hold
+
+    def _where(self, table, criteria, holdings=None, holding_range=None):
+
+        clauses = []
+        params = []
+        for column, value in criteria.items():
+            if value is None:
+                continue
+
+            _check_column(table, column)
+            if isinstance(value, (list, tuple, set)):
+                value = list(value)
+                clauses.append(
+                    f'{column} IN ({", ".join("?" * len(value))})')
+                params += value
+            else:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+
+        column = 'id' if table == 'holding' else 'holding_id'
+        where_h, params_h = self._holding_filter(table, column, holdings,
+                                                 holding_range)
+        if where_h:
+            clauses.append(where_h[len('WHERE '):])
+            params += params_h
+
+        if len(clauses) == 0:
+            return '', []
+
+        return 'WHERE ' + ' AND '.join(clauses), params
+
+    def _holding_filter(self, table, column, holdings, holding_range):
+
+        clauses = []
+        params = []
+
+        if holdings is not None:
+            holdings = list(holdings)
+            clauses.append(f'{column} IN (SELECT id FROM holding WHERE name IN '
+                           f'({", ".join("?" * len(holdings))}))')
+            params += holdings
+
+        if holding_range is not None:
+            first, last = holding_range
+            positions = []
+            for name in (first, last):
+                row = self.connection.execute(
+                    'SELECT pos FROM holding WHERE name = ?',
+                    (name, )).fetchone()
+                if row is None:
+                    raise KeyError(
+                        f'Holding {name} not in model store {self.fn}.')
+                positions.append(row[0])
+
+            clauses.append(
+                f'{column} IN (SELECT id FROM holding WHERE pos BETWEEN ? AND ?)'
+            )
+            params += sorted(positions)
+
+        if len(clauses) == 0:
+            return '', []
+
+        return 'WHERE ' + ' AND '.join(clauses), params
+
+
+# 2. Functions =================================================================
+def _shell(obj, *children):
+    """
+    Returns a shallow copy of the given object without the given child lists.
+    """
+
+    obj = copy.copy(lazy.resolve(obj))
+    for name in children:
+        setattr(obj, name, [])
+
+    return obj
+
+
+def _load_element(data):
+    # shared agents & appliances are stored once per parent, see header
+    return flyweight.make_private(snapshot.loads(data))
+
+
+def _check_column(table, column):
+
+    if table not in _tables:
+        raise ValueError(f'Unknown model store table {table}.')
+
+    if column not in [col for col, _ in _tables[table]]:
+        raise ValueError(f'Unknown column {column} of table {table}.')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
@@ -0,0 +1,325 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Parameter-delta overlays of optimisation candidates.
+#
+# An MOEA candidate differs from its base model only in the values inserted
+# via IOModel.moea_insert_vector. Instead of writing the full model of each
+# candidate, an overlay stores the fingerprint of the base model and the
+# candidate's parameter vector, either dense or as a sparse patch of the
+# changed positions (vector index -> value):
+#
+#   magic (8 bytes) | version (uint32) | flags (uint32)
+#   | vector length (uint64) | number of entries (uint64)
+#   | base fingerprint (20 bytes) | indices (int64, sparse only)
+#   | values (float64)
+#
+# A BaseModel keeps the base model in memory and applies overlays to it via
+# its parameter layout (see parameter_layout). As inserting sets every
+# parameter of the model, the result does not depend on previously applied
+# overlays.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import array
+import hashlib
+import struct
+import sys
+
+# internal
+from . import parameter_layout as parameter_layout
+
+# 1. Global vars ===============================================================
+_magic = b'HUUMOVLY'
+_version = 1
+_flag_sparse = 1
+_flag_no_ts_adjustment = 2
+
+_header = struct.Struct('<8sIIQQ20s')
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class Overlay(object):
+    # Parameter vector of one candidate, relative to a base model.
+
+    def __init__(self,
+                 fingerprint: bytes,
+                 length: int,
+                 values,
+                 indices=None,
+                 timeseries_adjustment: bool = True):
+
+        self.fingerprint = fingerprint  # sha1 digest of the base model
+        self.length = length  # length of the full parameter vector
+        self.values = values  # array of float64 values
+        self.indices = indices  # array of int64 positions, None if dense
+        self.timeseries_adjustment = timeseries_adjustment
+
+    @classmethod
+    def from_vector(cls, base, vec, sparse: bool = None):
+        """
+        Creates the overlay of a candidate vector.
+
+        Inputs:
+
+        base
+            BaseModel the vector belongs to.
+        vec
+            Parameter vector of the candidate (any sequence of numbers).
+        sparse
+            (bool) Whether only the positions differing from the base vector
+            are stored. Default: whichever is smaller.
+        """
+
+        if len(vec) != len(base.vec_var):
+            raise ValueError(
+                f'overlay: vector length {len(vec)} does not match the base '
+                f'model ({len(base.vec_var)})')
+
+        changed = [i for i, (x, x_base) in enumerate(zip(vec, base.vec_var))
+                   if x != x_base]
+
+        # sparse entries take 16 bytes (index & value), dense ones 8
+        if sparse is None:
+            sparse = 16 * len(changed) < 8 * len(vec)
+
+        if sparse:
+            indices = array.array('q', changed)
+            values = array.array('d', [vec[i] for i in changed])
+        else:
+            indices = None
+            values = array.array('d', vec)
+
+        return Overlay(base.fingerprint, len(vec), values, indices,
+                       base.timeseries_adjustment)
+
+    def is_sparse(self):
+        return self.indices is not None
+
+    def to_vector(self, vec_base):
+        """
+        Returns the full parameter vector of the candidate.
+
+        Inputs:
+
+        vec_base
+            Parameter vector of the base model. Unchanged positions keep the
+            base values, including their number type.
+        """
+
+        if len(vec_base) != self.length:
+            raise ValueError(
+                f'overlay: base vector length {len(vec_base)} does not match '
+                f'the overlay ({self.length})')
+
+        vec = list(vec_base)
+        if self.is_sparse():
+            for i, x in zip(self.indices, self.values):
+                vec[i] = x
+        else:
+            for i, x in enumerate(self.values):
+                if x != vec[i]:
+                    vec[i] = x
+
+        return vec
+
+    def dumps(self):
+        """
+        Returns the overlay as bytes.
+        """
+
+        flags = 0
+        indices = self.indices
+        if indices is not None:
+            flags |= _flag_sparse
+        else:
+            indices = array.array('q')
+        if not self.timeseries_adjustment:
+            flags |= _flag_no_ts_adjustment
+
+        values = array.array('d', self.values)
+        indices = array.array('q', indices)
+        if sys.byteorder != 'little':
+            values.byteswap()
+            indices.byteswap()
+
+        header = _header.pack(_magic, _version, flags, self.length,
+                              len(values), self.fingerprint)
+
+        return b''.join([header, indices.tobytes(), values.tobytes()])
+
+    @classmethod
+    def loads(cls, data):
+        """
+        Restores an overlay from bytes.
+
+        Inputs:
+
+        data
+            (bytes) Overlay content.
+        """
+
+        view = memoryview(data)
+        if len(view) < _header.size:
+            raise ValueError('overlay: data too short')
+
+        magic, version, flags, length, num, fingerprint = _header.unpack(
+            view[:_header.size])
+        if magic != _magic:
+            raise ValueError('overlay: not a HUUM parameter overlay')
+        if version != _version:
+            raise ValueError(f'overlay: unsupported format version {version}')
+
+        pos = _header.size
+        indices = None
+        if flags & _flag_sparse:
+            indices = array.array('q')
+            indices.frombytes(view[pos:pos + 8 * num])
+            pos += 8 * num
+
+        values = array.array('d')
+        values.frombytes(view[pos:pos + 8 * num])
+        if len(values) != num:
+            raise ValueError('overlay: data truncated')
+
+        if sys.byteorder != 'little':
+            values.byteswap()
+            if indices is not None:
+                indices.byteswap()
+
+        return Overlay(fingerprint, length, values, indices,
+                       not flags & _flag_no_ts_adjustment)
+
+    def save(self, fn: str):
+        with open(fn, 'wb') as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, fn: str):
+        with open(fn, 'rb') as f:
+            return Overlay.loads(f.read())
+
+
+class BaseModel(object):
+    # Base model of a set of overlays, kept in memory.
+
+    def __init__(self, io_model, timeseries_adjustment: bool = True):
+        """
+        Inputs:
+
+        io_model
+            IOModel object in its base state. It is changed in place when
+            applying overlays.
+        timeseries_adjustment
+            (bool) As for moea_gen_vectors.
+        """
+
+        self.model = io_model
+        self.timeseries_adjustment = timeseries_adjustment
+        self.fingerprint = fingerprint(io_model)
+
+        self.layout = parameter_layout.ParameterLayout.compile(
+            io_model, timeseries_adjustment)
+        self.vec_var, self.vec_boundary, self.vec_epsilon = \
+            self.layout.vectors()
+
+    def make_overlay(self, vec, sparse: bool = None):
+        """
+        Returns the overlay of a candidate vector (see Overlay.from_vector).
+        """
+        return Overlay.from_vector(self, vec, sparse)
+
+    def save_overlay(self, fn: str, vec, sparse: bool = None):
+        """
+        Writes the overlay of a candidate vector to a file.
+        """
+        self.make_overlay(vec, sparse).save(fn)
+
+    def apply(self, overlay):
+        """
+        Inserts the parameters of an overlay into the base model, returning
+        the model.
+
+        Inputs:
+
+        overlay
+            Overlay object or overlay file name.
+        """
+
+        if isinstance(overlay, str):
+            overlay = Overlay.load(overlay)
+
+        if overlay.fingerprint != self.fingerprint:
+            raise ValueError('overlay: created for a different base model')
+        if overlay.timeseries_adjustment != self.timeseries_adjustment:
+            raise ValueError(
+                'overlay: created with a different timeseries_adjustment')
+
+        self.layout.insert(overlay.to_vector(self.vec_var))
+
+        return self.model
+
+    def reset(self):
+        """
+        Restores the base state of the model, returning it.
+        """
+
+        self.layout.insert(self.vec_var)
+
+        return self.model
+
+
+# 2. Functions =================================================================
+def fingerprint(io_model):
+    """
+    Returns the sha1 digest identifying the content of a model, computed over
+    its rendered model files.
+
+    Inputs:
+
+    io_model
+        IOModel object.
+    """
+
+    digest = hashlib.sha1()
+    for path, render in io_model.iter_documents('model.yaml'):
+        digest.update(path.encode('utf-8') + b'\0')
+        digest.update(render().encode('utf-8') + b'\0')
+
+    return digest.digest()
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
@@ -0,0 +1,744 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Precomputed flat layout of the optimisation vector.
+#
+# IOModel.moea_gen_vectors builds the vectors by concatenating lists on every
+# level of the model tree. ParameterLayout.compile() walks the tree once and
+# records the offset & length of every element in the vector, keeping values,
+# lower/upper bounds & epsilons as NumPy arrays. Afterwards, fill() regenerates
+# the vectors by asking only the elements directly holding parameters (the
+# "blocks", e.g. lifecycles, usage patterns & storages) for their values and
+# writing them into the flat arrays in one pass.
+#
+# The file level elements list their parts via moea_parts(), in the order of
+# their moea_gen_vectors methods. Compiling also sets the data extends used by
+# moea_insert_vector, so a compiled model can take vectors right away.
+#
+# insert() is the flat counterpart of moea_insert_vector: the elements list
+# their parameters as setter slots via moea_slots() (target object, attribute
+# names & length), which get resolved once to absolute offsets. Inserting a
+# candidate then is a single loop over the slots assigning the values (see
+# BaseMOEA.moea_assign), without slicing the vector on every level of the
+# tree. Elements transforming their values on insert (usage patterns,
+# templates & translators) give a writer function instead of the attribute
+# names, taking the values & the offset of their block.
+#
+# The bounds & epsilons of moea_gen_vectors are relative to the current values.
+# A frozen layout (freeze()) keeps those of the baseline model, fill() then
+# only updates the values. save() stores a frozen layout next to the model
+# (<model file>.layout.npz, see layout_file()), load() attaches it to the
+# model again by walking the structure only, without generating any vectors.
+# As the blocks set the data extends of their own parts (e.g. the rates of a
+# storage) only when generating vectors, those are saved & restored as well.
+# load_or_compile() does either, as needed.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import hashlib
+import logging
+import os
+
+import numpy as np
+
+# internal
+from . import consumer_unit as consumer_unit
+from . import room as room
+from .elements import common_parts as common_parts
+from .util import base_optimisation as base_optimisation
+from .util import flyweight as flyweight
+from .util import lazy as lazy
+
+# 1. Global vars ===============================================================
+mod_logger = logging.getLogger(__name__)
+
+_bound_shift = 0.1e-13  # upper bound used for identical bounds
+_layout_suffix = '.layout.npz'  # file name suffix, next to the model file
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ParameterLayout(object):
+    # Flat optimisation vector of one model (or any file level element).
+
+    def __init__(self):
+
+        self.root = None  # element the layout was compiled for
+        self.timeseries_adjustment = True
+        self.vec_debug = False  # see compile()
+        self.frozen = False  # bounds & epsilons fixed, see freeze()
+
+        # parameter data, one entry per vector position
+        self.values = np.zeros(0)
+        self.lower = np.zeros(0)
+        self.upper = np.zeros(0)
+        self.epsilon = np.zeros(0)
+        self.is_int = np.zeros(0, dtype=bool)  # values given as int
+
+        # all elements in depth first order, with their part of the vector
+        self.nodes = []
+        self.node_offset = np.zeros(0, dtype=np.int64)
+        self.node_length = np.zeros(0, dtype=np.int64)
+
+        # elements holding parameters themselves, see fill()
+        self.blocks = []  # (element, timeseries_adjustment)
+        self.block_offset = np.zeros(0, dtype=np.int64)
+        self.block_length = np.zeros(0, dtype=np.int64)
+
+        # data extends of the parts within the blocks (-1: not set), restored
+        # when relinking a loaded layout, see save()
+        self.part_length = None
+
+        self._index = {}  # id(element) -> position in nodes
+        self._slots = None  # setter slots for insert(), built on first use
+
+    @classmethod
+    def compile(cls,
+                root,
+                timeseries_adjustment: bool = True,
+                vec_debug: bool = False):
+        """
+        Walks the model tree once and builds the layout.
+
+        Inputs:
+
+        root
+            IOModel (or holding, consumer unit, ...) object.
+        timeseries_adjustment
+            (bool) As for moea_gen_vectors.
+        vec_debug
+            (bool) As for moea_gen_vectors, the elements of the layout
+            remember the offset, length & checksum of their part of the vector.
+        """
+
+        cls = ParameterLayout()
+        cls.root = root
+        cls.timeseries_adjustment = timeseries_adjustment
+        cls.vec_debug = vec_debug
+        cls._build()
+
+        return cls
+
+    @classmethod
+    def load(cls, fn, root):
+        """
+        Loads a layout saved via save() and attaches it to the given model,
+        without generating any vectors. The layout is frozen.
+
+        Inputs:
+
+        fn
+            (string) File to load.
+        root
+            IOModel (or other element) the layout was compiled for, in the
+            same structure.
+        """
+
+        cls = ParameterLayout()
+        cls.root = root
+        cls.frozen = True
+
+        with np.load(fn) as data:
+            cls.timeseries_adjustment = bool(data['timeseries_adjustment'])
+            cls.values = data['values']
+            cls.lower = data['lower']
+            cls.upper = data['upper']
+            cls.epsilon = data['epsilon']
+            cls.is_int = data['is_int']
+            cls.node_offset = data['node_offset']
+            cls.node_length = data['node_length']
+            signature = str(data['signature'])
+            if 'part_length' not in data:
+                raise ValueError(
+                    f'ParameterLayout.load: {fn} lacks the data extends of '
+                    'the block parts.')
+            cls.part_length = data['part_length']
+
+        cls._relink()
+        if cls._signature() != signature:
+            raise ValueError(
+                f'ParameterLayout.load: {fn} does not match the structure of '
+                'the model.')
+
+        return cls
+
+    def save(self, fn):
+        """
+        Saves the layout (values, bounds & epsilons plus the structure) as
+        NumPy .npz file, freezing it.
+
+        Inputs:
+
+        fn
+            (string) File to write, e.g. layout_file(io_model).
+        """
+
+        self.freeze()
+        self.part_length = np.array(
+            [-1 if length is None else length for length in
+             (part.get_data_extend() for part in self._iter_block_parts())],
+            dtype=np.int64)
+
+        np.savez_compressed(fn,
+                            timeseries_adjustment=self.timeseries_adjustment,
+                            values=self.values,
+                            lower=self.lower,
+                            upper=self.upper,
+                            epsilon=self.epsilon,
+                            is_int=self.is_int,
+                            node_offset=self.node_offset,
+                            node_length=self.node_length,
+                            part_length=self.part_length,
+                            signature=self._signature())
+
+    def freeze(self):
+        """
+        Keeps the current bounds & epsilons as baseline, fill() only updates
+        the values from then on. Returns the layout.
+        """
+
+        self.frozen = True
+
+        return self
+
+    def fill(self):
+        """
+        Regenerates values, bounds & epsilons (only the values, if frozen)
+        from the current state of the model, returning the values.
+        """
+
+        self._set_data(self._gen_blocks(range(len(self.blocks))))
+        self._set_vec_checks()
+
+        return self.values
+
+    def insert(self, vec):
+        """
+        Inserts a vector into the model, as moea_insert_vector does, but
+        scattering the values directly into the parameter attributes via the
+        precomputed setter slots instead of slicing the vector on every level.
+
+        Inputs:
+
+        vec
+            NumPy array, memoryview or list with one value per parameter.
+        """
+
+        if len(vec) != len(self.values):
+            raise ValueError(
+                f'ParameterLayout.insert: vector of length {len(vec)} given, '
+                f'the layout has {len(self.values)} parameters.')
+
+        # one conversion to Python numbers, instead of one per value
+        values = vec.tolist() if hasattr(vec, 'tolist') else vec
+
+        _insert_slots(self.get_slots(), values)
+
+    def subset(self, indices):
+        """
+        Returns a ParameterSubset working on the given parameters only.
+
+        Inputs:
+
+        indices
+            Positions of the selected parameters, e.g. from
+            ParameterSelection.indices().
+        """
+        return ParameterSubset(self, indices)
+
+    def get_slots(self):
+        """
+        Returns the setter slots of the layout as (target, attribute names
+        or writer function, offset, length), detaching shared elements on
+        first use.
+        """
+
+        if self._slots is None:
+            if self._detach_shared():
+                self._relink()
+            self._slots = self._build_slots()
+
+        return self._slots
+
+    def vectors(self):
+        """
+        Returns vec_var, vec_boundary & vec_epsilon as lists, as given by
+        moea_gen_vectors.
+        """
+
+        vec_var = self.values.tolist()
+        for i in np.flatnonzero(self.is_int):
+            if vec_var[i].is_integer():
+                vec_var[i] = int(vec_var[i])
+
+        return (vec_var, np.stack([self.lower, self.upper], axis=1).tolist(),
+                self.epsilon.tolist())
+
+    def bounds(self):
+        """
+        Returns the bounds as array of shape (number of parameters, 2).
+        """
+        return np.stack([self.lower, self.upper], axis=1)
+
+    def node_slice(self, element):
+        """
+        Returns the slice of the vector belonging to the given element.
+        """
+
+        i = self._index.get(id(element))
+        if i is None:
+            raise KeyError(f'{type(element).__name__} is not in the layout.')
+
+        offset = int(self.node_offset[i])
+
+        return slice(offset, offset + int(self.node_length[i]))
+
+    def __len__(self):
+        return len(self.values)
+
+    def _build(self):
+
+        self.nodes = []
+        self.blocks = []
+        self._index = {}
+        self._slots = None
+
+        offsets = []
+        lengths = []
+        data = ([], [], [])
+        self._walk(self.root, self.timeseries_adjustment, offsets, lengths,
+                   data)
+
+        self.node_offset = np.array(offsets, dtype=np.int64)
+        self.node_length = np.array(lengths, dtype=np.int64)
+
+        i_blocks = [self._index[id(element)] for element, _ in self.blocks]
+        self.block_offset = self.node_offset[i_blocks]
+        self.block_length = self.node_length[i_blocks]
+
+        self.is_int = np.array([type(x) is int for x in data[0]], dtype=bool)
+        self._set_data(data)
+        self._set_vec_checks()
+
+    def _gen_blocks(self, i_blocks):
+
+        data = ([], [], [])
+        for i in i_blocks:
+            element, ts = self.blocks[i]
+            num = len(data[0])
+            _gen_block(element, ts, data, self.vec_debug)
+            if len(data[0]) - num != self.block_length[i]:
+                raise ValueError(
+                    'ParameterLayout.fill: the number of parameters of '
+                    f'{type(element).__name__} changed, recompile the layout.')
+
+        return data
+
+    def _set_vec_checks(self):
+        # for vec_debug: offset, length & checksum of every element's part
+
+        if not self.vec_debug:
+            return
+
+        for element, offset, length in zip(self.nodes,
+                                           self.node_offset.tolist(),
+                                           self.node_length.tolist()):
+            element.set_vec(self.values[offset:offset + length], offset)
+
+    def _detach_shared(self):
+        # shared agents & appliances get private copies before the first
+        # insert, as in their containers moea_insert_vector
+
+        detached = False
+        for element in self.nodes:
+            if isinstance(element, consumer_unit.IOConsumerUnit):
+                for i, daemon in enumerate(element.agents):
+                    if flyweight.is_shared(daemon):
+                        element.detach_agent(i)
+                        detached = True
+
+            elif isinstance(element, room.IORoom):
+                for i, item in enumerate(element.appliances):
+                    if flyweight.is_shared(item):
+                        element.detach_appliance(i)
+                        detached = True
+
+        return detached
+
+    def _build_slots(self):
+
+        slots = []
+        for (element, ts), offset, length in zip(self.blocks,
+                                                 self.block_offset.tolist(),
+                                                 self.block_length.tolist()):
+            num = 0
+            parts = element.moea_slots() if ts is None else element.moea_slots(
+                ts)
+            for target, names, num_part in parts:
+                slots.append((target, names, offset + num, num_part))
+                num += num_part
+
+            if num != length:
+                raise ValueError(
+                    'ParameterLayout: the setter slots of '
+                    f'{type(element).__name__} cover {num} instead of '
+                    f'{length} parameters.')
+
+        return slots
+
+    def _relink(self):
+        # (re-)collects the elements of the layout without generating vectors,
+        # taking their lengths from node_length
+
+        self.nodes = []
+        self.blocks = []
+        self._index = {}
+        self._slots = None
+
+        lengths = iter(self.node_length.tolist())
+        try:
+            self._attach(self.root, self.timeseries_adjustment, lengths)
+        except StopIteration:
+            raise ValueError('ParameterLayout: the model has more elements '
+                             'than the layout.') from None
+
+        if len(self.nodes) != len(self.node_length):
+            raise ValueError('ParameterLayout: the model has less elements '
+                             'than the layout.')
+
+        i_blocks = [self._index[id(element)] for element, _ in self.blocks]
+        self.block_offset = self.node_offset[i_blocks]
+        self.block_length = self.node_length[i_blocks]
+
+        if self.part_length is not None:
+            self._restore_part_lengths()
+
+    def _iter_block_parts(self):
+        # the parts within all blocks, depth first
+
+        for element, _ in self.blocks:
+            yield from _iter_parts_nested(element)
+
+    def _restore_part_lengths(self):
+
+        parts = list(self._iter_block_parts())
+        if len(parts) != len(self.part_length):
+            raise ValueError(
+                'ParameterLayout: the blocks of the model have '
+                f'{len(parts)} instead of {len(self.part_length)} parts.')
+
+        for part, length in zip(parts, self.part_length.tolist()):
+            part.set_data_extend(None if length < 0 else length)
+
+    def _attach(self, element, ts, lengths):
+        # as _walk, for the structure only
+
+        if lazy.is_proxy(element):
+            element = lazy.resolve(element)
+
+        self._index[id(element)] = len(self.nodes)
+        self.nodes.append(element)
+        element.set_data_extend(next(lengths))
+
+        if isinstance(element, common_parts.CommonParts):
+            parts = element.moea_parts() if ts is None else element.moea_parts(
+                ts)
+            for part, ts_part in parts:
+                self._attach(part, ts_part, lengths)
+        else:
+            self.blocks.append((element, ts))
+
+    def _signature(self):
+        # digest of the structure: kinds, names & lengths of all elements
+
+        digest = hashlib.sha1()
+        for element, length in zip(self.nodes, self.node_length.tolist()):
+            digest.update(f'{type(element).__name__}|{element.moea_segment()}'
+                          f'|{length}\n'.encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def _walk(self, element, ts, offsets, lengths, data):
+
+        if lazy.is_proxy(element):
+            element = lazy.resolve(element)
+
+        i_node = len(self.nodes)
+        self.nodes.append(element)
+        self._index[id(element)] = i_node
+        offsets.append(len(data[0]))
+        lengths.append(0)
+
+        if isinstance(element, common_parts.CommonParts):
+            parts = element.moea_parts() if ts is None else element.moea_parts(
+                ts)
+            for part, ts_part in parts:
+                self._walk(part, ts_part, offsets, lengths, data)
+        else:
+            self.blocks.append((element, ts))
+            _gen_block(element, ts, data, self.vec_debug)
+
+        lengths[i_node] = len(data[0]) - offsets[i_node]
+        element.set_data_extend(lengths[i_node])
+
+    def _set_data(self, data, positions=None):
+        # positions: where the data goes, None for replacing all of it
+
+        vec_var, vec_boundary, vec_epsilon = data
+
+        values = np.array(vec_var, dtype=np.float64)
+        if self.frozen:
+            if positions is None:
+                self.values = values
+            else:
+                self.values[positions] = values
+            return
+
+        epsilon = np.array(vec_epsilon, dtype=np.float64)
+
+        bounds = np.array(vec_boundary, dtype=np.float64).reshape(-1, 2)
+        lower = bounds[:, 0].copy()
+        upper = bounds[:, 1].copy()
+
+        # as in IOModel.moea_gen_vectors: identical bounds are shifted, the
+        # wrong way around is an error
+        same = lower == upper
+        lower[same] = 0.0
+        upper[same] = _bound_shift
+
+        wrong = np.flatnonzero(lower > upper)
+        if len(wrong) > 0:
+            i = int(wrong[0])
+            raise ValueError(
+                'ParameterLayout: generated boundary pair has the lower bound '
+                'bigger than upper at '
+                f'{i if positions is None else positions[i]}: '
+                f'{lower[i]} > {upper[i]}')
+
+        if positions is None:
+            self.values = values
+            self.epsilon = epsilon
+            self.lower = lower
+            self.upper = upper
+        else:
+            self.values[positions] = values
+            self.epsilon[positions] = epsilon
+            self.lower[positions] = lower
+            self.upper[positions] = upper
+
+
+class ParameterSubset(object):
+    # Selected parameters of a layout, for a reduced optimisation vector.
+    #
+    # The parameters not selected keep the values of the layout (as of
+    # compiling or the last fill()) on insert.
+
+    def __init__(self, layout, indices):
+
+        self.layout = layout
+        self.indices = np.unique(np.asarray(indices, dtype=np.int64))
+
+        if len(self.indices) > 0 and (self.indices[0] < 0 or
+                                      self.indices[-1] >= len(layout)):
+            raise ValueError(
+                'ParameterSubset: selected positions out of range of the '
+                f'layout with {len(layout)} parameters.')
+
+        # blocks holding selected parameters
+        i_blocks = np.searchsorted(
+            layout.block_offset, self.indices, side='right') - 1
+        self.i_blocks = np.unique(i_blocks).tolist()
+
+        self._positions = None  # vector positions of the blocks, see fill()
+        self._slots = None  # setter slots holding selected parameters
+
+    @property
+    def values(self):
+        return self.layout.values[self.indices]
+
+    @property
+    def lower(self):
+        return self.layout.lower[self.indices]
+
+    @property
+    def upper(self):
+        return self.layout.upper[self.indices]
+
+    @property
+    def epsilon(self):
+        return self.layout.epsilon[self.indices]
+
+    def bounds(self):
+        return np.stack([self.lower, self.upper], axis=1)
+
+    def fill(self):
+        """
+        Regenerates values, bounds & epsilons of the blocks holding selected
+        parameters only, returning the selected values.
+        """
+
+        layout = self.layout
+        if self._positions is None:
+            self._positions = np.concatenate([
+                np.arange(layout.block_offset[i],
+                          layout.block_offset[i] + layout.block_length[i])
+                for i in self.i_blocks
+            ] + [np.zeros(0, dtype=np.int64)])
+
+        layout._set_data(layout._gen_blocks(self.i_blocks), self._positions)
+        layout._set_vec_checks()
+
+        return self.values
+
+    def insert(self, vec):
+        """
+        Inserts a vector of the selected parameters into the model, touching
+        only the setter slots holding them.
+
+        Inputs:
+
+        vec
+            NumPy array, memoryview or list with one value per selected
+            parameter.
+        """
+
+        if len(vec) != len(self.indices):
+            raise ValueError(
+                f'ParameterSubset.insert: vector of length {len(vec)} given, '
+                f'{len(self.indices)} parameters are selected.')
+
+        if self._slots is None:
+            slots = self.layout.get_slots()
+            offsets = np.array([slot[2] for slot in slots], dtype=np.int64)
+            lengths = np.array([slot[3] for slot in slots], dtype=np.int64)
+            hits = (np.searchsorted(self.indices, offsets + lengths) -
+                    np.searchsorted(self.indices, offsets))
+            self._slots = [slots[i] for i in np.flatnonzero(hits > 0)]
+
+        values = self.layout.values.copy()
+        values[self.indices] = vec
+
+        _insert_slots(self._slots, values.tolist())
+
+    def __len__(self):
+        return len(self.indices)
+
+
+# 2. Functions =================================================================
+def layout_file(io_model):
+    """
+    Returns the path of the saved layout of a model loaded from files, next
+    to the model file: <model root>/<model file>.layout.npz.
+
+    Inputs:
+
+    io_model
+        IOModel object, loaded from files.
+    """
+
+    if io_model.source is None or io_model.dir_root is None:
+        raise ValueError('layout_file: the model was not loaded from files.')
+
+    fn = os.path.splitext(io_model.source[0])[0] + _layout_suffix
+
+    return os.path.join(io_model.dir_root, fn)
+
+
+def load_or_compile(io_model, timeseries_adjustment: bool = True, fn=None):
+    """
+    Returns the frozen layout of a model, loading it from the saved layout if
+    present & matching the model, compiling and saving it otherwise.
+
+    Inputs:
+
+    io_model
+        IOModel object.
+    timeseries_adjustment
+        (bool) As for moea_gen_vectors.
+    fn
+        (string) Layout file, defaults to layout_file(io_model).
+    """
+
+    if fn is None:
+        fn = layout_file(io_model)
+
+    if os.path.isfile(fn):
+        try:
+            layout = ParameterLayout.load(fn, io_model)
+            if layout.timeseries_adjustment == timeseries_adjustment:
+                return layout
+            mod_logger.info(f'parameter_layout: recompiling {fn}, '
+                            'different timeseries_adjustment.')
+
+        except ValueError as err:
+            mod_logger.warning(f'parameter_layout: recompiling {fn}: {err}')
+
+    layout = ParameterLayout.compile(io_model, timeseries_adjustment)
+    layout.save(fn)
+
+    return layout
+
+
+def _insert_slots(slots, values):
+
+    for target, names, offset, length in slots:
+        if type(names) is tuple:
+            target.moea_assign(names, values, offset)
+        elif names is None:
+            target.moea_insert_vector(values[offset:offset + length])
+        else:
+            names(values, offset)
+
+
+def _iter_parts_nested(element):
+
+    for part in base_optimisation.iter_parts(element):
+        yield part
+        yield from _iter_parts_nested(part)
+
+
+def _gen_block(element, ts, data, vec_debug=False):
+
+    if ts is None:
+        triple = element.moea_gen_vectors(vec_debug)
+    else:
+        triple = element.moea_gen_vectors(vec_debug, ts)
+
+    data[0].extend(triple[0])
+    data[1].extend(triple[1])
+    data[2].extend(triple[2])
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
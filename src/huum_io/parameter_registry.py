@@ -0,0 +1,270 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Named parameter paths for the optimisation vector.
+#
+# ParameterRegistry gives every position of the vector of
+# IOModel.moea_gen_vectors a stable hierarchical path, built from the path
+# segments of the elements (see BaseMOEA.moea_segment) and the parameter names
+# of the elements holding parameters (moea_names), e.g.
+#
+#   H12/CU3/agent:anna/lifecycle:sleep/changeover.mu
+#   H12/CU3/room:bathroom/appliance:shower/pattern:p1/usage_t[2]
+#
+# Paths of time & table lists name the vector entries, i.e. usage_t[2] is the
+# delta between usage_t[1] and usage_t[2] as in moea_gen_vectors. Should two
+# parameters end up with the same path (e.g. elements of the same name), the
+# later ones get '#<n>' appended.
+#
+# Lookups in both directions are O(1). select() takes glob patterns (as
+# fnmatch, '*' also matches '/') and returns index arrays, to be used with the
+# arrays of a ParameterLayout.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import csv
+import fnmatch
+import re
+
+import numpy as np
+
+# internal
+from .elements import common_parts as common_parts
+from .util import lazy as lazy
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ParameterRegistry(object):
+    # Path of every position of the optimisation vector.
+
+    def __init__(self):
+
+        self.paths = []  # path by vector position
+        self._lookup = {}  # path -> vector position
+
+    @classmethod
+    def compile(cls, root, timeseries_adjustment: bool = True):
+        """
+        Walks the model tree and names all parameters, in the order of
+        moea_gen_vectors.
+
+        Inputs:
+
+        root
+            IOModel (or holding, consumer unit, ...) object.
+        timeseries_adjustment
+            (bool) As for moea_gen_vectors.
+        """
+
+        cls = ParameterRegistry()
+        cls._walk(root, timeseries_adjustment, '')
+
+        return cls
+
+    @classmethod
+    def from_layout(cls, layout):
+        """
+        Names the parameters of a compiled ParameterLayout.
+
+        Inputs:
+
+        layout
+            ParameterLayout object.
+        """
+
+        cls = ParameterRegistry.compile(layout.root,
+                                        layout.timeseries_adjustment)
+        if len(cls) != len(layout):
+            raise ValueError(
+                f'ParameterRegistry: {len(cls)} names for the {len(layout)} '
+                'parameters of the layout, recompile the layout.')
+
+        return cls
+
+    @classmethod
+    def from_paths(cls, paths):
+
+        cls = ParameterRegistry()
+        for path in paths:
+            cls._add(str(path))
+
+        return cls
+
+    @classmethod
+    def load_npz(cls, fn):
+        """
+        Loads the paths saved via save_npz().
+        """
+
+        with np.load(fn) as data:
+            return ParameterRegistry.from_paths(data['paths'].tolist())
+
+    def path(self, index):
+        return self.paths[index]
+
+    def index(self, path):
+
+        i = self._lookup.get(path)
+        if i is None:
+            raise KeyError(f'Unknown parameter path {path}.')
+
+        return i
+
+    def select(self, *patterns):
+        """
+        Returns the (sorted) positions of all parameters matching any of the
+        given glob patterns as int array.
+
+        Inputs:
+
+        patterns
+            (string) fnmatch style patterns, e.g. '*/lifecycle:sleep/*.mu' or
+            'H1/*/usage_t[[]*]' (brackets need escaping as '[[]').
+        """
+
+        regex = re.compile('|'.join(fnmatch.translate(p) for p in patterns))
+        match = regex.match
+
+        return np.array([i for i, path in enumerate(self.paths) if match(path)],
+                        dtype=np.int64)
+
+    def to_csv(self, fn, layout=None):
+        """
+        Writes the paths as CSV file, with the values, bounds & epsilons of
+        the layout if given.
+
+        Inputs:
+
+        fn
+            (string) File to write.
+        layout
+            ParameterLayout object matching the registry, or None.
+        """
+
+        columns = [range(len(self.paths)), self.paths]
+        header = ['index', 'path']
+        if layout is not None:
+            self._check_layout(layout)
+            columns += [
+                layout.values.tolist(),
+                layout.lower.tolist(),
+                layout.upper.tolist(),
+                layout.epsilon.tolist()
+            ]
+            header += ['value', 'lower', 'upper', 'epsilon']
+
+        with open(fn, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(zip(*columns))
+
+    def save_npz(self, fn, layout=None):
+        """
+        Saves the paths as NumPy .npz file ('paths'), with the values, bounds
+        & epsilons of the layout if given.
+
+        Inputs:
+
+        fn
+            (string) File to write.
+        layout
+            ParameterLayout object matching the registry, or None.
+        """
+
+        arrays = {'paths': np.array(self.paths, dtype=str)}
+        if layout is not None:
+            self._check_layout(layout)
+            arrays.update(values=layout.values,
+                          lower=layout.lower,
+                          upper=layout.upper,
+                          epsilon=layout.epsilon)
+
+        np.savez_compressed(fn, **arrays)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __contains__(self, path):
+        return path in self._lookup
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def _check_layout(self, layout):
+
+        if len(layout) != len(self.paths):
+            raise ValueError(
+                f'ParameterRegistry: layout has {len(layout)} parameters, '
+                f'the registry {len(self.paths)}.')
+
+    def _add(self, path):
+
+        if path in self._lookup:
+            n = 2
+            while f'{path}#{n}' in self._lookup:
+                n += 1
+            path = f'{path}#{n}'
+
+        self._lookup[path] = len(self.paths)
+        self.paths.append(path)
+
+    def _walk(self, element, ts, prefix):
+
+        if lazy.is_proxy(element):
+            element = lazy.resolve(element)
+
+        segment = element.moea_segment()
+        if segment is not None:
+            prefix = f'{prefix}{segment}/'
+
+        if isinstance(element, common_parts.CommonParts):
+            parts = element.moea_parts() if ts is None else element.moea_parts(
+                ts)
+            for part, ts_part in parts:
+                self._walk(part, ts_part, prefix)
+        else:
+            names = element.moea_names() if ts is None else element.moea_names(
+                ts)
+            for name in names:
+                self._add(prefix + name)
+
+
+# 2. Functions =================================================================
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
@@ -0,0 +1,202 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Selection of the parameters to optimise.
+#
+# By default, IOModel.moea_gen_vectors passes on every parameter of the model,
+# the only option being timeseries_adjustment. ParameterSelection holds include
+# & exclude rules, matched against the paths of a ParameterRegistry:
+#
+#   types   element types as in the paths, e.g. 'lifecycle', 'pattern',
+#           'habit', 'template', 'event', 'storage', 'agent', 'appliance'
+#   names   element names (or holding & consumer unit ids), e.g. 'sleep'
+#   paths   glob patterns on the whole path, e.g. '*/changeover.sigma'
+#
+# Type & name patterns may use '*' & '?' within a path segment. Without any
+# include rule all parameters are included, otherwise only those matching an
+# include rule; parameters matching an exclude rule are always dropped.
+#
+# The resulting indices are used with ParameterLayout.subset(), which
+# generates & inserts the selected parameters only, e.g.
+#
+#   selection = ParameterSelection().include(types='lifecycle')
+#   selection.exclude(paths='*.sigma')
+#   subset = layout.subset(selection.indices(registry))
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import fnmatch
+import re
+
+import numpy as np
+
+# internal
+from .util import utilities as util
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ParameterSelection(object):
+    # Include & exclude rules for the parameters of the optimisation vector.
+
+    def __init__(self):
+
+        self.rules = []  # (include, kind, pattern), kind: type, name or path
+
+    @classmethod
+    def from_dict(cls, item):
+        """
+        Creates a selection from a dictionary, e.g. part of a settings file:
+
+            Include:
+              Types: [lifecycle, habit]
+            Exclude:
+              Names: [awake]
+              Paths: ['*.sigma']
+        """
+
+        cls = ParameterSelection()
+
+        for key, include in (('Include', True), ('Exclude', False)):
+            rules = util.get_dict_item_if_exists(item, key, None)
+            if rules is None:
+                continue
+
+            cls._add(include,
+                     util.get_dict_item_if_exists(rules, 'Types', None),
+                     util.get_dict_item_if_exists(rules, 'Names', None),
+                     util.get_dict_item_if_exists(rules, 'Paths', None))
+
+        return cls
+
+    def include(self, types=None, names=None, paths=None):
+        """
+        Adds include rules, returning the selection. Each argument is a
+        pattern or list of patterns.
+        """
+
+        self._add(True, types, names, paths)
+
+        return self
+
+    def exclude(self, types=None, names=None, paths=None):
+        """
+        Adds exclude rules, returning the selection. Each argument is a
+        pattern or list of patterns.
+        """
+
+        self._add(False, types, names, paths)
+
+        return self
+
+    def mask(self, registry):
+        """
+        Returns a bool array with the selected parameters of the registry.
+
+        Inputs:
+
+        registry
+            ParameterRegistry object.
+        """
+
+        paths = registry.paths
+        mask = np.ones(len(paths), dtype=bool)
+
+        include = self._regex(True)
+        if include is not None:
+            mask = np.fromiter((include(p) is not None for p in paths),
+                               dtype=bool,
+                               count=len(paths))
+
+        exclude = self._regex(False)
+        if exclude is not None:
+            mask &= np.fromiter((exclude(p) is None for p in paths),
+                                dtype=bool,
+                                count=len(paths))
+
+        return mask
+
+    def indices(self, registry):
+        """
+        Returns the positions of the selected parameters of the registry.
+        """
+        return np.flatnonzero(self.mask(registry))
+
+    def _add(self, include, types, names, paths):
+
+        for kind, patterns in (('type', types), ('name', names), ('path',
+                                                                  paths)):
+            if patterns is None:
+                continue
+            if isinstance(patterns, str):
+                patterns = [patterns]
+
+            for pattern in patterns:
+                self.rules.append((include, kind, str(pattern)))
+
+    def _regex(self, include):
+        # combined search function of the include or exclude rules
+
+        parts = []
+        for is_include, kind, pattern in self.rules:
+            if is_include != include:
+                continue
+
+            if kind == 'type':
+                parts.append(f'(?:^|/){_segment_regex(pattern)}:[^/]*/')
+            elif kind == 'name':
+                parts.append(f'(?:^|/)(?:[^/:]*:)?{_segment_regex(pattern)}/')
+            elif kind == 'path':
+                parts.append(f'^{fnmatch.translate(pattern)}')
+            else:
+                raise ValueError(f'Unknown selection rule kind {kind}.')
+
+        if len(parts) == 0:
+            return None
+
+        return re.compile('|'.join(parts)).search
+
+
+# 2. Functions =================================================================
+def _segment_regex(pattern):
+    # glob within one path segment: '*' & '?' don't match '/'
+
+    return ''.join('[^/]*' if c == '*' else '[^/]' if c == '?' else re.escape(c)
+                   for c in pattern)
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
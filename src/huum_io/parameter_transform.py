@@ -0,0 +1,203 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Transforms between the raw parameter values & a well conditioned space.
+#
+# The bounds of moea_gen_vectors are multiplicative windows in raw units
+# (seconds, litres, probabilities, ...). ParameterTransform maps the values of
+# a ParameterLayout (or ParameterSubset / ParameterTying) to
+#
+#   'unit'  normalised [0, 1] within the bounds
+#   'log'   log space, i.e. the log of the values
+#
+# and back. Parameters get log scaled if their lower bound is positive & the
+# bounds span at least a factor of 10 ('auto', the windows of x*0.1 .. x*10),
+# all others stay linear. Windows starting at 0, e.g. those of probabilities
+# (min(0, x*0.01) .. max(1, x*100)), are log scaled as well, shifted by a
+# floor of upper * 1e-4: log(x + upper * 1e-4), which keeps 0 reachable.
+# Windows with negative lower bounds stay linear. Both directions are
+# vectorised & work on single vectors as well as on populations of shape
+# (number of candidates, number of parameters).
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import numpy as np
+
+# internal
+
+# 1. Global vars ===============================================================
+SPACES = ('unit', 'log')
+SCALES = ('auto', 'linear', 'log')
+
+_log_ratio = 10.0  # minimum upper/lower ratio for log scaling ('auto')
+_zero_floor = 1e-4  # shift of log scaled windows starting at 0, times upper
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ParameterTransform(object):
+    # Vectorised mapping of parameter values to 'unit' or 'log' space.
+
+    def __init__(self, lower, upper, space='unit', scale='auto'):
+        """
+        Inputs:
+
+        lower, upper
+            Arrays with the bounds of the parameters.
+        space
+            'unit' or 'log'.
+        scale
+            'auto', 'linear', 'log' or bool array selecting the log scaled
+            parameters. Parameters with negative lower bounds are never log
+            scaled, those with a lower bound of 0 get shifted by a floor.
+        """
+
+        if space not in SPACES:
+            raise ValueError(f'Unknown space {space}, use one of {SPACES}.')
+
+        self.lower = np.asarray(lower, dtype=np.float64)
+        self.upper = np.asarray(upper, dtype=np.float64)
+        self.space = space
+
+        # windows starting at 0 are shifted by a floor for log scaling
+        zero = (self.lower == 0.0) & (self.upper > 0.0)
+        floor = np.where(zero, self.upper * _zero_floor, 0.0)
+        loggable = (self.lower > 0.0) | zero
+
+        if isinstance(scale, str):
+            if scale == 'auto':
+                self.log = loggable & (self.upper + floor >=
+                                       (self.lower + floor) * _log_ratio)
+            elif scale == 'linear':
+                self.log = np.zeros(len(self.lower), dtype=bool)
+            elif scale == 'log':
+                self.log = loggable
+            else:
+                raise ValueError(
+                    f'Unknown scale {scale}, use one of {SCALES}.')
+        else:
+            self.log = np.asarray(scale, dtype=bool) & loggable
+        self._shift = np.where(self.log, floor, 0.0)
+
+        # offset & width of the (log scaled) bounds, for 'unit'
+        self._offset = self._log(self.lower)
+        self._width = self._log(self.upper) - self._offset
+        self._inv_width = np.divide(1.0,
+                                    self._width,
+                                    out=np.zeros(len(self._width)),
+                                    where=self._width > 0.0)
+
+    @classmethod
+    def from_layout(cls, layout, space='unit', scale='auto'):
+        """
+        Creates the transform for the bounds of a ParameterLayout,
+        ParameterSubset or ParameterTying.
+        """
+        return ParameterTransform(layout.lower, layout.upper, space, scale)
+
+    def forward(self, values):
+        """
+        Maps raw values (vector or population) to the transformed space.
+        """
+
+        result = self._log(values)
+
+        if self.space == 'unit':
+            result -= self._offset
+            result *= self._inv_width
+
+        return result
+
+    def inverse(self, values, clip=False):
+        """
+        Maps values (vector or population) of the transformed space back to
+        raw values.
+
+        Inputs:
+
+        values
+            Array of shape (number of parameters) or (number of candidates,
+            number of parameters).
+        clip
+            (bool) Whether to clip the raw values to the bounds, after
+            mapping back.
+        """
+
+        result = np.array(values, dtype=np.float64)
+
+        if self.space == 'unit':
+            result *= self._width
+            result += self._offset
+
+        np.exp(result, out=result, where=self.log)
+        result -= self._shift
+
+        if clip:
+            np.clip(result, self.lower, self.upper, out=result)
+
+        return result
+
+    def bounds(self):
+        """
+        Returns the bounds in the transformed space as array of shape (number
+        of parameters, 2).
+        """
+
+        if self.space == 'unit':
+            return np.stack([
+                np.zeros(len(self.lower)),
+                np.ones(len(self.lower))
+            ], axis=1)
+
+        return np.stack([self.forward(self.lower),
+                         self.forward(self.upper)], axis=1)
+
+    def __len__(self):
+        return len(self.lower)
+
+    def _log(self, values):
+        # log of the shifted values of the log scaled parameters, as new array
+
+        result = np.array(values, dtype=np.float64)
+        result += self._shift
+        np.log(result, out=result, where=self.log)
+
+        return result
+
+
+# 2. Functions =================================================================
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
@@ -0,0 +1,239 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tying of the parameters of structurally identical agents & appliances.
+#
+# Models built from a few archetypes repeat the same agent & appliance
+# parameters for every consumer unit, each copy being a variable of its own in
+# the optimisation vector. ParameterTying groups the agents & appliances of a
+# ParameterLayout by archetype and gives each group one set of variables: the
+# parameters of the first member of a group represent the whole group, and on
+# insert their values are broadcast to every member.
+#
+# The archetype of an element is given by a key:
+#
+#   'content'   hash of the rendered element without its name (identical
+#               definitions)
+#   'source'    source file of the element (files referenced repeatedly)
+#   'shared'    content hash of shared elements (loaded with dedup=True),
+#               kept by their private copies (see util.flyweight.detach)
+#
+# or any function taking the element & returning a hashable key, or None for
+# leaving the element untied. All members of a group need the same number of
+# parameters.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import hashlib
+
+import numpy as np
+
+# internal
+from . import agent as agent
+from . import appliance as appliance
+
+# 1. Global vars ===============================================================
+KEYS = ('content', 'source', 'shared')
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ParameterTying(object):
+    # Reduced optimisation vector with one variable per archetype parameter.
+
+    def __init__(self, layout, key='content'):
+        """
+        Groups the agents & appliances of the layout.
+
+        Inputs:
+
+        layout
+            ParameterLayout object.
+        key
+            'content', 'source', 'shared' or function returning the archetype
+            key of an agent or appliance.
+        """
+
+        self.layout = layout
+        self.groups = {}  # archetype key -> member elements
+
+        key_of = _key_function(key)
+
+        # every position points to the position representing it
+        link = np.arange(len(layout), dtype=np.int64)
+        first = {}  # archetype key -> (offset, length) of the first member
+
+        for i, element in enumerate(layout.nodes):
+            if not isinstance(element, (agent.IOAgent, appliance.IOAppliance)):
+                continue
+
+            k = key_of(element)
+            if k is None:
+                continue
+            k = (type(element).__name__, k)
+
+            offset = int(layout.node_offset[i])
+            length = int(layout.node_length[i])
+
+            self.groups.setdefault(k, []).append(element)
+            offset_first, length_first = first.setdefault(k, (offset, length))
+            if length != length_first:
+                raise ValueError(
+                    f'ParameterTying: {type(element).__name__} '
+                    f'{element.moea_segment()} has {length} parameters, its '
+                    f'archetype {length_first}.')
+
+            link[offset:offset + length] = np.arange(offset_first,
+                                                     offset_first + length)
+
+        self.representatives = np.flatnonzero(
+            link == np.arange(len(layout), dtype=np.int64))
+        self.index = np.searchsorted(self.representatives, link)
+
+        self._subset = layout.subset(self.representatives)
+
+    @property
+    def values(self):
+        return self.layout.values[self.representatives]
+
+    @property
+    def lower(self):
+        return self.layout.lower[self.representatives]
+
+    @property
+    def upper(self):
+        return self.layout.upper[self.representatives]
+
+    @property
+    def epsilon(self):
+        return self.layout.epsilon[self.representatives]
+
+    def bounds(self):
+        return np.stack([self.lower, self.upper], axis=1)
+
+    def fill(self):
+        """
+        Regenerates the parameters of the representing elements only,
+        returning the reduced values.
+        """
+
+        self._subset.fill()
+
+        return self.values
+
+    def expand(self, vec):
+        """
+        Broadcasts a reduced vector (or population of shape (number of
+        candidates, number of variables)) to the full vector of the layout.
+        """
+        return np.asarray(vec)[..., self.index]
+
+    def insert(self, vec):
+        """
+        Inserts a reduced vector into the model, every member of a group
+        getting the values of the group.
+
+        Inputs:
+
+        vec
+            NumPy array, memoryview or list with one value per variable.
+        """
+
+        if len(vec) != len(self.representatives):
+            raise ValueError(
+                f'ParameterTying.insert: vector of length {len(vec)} given, '
+                f'{len(self.representatives)} variables.')
+
+        self.layout.insert(self.expand(vec))
+
+    def names(self, registry):
+        """
+        Returns the paths of the variables, i.e. those of the representing
+        elements.
+
+        Inputs:
+
+        registry
+            ParameterRegistry object of the layout.
+        """
+        return [registry.paths[i] for i in self.representatives.tolist()]
+
+    def __len__(self):
+        return len(self.representatives)
+
+
+# 2. Functions =================================================================
+def _key_function(key):
+
+    if callable(key):
+        return key
+
+    if key == 'content':
+        return _key_content
+    elif key == 'source':
+        return _key_source
+    elif key == 'shared':
+        return _key_shared
+
+    raise ValueError(f'Unknown archetype key {key}, use one of {KEYS} or a '
+                     'function.')
+
+
+def _key_content(element):
+
+    # without the element's own name, the first 'Name:' entry
+    head, _, tail = element.render().partition('\nName:')
+    content = head + tail.partition('\n')[2]
+
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def _key_source(element):
+
+    if element.source is None:
+        return None
+
+    return element.source[0]
+
+
+def _key_shared(element):
+
+    if element.shared_key is None:
+        return element.origin_key
+
+    return element.shared_key
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
@@ -37,12 +37,16 @@
 # 0. Imports ===================================================================
 
 # general
+import functools
+import io
 import os
-import ruamel.yaml as YAML
 
 # internal
 from .elements import common_parts as common_parts
+from .util import flyweight as flyweight
+from .util import sources as sources
 from .util import utilities as util
+from .util import yaml_io as yaml_io
 from . import appliance
 
 # 1. Global vars ===============================================================
@@ -52,15 +56,18 @@ from . import appliance
 class IORoom(common_parts.CommonParts
              ):  # class  to hold both settings and the model data itself
 
+    moea_label = 'room'  # label in parameter paths
+
     def __init__(self):
 
         super().__init__()
 
         self.name = None
         self.appliances = []
+        self.source = None  # (file name, mtime) of the source file (see util.sources)
 
 
-    def load(self, fn, dir_root, zfile=None):
+    def load(self, fn, dir_root, zfile=None, registry=None):
         """
         loads the room data file.
 
@@ -71,8 +78,12 @@ class IORoom(common_parts.CommonParts
             model data structure root directory
         zfile
             zipfile object, if loading from zip
+        registry
+            flyweight registry for sharing identical appliances (default: None)
         """
 
+        self.source = sources.source_of(fn, dir_root, zfile)
+
         # sanity check
         if zfile is None:
             exists = os.path.basename(os.path.normpath(os.path.dirname(fn)))
@@ -83,38 +94,172 @@ class IORoom(common_parts.CommonParts
                 exit(255)
 
             # get data
-            f = open(dir_root + fn, 'r')
-            room_data = YAML.YAML(typ='safe', pure=True).load(f)
-            f.close()
+            room_data = yaml_io.load_file(dir_root + fn)
         else:
-            with zfile.open(f'{dir_root}{fn}') as f_obj:
-                room_data = YAML.YAML(typ='safe', pure=True).load(f_obj)
+            room_data = yaml_io.load_zip_member(zfile,
+                                                f'{dir_root}{fn}')
 
         self.name = util.safe_get_dict_item(room_data, 'Name', 'room.load')
 
         for fn_appliance in room_data['Appliances']:
-            item = appliance.IOAppliance()
-            item.load(fn_appliance, dir_root, zfile)
+            if registry is None:
+                item = appliance.IOAppliance()
+                item.load(fn_appliance, dir_root, zfile)
+            else:
+                item = appliance.IOAppliance.load_shared(
+                    fn_appliance, dir_root, zfile, registry)
             self.appliances.append(item)
 
         # load common stuff
         self.load_common(room_data)
 
+        self.mark_clean()
+
+
+    def refresh(self, dir_root, changed, registry=None):
+        """
+        Reloads the room if its file changed since loading (reusing the
+        unchanged appliances), otherwise refreshes its appliances.
+
+        Inputs:
+        dir_root
+            model data structure root directory
+        changed
+            list collecting the (file name, element) pairs of reloaded files
+        registry
+            flyweight registry of the model, if loaded with dedup: changed
+            appliance files are loaded as shared objects (default: None)
+        """
+
+        if self.source is None:
+            return self
+
+        def load_appliance(fn_appliance):
+            if registry is not None:
+                return appliance.IOAppliance.load_shared(
+                    fn_appliance, dir_root, None, registry)
+            item = appliance.IOAppliance()
+            item.load(fn_appliance, dir_root)
+            return item
+
+        if sources.is_changed(self, dir_root):
+            fn = self.source[0]
+            changed.append((fn, self))
+
+            self.source = sources.source_of(fn, dir_root)
+            room_data = yaml_io.load_file(dir_root + fn)
+
+            common_parts.CommonParts.__init__(self)
+            self.name = util.safe_get_dict_item(room_data, 'Name',
+                                                'room.refresh')
+            self.appliances = sources.splice_list(self.appliances,
+                                                  room_data['Appliances'],
+                                                  dir_root, changed,
+                                                  load_appliance, registry)
+            self.load_common(room_data)
+            self.mark_clean()
+
+        # shared appliances can only be matched via the file list
+        elif sources.has_shared(self.appliances):
+            room_data = yaml_io.load_file(dir_root + self.source[0])
+            self.appliances = sources.splice_list(self.appliances,
+                                                  room_data['Appliances'],
+                                                  dir_root, changed,
+                                                  load_appliance, registry)
+
+        else:
+            self.appliances = sources.refresh_list(self.appliances, dir_root,
+                                                   changed, registry)
+
+        return self
+
 
     def check(self):
         print("Room.check: Not yet implemented")
         exit(255)
 
 
-    def write(self, dir_root, dir_file):
+    def detach_appliance(self, index):
+        """
+        Replaces a shared appliance by a private copy (copy-on-write) and
+        returns it. Needs to be called before modifying an appliance loaded
+        with deduplication.
 
-        # assure that the output directory exists
-        dir_local = os.path.join(dir_root, dir_file)
-        if not os.path.exists(dir_local):
-            os.makedirs(dir_local)
+        Inputs:
+        index
+            position of the appliance in .appliances
+        """
 
-        # write file
-        f = open(os.path.join(dir_local, self.name + '.yaml'), 'w')
+        self.appliances[index] = flyweight.detach(self.appliances[index])
+
+        return self.appliances[index]
+
+
+    def write(self, dir_root, dir_file, only_modified=False, library=None):
+        documents = self.iter_documents(dir_file, only_modified, library)
+        if library is not None:
+            documents = library.filter(documents)
+
+        util.write_documents(dir_root, documents)
+        self.mark_clean(recursive=True)
+
+
+    def iter_documents(self, dir_file, only_modified=False, library=None):
+        """
+        Yields (file path relative to the model root, function returning the
+        file content) for the room file and the files of all its appliances.
+
+        Inputs:
+        dir_file
+            directory of the room file, relative to the model root
+        only_modified
+            whether only the files of modified elements are included (see
+            BaseMOEA.is_modified, default: False)
+        library
+            util.library.SharedLibrary storing identical appliance files once
+            (default: None, each appliance gets its own file)
+        """
+
+        if library is None:
+            if not only_modified or self.is_modified():
+                yield (dir_file + self.name + '.yaml',
+                       functools.partial(self.render, dir_file))
+
+            for app in self.appliances:
+                yield from app.iter_documents(dir_file + 'appliances/',
+                                              only_modified)
+            return
+
+        # the room file references the content of its appliances
+        write_room = not only_modified or self.is_modified() or any(
+            app.is_modified() for app in self.appliances)
+
+        fn_apps = []
+        for app in self.appliances:
+            if write_room or app.is_modified():
+                path, render = library.document('appliances', app.name,
+                                                app.render())
+                fn_apps.append(path)
+                yield (path, render)
+
+        if write_room:
+            yield (dir_file + self.name + '.yaml',
+                   functools.partial(self.render, dir_file, fn_apps))
+
+
+    def render(self, dir_file, fn_apps=None):
+        """
+        Returns the content of the room file.
+
+        Inputs:
+        dir_file
+            directory of the room file, relative to the model root
+        fn_apps
+            appliance file paths to reference, relative to the model root
+            (default: None, the files in the appliances/ subdirectory)
+        """
+
+        f = io.StringIO()
 
         # write header
         f.write("%YAML 1.2\n---\n")
@@ -124,14 +269,29 @@ class IORoom(common_parts.CommonParts
 
         # Specific Data
         f.write('\n\nAppliances:\n')
-        for app in self.appliances:
-            f.write('- ' + dir_file + 'appliances/' + app.name + '.yaml\n')
-            app.write(dir_root, dir_file + 'appliances/')
+        if fn_apps is None:
+            fn_apps = [dir_file + 'appliances/' + app.name + '.yaml'
+                       for app in self.appliances]
+        for fn_app in fn_apps:
+            f.write('- ' + fn_app + '\n')
 
         # Common Data
         self.write_common(f)
 
-        f.close()
+        return f.getvalue()
+
+
+    def moea_parts(self, timeseries_adjustment: bool = True):
+        """
+        Yields the elements contributing to the optimisation vector in vector
+        order, as (element, timeseries_adjustment to pass on) pairs, None for
+        elements not taking the flag (see parameter_layout).
+        """
+
+        for app in self.appliances:
+            yield app, timeseries_adjustment
+
+        yield from self.common_moea_parts()
 
 
     def moea_gen_vectors(self,
@@ -176,8 +336,10 @@ class IORoom(common_parts.CommonParts
 
         # insert data - nothing to do for self
 
-        # insert data - holdings
-        for app in self.appliances:
+        # insert data - appliances, shared ones get copied first
+        for i, app in enumerate(self.appliances):
+            if flyweight.is_shared(app):
+                app = self.detach_appliance(i)
             num += app.moea_insert_vector(vec[num:num + app.get_data_extend()],
                                           timeseries_adjustment)
 
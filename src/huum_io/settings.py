@@ -37,11 +37,12 @@
 
 # general
 import logging
+import io
 import os
-import ruamel.yaml as YAML
 
 # internal
 from .util import utilities as util
+from .util import yaml_io as yaml_io
 
 # 1. Global vars ===============================================================
 mod_logger = logging.getLogger(__name__)
@@ -103,7 +104,7 @@ class IOSettings(object
     @classmethod
     def from_fileobject(cls, f_obj):
 
-        settings = YAML.YAML(typ='safe', pure=True).load(f_obj)
+        settings = yaml_io.parse(f_obj)
 
         cls = IOSettings()
 
@@ -162,7 +163,14 @@ class IOSettings(object
         if not os.path.exists(directory):
             os.makedirs(directory)
 
-        f = open(filename, 'w')
+        util.write_file(filename, self.render())
+
+    def render(self):
+        """
+        Returns the content of the settings file.
+        """
+
+        f = io.StringIO()
 
         # self.check()
 
@@ -206,7 +214,7 @@ class IOSettings(object
         if not (self.seed is None):
             f.write('\nSeed:            ' + self.seed)
 
-        f.close()
+        return f.getvalue()
 
 
 # 2. Functions =================================================================
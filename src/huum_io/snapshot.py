@@ -0,0 +1,326 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Compact binary snapshots of whole models.
+#
+# A snapshot stores the complete object tree (IOModelHUUM, IOModel, ...,
+# IOUsagePattern) in a single file, without using pickle:
+#
+#   magic (8 bytes) | version (uint32) | flags (uint32)
+#   | length of the structure (uint64) | number of floats (uint64)
+#   | number of integers (uint64) | structure | float block | integer block
+#
+# The structure is (optionally zlib compressed) JSON. Objects are stored as
+# value lists in the order of a per-class attribute layout ("shape"), objects
+# referenced more than once (e.g. shared appliances) are stored once. Purely
+# numeric lists (time series, tables) are stored as slices of two contiguous
+# little-endian blocks of float64 & int64 values.
+#
+# Only classes of this package can be instantiated when loading a snapshot.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import array
+import datetime
+import importlib
+import json
+import struct
+import sys
+import zlib
+
+# internal
+from .util import lazy as lazy
+
+# 1. Global vars ===============================================================
+_magic = b'HUUMSNAP'
+_version = 1
+_flag_compressed = 1
+
+_header = struct.Struct('<8sIIQQQ')
+_package = __name__.rsplit('.', 1)[0]  # only classes of this package are loaded
+
+_int_min = -2**63
+_int_max = 2**63 - 1
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class _Encoder(object):
+
+    def __init__(self):
+
+        self.shapes = []  # [class path, [attribute names]]
+        self.shape_ids = {}  # (class, attribute names) -> shape index
+        self.memo = {}  # id(object) -> object index
+        self.floats = array.array('d')
+        self.ints = array.array('q')
+
+    def encode(self, value):
+
+        t = type(value)
+        if value is None or t is str or t is bool or t is float or t is int:
+            return value
+
+        if t is list:
+            return self.encode_list(value)
+
+        if t is dict:
+            return {
+                'd': [[self.encode(k), self.encode(v)]
+                      for k, v in value.items()]
+            }
+
+        if t is tuple:
+            return {'u': [self.encode(x) for x in value]}
+
+        if t is datetime.datetime or t is datetime.date:
+            return {'t': [t.__name__, value.isoformat()]}
+
+        if lazy.is_proxy(value):
+            value = lazy.resolve(value)
+
+        return self.encode_object(value)
+
+    def encode_list(self, value):
+
+        if len(value) == 0:
+            return value
+
+        if all(type(x) is float for x in value):
+            self.floats.extend(value)
+            return {'f': [len(self.floats) - len(value), len(value)]}
+
+        if all(type(x) is int and _int_min <= x <= _int_max for x in value):
+            self.ints.extend(value)
+            return {'i': [len(self.ints) - len(value), len(value)]}
+
+        return [self.encode(x) for x in value]
+
+    def encode_object(self, obj):
+
+        num = self.memo.get(id(obj))
+        if num is not None:
+            return {'r': num}
+
+        cls = type(obj)
+        if not cls.__module__.startswith(_package + '.'):
+            raise TypeError(
+                f'snapshot: cannot store objects of type {cls.__name__}')
+
+        self.memo[id(obj)] = len(self.memo)
+
+        names = tuple(obj.__dict__)
+        shape = self.shape_ids.get((cls, names))
+        if shape is None:
+            shape = len(self.shapes)
+            self.shape_ids[(cls, names)] = shape
+            self.shapes.append(
+                [f'{cls.__module__}:{cls.__qualname__}',
+                 list(names)])
+
+        return {'c': shape, 'v': [self.encode(v) for v in obj.__dict__.values()]}
+
+
+class _Decoder(object):
+
+    def __init__(self, shapes, floats, ints):
+
+        self.shapes = [(_get_class(path), names) for path, names in shapes]
+        self.objects = []
+        self.floats = floats
+        self.ints = ints
+
+    def decode(self, value):
+
+        t = type(value)
+        if t is list:
+            return [self.decode(x) for x in value]
+
+        if t is not dict:
+            return value
+
+        if 'c' in value:
+            cls, names = self.shapes[value['c']]
+            obj = cls.__new__(cls)
+            self.objects.append(obj)
+            obj.__dict__.update(
+                zip(names, [self.decode(v) for v in value['v']]))
+            return obj
+
+        if 'r' in value:
+            return self.objects[value['r']]
+
+        if 'f' in value:
+            start, num = value['f']
+            return self.floats[start:start + num].tolist()
+
+        if 'i' in value:
+            start, num = value['i']
+            return self.ints[start:start + num].tolist()
+
+        if 'd' in value:
+            return {self.decode(k): self.decode(v) for k, v in value['d']}
+
+        if 'u' in value:
+            return tuple(self.decode(x) for x in value['u'])
+
+        if 't' in value:
+            kind, text = value['t']
+            if kind == 'datetime':
+                return datetime.datetime.fromisoformat(text)
+            return datetime.date.fromisoformat(text)
+
+        raise ValueError(f'snapshot: unknown entry {list(value.keys())}')
+
+
+# 2. Functions =================================================================
+def dumps(obj, compress: bool = False):
+    """
+    Returns the snapshot of the given object tree as bytes.
+
+    Inputs:
+
+    obj
+        Object to store, e.g. an IOModelHUUM or IOModel object.
+    compress
+        (bool) Whether the structure part is zlib compressed.
+    """
+
+    encoder = _Encoder()
+    root = encoder.encode(obj)
+
+    structure = json.dumps({
+        'Shapes': encoder.shapes,
+        'Root': root
+    },
+                           separators=(',', ':')).encode('utf-8')
+
+    flags = 0
+    if compress:
+        structure = zlib.compress(structure)
+        flags |= _flag_compressed
+
+    if sys.byteorder != 'little':
+        encoder.floats.byteswap()
+        encoder.ints.byteswap()
+
+    header = _header.pack(_magic, _version, flags, len(structure),
+                          len(encoder.floats), len(encoder.ints))
+
+    return b''.join([
+        header, structure,
+        encoder.floats.tobytes(),
+        encoder.ints.tobytes()
+    ])
+
+
+def loads(data):
+    """
+    Restores an object tree from snapshot bytes.
+
+    Inputs:
+
+    data
+        (bytes) Snapshot content.
+    """
+
+    view = memoryview(data)
+    if len(view) < _header.size:
+        raise ValueError('snapshot: file too short')
+
+    magic, version, flags, len_structure, num_floats, num_ints = _header.unpack(
+        view[:_header.size])
+    if magic != _magic:
+        raise ValueError('snapshot: not a HUUM model snapshot')
+    if version != _version:
+        raise ValueError(f'snapshot: unsupported format version {version}')
+
+    pos = _header.size
+    structure = view[pos:pos + len_structure]
+    pos += len_structure
+
+    floats = array.array('d')
+    floats.frombytes(view[pos:pos + 8 * num_floats])
+    pos += 8 * num_floats
+
+    ints = array.array('q')
+    ints.frombytes(view[pos:pos + 8 * num_ints])
+
+    if sys.byteorder != 'little':
+        floats.byteswap()
+        ints.byteswap()
+
+    if flags & _flag_compressed:
+        structure = zlib.decompress(structure)
+    content = json.loads(bytes(structure))
+
+    decoder = _Decoder(content['Shapes'], floats, ints)
+
+    return decoder.decode(content['Root'])
+
+
+def save(obj, fn: str, compress: bool = False):
+    """
+    Writes the snapshot of the given object tree to a file.
+    """
+
+    data = dumps(obj, compress)
+    with open(fn, 'wb') as f:
+        f.write(data)
+
+
+def load(fn: str):
+    """
+    Restores an object tree from a snapshot file.
+    """
+
+    with open(fn, 'rb') as f:
+        return loads(f.read())
+
+
+def _get_class(path: str):
+
+    name_module, name_class = path.split(':')
+    if not name_module.startswith(_package + '.'):
+        raise ValueError(f'snapshot: refusing to load class {path}')
+
+    cls = importlib.import_module(name_module)
+    for part in name_class.split('.'):
+        cls = getattr(cls, part)
+
+    return cls
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
@@ -52,7 +52,9 @@ from ..util import utilities as util
 
 # 1.1 Classes ------------------------------------------------------------------
 class IORate(base_optimisation.BaseMOEA):
-    
+
+    moea_label = 'rate'  # label in parameter paths
+
     def __init__(self):
 
         base_optimisation.BaseMOEA.__init__(self)
@@ -104,6 +106,22 @@ class IORate(base_optimisation.BaseMOEA):
             exit(255)
 
 
+    def moea_names(self):
+
+        if (self.type == 'constant'):
+            return ['const_val']
+
+        return []
+
+
+    def moea_slots(self):
+
+        if (self.type == 'constant'):
+            return [(self, ('const_val', ), 1)]
+
+        return []
+
+
     def moea_gen_vectors(self, vec_debug):
 
         vec_var      = []
@@ -138,8 +156,7 @@ class IORate(base_optimisation.BaseMOEA):
 
         # insert data
         if (self.type == 'constant'):
-            self.const_val = vec[0]
-            num = 1
+            num = self.moea_assign(('const_val', ), vec)
 
         else:
             print('Rate.moea_gen_vectors: Error:')
@@ -51,6 +51,8 @@ from ..util import utilities as util
 # 1.1 Classes ------------------------------------------------------------------
 class IOStorage(base_optimisation.BaseMOEA):
 
+    moea_label = 'storage'  # label in parameter paths
+
     def __init__(self):
 
         base_optimisation.BaseMOEA.__init__(self)
@@ -116,6 +118,34 @@ class IOStorage(base_optimisation.BaseMOEA):
                 item.write(f)
 
 
+    def moea_names(self):
+
+        names = ['initial_volume']
+
+        for increase in self.rates:
+            names += base_optimisation.prefix_names(
+                increase.moea_segment() + '/', increase.moea_names())
+
+        for i, changer in enumerate(self.translators):
+            names += base_optimisation.prefix_names(f'translator:{i}/',
+                                                    changer.moea_names())
+
+        return names
+
+
+    def moea_slots(self):
+
+        slots = [(self, ('initial_volume', ), 1)]
+
+        for increase in self.rates:
+            slots += increase.moea_slots()
+
+        for changer in self.translators:
+            slots += changer.moea_slots()
+
+        return slots
+
+
     def moea_gen_vectors(self, vec_debug):
 
         vec_var      = []
@@ -159,8 +189,7 @@ class IOStorage(base_optimisation.BaseMOEA):
         self.moea_check_vec_bounds(vec, 'Storage')
 
         # insert local data
-        self.initial_volume = vec[0]
-        num += 1
+        num += self.moea_assign(('initial_volume', ), vec)
 
         # work on the rates
         for incrase in self.rates:
@@ -50,6 +50,8 @@ from ..util import utilities as util
 # 1.1 Classes ------------------------------------------------------------------
 class IOTimedStorage(base_optimisation.BaseMOEA):
 
+    moea_label = 'timed_storage'  # label in parameter paths
+
     def __init__(self):
 
         base_optimisation.BaseMOEA.__init__(self)
@@ -100,6 +102,25 @@ class IOTimedStorage(base_optimisation.BaseMOEA):
                 item.write(f)
 
 
+    def moea_names(self):
+
+        names = []
+        for i, changer in enumerate(self.translators):
+            names += base_optimisation.prefix_names(f'translator:{i}/',
+                                                    changer.moea_names())
+
+        return names
+
+
+    def moea_slots(self):
+
+        slots = []
+        for changer in self.translators:
+            slots += changer.moea_slots()
+
+        return slots
+
+
     def moea_gen_vectors(self, vec_debug):
 
         vec_var      = []
@@ -37,9 +37,11 @@
 # 0. Imports ===================================================================
 
 # general
+import itertools
 
 # internal
 from ..util import base_optimisation as base_optimisation
+from ..util import number_lists as number_lists
 from ..util import utilities as util
 
 # 1. Global vars ===============================================================
@@ -48,6 +50,8 @@ from ..util import utilities as util
 # 1.1 Classes ------------------------------------------------------------------
 class IOTranslator(base_optimisation.BaseMOEA):
 
+    moea_label = 'translator'  # label in parameter paths
+
     def __init__(self):
 
         base_optimisation.BaseMOEA.__init__(self)
@@ -98,8 +102,19 @@ class IOTranslator(base_optimisation.BaseMOEA):
         if not (self.return_below is None):
             f.write('\n        Return_below: ' + self.return_below)
 
-        f.write('\n        Table_x:      ' + str(self.table_x))
-        f.write('\n        Table_y:      ' + str(self.table_y))
+        number_lists.write_list(f, '\n        Table_x:      ', self.table_x,
+                                '          ')
+        number_lists.write_list(f, '\n        Table_y:      ', self.table_y,
+                                '          ')
+
+    def moea_names(self):
+
+        # table_x as x0 & deltas, then all table_y values
+        names  = [f'table_x[{i}]' for i in range(len(self.table_x))]
+        names += [f'table_y[{i}]' for i in range(len(self.table_y))]
+
+        return names
+
 
     def moea_gen_vectors(self, vec_debug):
 
@@ -134,30 +149,54 @@ class IOTranslator(base_optimisation.BaseMOEA):
         return vec_var, vec_boundary, vec_epsilon
 
 
-    def moea_insert_vector(self, vec):
+    def moea_slots(self):
+
+        # written as a whole, the x values being rebuilt from the deltas
+        return [(self, self._insert_values, self.get_data_extend())]
 
-        num = 0  # number of data places already inserted
+
+    def moea_insert_vector(self, vec):
 
         # sanity bounds check
         self.moea_check_vec_bounds(vec, 'Translator')
 
         # working on itself
+        num = self._insert_values(vec, 0)
+
+        # sanity_check
+        self.moea_check_vec_extend(num, 'translator', vec)
+
+        return num
 
-        # deal with the two arrays:
-        self.table_x[0] = vec[0]
-        num += 1
 
-        for i in range(num - 1, (len(self.table_x) - 1)):
-            self.table_x[i] = vec[i] + self.table_x[i - 1]
-        num += len(self.table_x) - 1
+    def _insert_values(self, vec, num):
+        # inserts the values starting at vec[num], returns the position after
+        # them (shared by moea_insert_vector & the setter slot)
+
+        # deal with the two arrays, written in place
+        # (the first x is relative to the last one, which is kept)
+        num_x = len(self.table_x)
+        if num_x > 1:
+            table_x = list(
+                itertools.accumulate(
+                    itertools.chain((vec[num] + self.table_x[-1], ),
+                                    vec[(num + 1):(num + num_x - 1)])))
+        else:
+            table_x = [vec[num]]
+        num += num_x
 
         # y-coords
-        for i in range(num, (num + len(self.table_x))):
-            self.table_y[i - num] = vec[i]
+        table_y = vec[num:(num + num_x)]
         num += len(self.table_y)
 
-        # sanity_check
-        self.moea_check_vec_extend(num, 'translator', vec)
+        # compared before writing, as long as not modified anyway
+        if self.moea_needs_compare() and not (
+                base_optimisation.is_same_items(self.table_x, table_x) and
+                base_optimisation.is_same_items(self.table_y, table_y)):
+            self.mark_modified()
+
+        self.table_x[:len(table_x)] = table_x
+        self.table_y[:num_x] = table_y
 
         return num
 
@@ -43,8 +43,12 @@
 # 0. Imports ===================================================================
 
 # general
+import zlib
+
+import numpy as np
 
 # internal
+from ..util import lazy as lazy
 
 # 1. Global vars ===============================================================
 _epsilon_value = 0.001     # Currently doing single objective optimization - value doesn't matter.
@@ -53,10 +57,118 @@ _epsilon_value = 0.001     # Currently doing single objective optimization - val
 # 1.1 Classes ------------------------------------------------------------------
 class BaseMOEA(object):
     # Extensible base class for generating an optimization vector of changeable variables.
+    #
+    # Also tracks modifications: moea_insert_vector (and the setter slots of
+    # parameter_layout) mark the element as modified when a value changes, any
+    # other change needs to be marked via mark_modified(). Shared elements (see
+    # util.flyweight) are read-only, marking them raises an AttributeError.
+
+    own_file   = False  # whether the element is stored in a file of its own
+    moea_label = None   # label in parameter paths, see moea_segment()
 
     def __init__(self):
         self.__pos_data_extend = None   # length of this elements data part
-        self.__vec             = None   # holds the data vector when debugging
+        self.__vec             = None   # (offset, length, checksum) of the vector when debugging
+        self.__modified        = True   # modified since loading / last write
+        self.__shared          = False  # read-only, shared by several parents
+
+
+    def mark_modified(self):
+
+        if self.__shared:
+            _raise_shared(self)
+
+        self.__modified = True
+
+
+    def moea_assign(self, names, values, offset=0):
+        """
+        Assigns inserted values to the given attributes, marking the element
+        as modified if one of them changes (see is_same). The values are only
+        compared as long as the element is unmodified.
+
+        Inputs:
+
+        names
+            Attribute names, e.g. as given by moea_slots().
+        values
+            Vector with the values.
+        offset
+            Position of the first value within values.
+
+        Returns:
+            Number of values assigned.
+        """
+
+        attrs = self.__dict__
+        if not self.__modified:
+            for i, name in enumerate(names):
+                if not is_same(attrs[name], values[offset + i]):
+                    self.mark_modified()
+                    break
+
+        for name in names:
+            attrs[name] = values[offset]
+            offset += 1
+
+        return len(names)
+
+
+    def moea_needs_compare(self):
+        """
+        Whether inserted values need comparing against the current ones to
+        track modifications, i.e. the element itself isn't marked as modified
+        yet (see moea_assign, is_same_items).
+        """
+        return not self.__modified
+
+
+    def set_shared(self, shared):
+        """
+        Marks the element and its parts as shared (read-only) or private.
+
+        Inputs:
+
+        shared
+            (bool) Whether the element is shared.
+        """
+
+        self.__shared = shared
+        for part in iter_parts(self):
+            part.set_shared(shared)
+
+
+    def is_shared(self):
+        return self.__shared
+
+
+    def mark_clean(self, recursive=False):
+        """
+        Marks the element and its parts as unmodified, e.g. after loading or
+        writing it.
+
+        Inputs:
+
+        recursive
+            Whether the (loaded) elements stored in files of their own, e.g.
+            the consumer units of a holding, are marked as well.
+        """
+
+        self.__modified = False
+        for part in iter_parts(self, recursive):
+            part.mark_clean(recursive)
+
+
+    def is_modified(self):
+        """
+        Whether the element or one of its parts stored in the same file was
+        modified since loading or the last write.
+        """
+
+        if self.__modified:
+            return True
+
+        return any(part.is_modified() for part in iter_parts(self))
 
 
     def set_data_extend(self, data_extend):
@@ -67,14 +179,58 @@ class BaseMOEA(object):
         return self.__pos_data_extend
 
 
-    def set_vec(self, vec):
-        self.__vec = vec
+    def set_vec(self, vec, offset=None):
+        """
+        Remembers the generated vector for debugging, as offset (within the
+        whole vector, if known), length & checksum instead of a copy.
+        """
+
+        if vec is None:
+            self.__vec = None
+        else:
+            self.__vec = (offset, len(vec), vec_checksum(vec))
 
 
     def get_vec(self):
         return self.__vec
         
 
+    def moea_segment(self):
+        """
+        Returns the segment naming the element in parameter paths, e.g.
+        'lifecycle:sleep' (see parameter_registry).
+        """
+
+        name = getattr(self, 'name', None)
+        if name is None:
+            name = getattr(self, 'id', None)
+
+        if self.moea_label is None:
+            return name
+
+        return f'{self.moea_label}:{name}'
+
+
+    def moea_names(self):
+        """
+        Returns the names of the element's parameters in vector order,
+        relative to the element's own path segment.
+        """
+        return [f'[{i}]' for i in range(self.__pos_data_extend)]
+
+
+    def moea_slots(self):
+        """
+        Returns the setter slots of the element's parameters in vector order,
+        as (target, attribute names, length) triples, used by
+        parameter_layout to insert vectors without walking the tree. For
+        attribute names None, the values are passed on to
+        target.moea_insert_vector (the default), a function given instead
+        of the names is called with the values & the offset of the slot.
+        """
+        return [(self, None, self.__pos_data_extend)]
+
+
     def moea_gen_vectors(self, vec_debug):
         """
         Generates the three vectors needed for MOEA-borg.
@@ -163,10 +319,10 @@ class BaseMOEA(object):
         
         # check for data equivalence
         if not (self.__vec is None):
-            if (self.__vec != vec):
+            if (self.__vec[1:] != (len(vec), vec_checksum(vec))):
                 print('\n' + method_name + '.moea_check_vec_extend: Error:')
                 print("Given vector and remembered vector doesn't fit")
-                print('Remembered:', self.__vec)
+                print('Remembered:', format_vec_check(self.__vec))
                 print('Given:     ', vec)
                 flag = True
 
@@ -179,7 +335,7 @@ class BaseMOEA(object):
             print('num:          ', num)
             print('gen_extend:   ', self.__pos_data_extend)
             if not (self.__vec is None):
-                print('Generated vec:', self.__vec)
+                print('Generated vec:', format_vec_check(self.__vec))
                 print('Given vec:    ', vec)
             print('')
             flag = True
@@ -193,6 +349,136 @@ def get_epsilon_value():
     return _epsilon_value
 
 
+def vec_checksum(vec):
+    """
+    Returns a checksum over the values of a vector: the CRC-32 of the values
+    as float64 bytes. Equal int and float entries give the same checksum, as
+    do NaN entries (hashing the values would compare those by identity).
+
+    Inputs:
+
+    vec
+        List (or NumPy array) of numbers.
+    """
+    return zlib.crc32(np.asarray(vec, dtype=np.float64).tobytes())
+
+
+def format_vec_check(vec_check):
+
+    offset, length, checksum = vec_check
+    if offset is None:
+        offset = '?'
+
+    return f'offset {offset}, length {length}, checksum {checksum:08x}'
+
+
+def is_same(old, new):
+    """
+    Whether a value is unchanged, including the number types (as 1 and 1.0
+    are written differently).
+    """
+
+    if old is new:
+        return True
+
+    if type(old) is not type(new):
+        return False
+
+    if type(old) is list or type(old) is tuple:
+        # cheap value comparison first, the types only matter if all equal
+        try:
+            if old != new:
+                return False
+
+            types = list(map(type, old))
+            if list not in types and tuple not in types:
+                return types == list(map(type, new))
+
+        except (TypeError, ValueError):
+            pass
+
+        return len(old) == len(new) and all(
+            is_same(a, b) for a, b in zip(old, new))
+
+    try:
+        return bool(old == new)
+    except (TypeError, ValueError):
+        return False
+
+
+def is_same_items(old, new, start=0):
+    """
+    Whether the items of a list from the given position on are unchanged by
+    the new ones (see is_same), without copying the list.
+
+    Inputs:
+
+    old
+        Current list.
+    new
+        New items, replacing old[start:start + len(new)].
+    start
+        Position of the first replaced item.
+    """
+
+    if len(old) < start + len(new):
+        return False
+
+    return all(is_same(old[start + i], value) for i, value in enumerate(new))
+
+
+def prefix_names(prefix, names):
+    """
+    Returns the parameter names with the given prefix, e.g. a path segment.
+    """
+    return [prefix + name for name in names]
+
+
+def _raise_shared(element):
+
+    raise AttributeError(
+        f'{type(element).__name__} is shared by several parents (see '
+        'util.flyweight) and read-only, detach it first, e.g. via '
+        'IOConsumerUnit.detach_agent / IORoom.detach_appliance.')
+
+
+def iter_parts(element, own_files=False):
+    """
+    Yields the elements (BaseMOEA objects) directly held by the given one.
+
+    Inputs:
+
+    element
+        Element to look into.
+    own_files
+        Whether elements stored in files of their own are included (loaded
+        lazy proxies resolved, not yet loaded ones skipped).
+    """
+
+    for value in element.__dict__.values():
+        if type(value) is list:
+            if len(value) == 0:
+                continue
+            items = value
+        else:
+            items = (value, )
+
+        for item in items:
+            if lazy.is_proxy(item):
+                if not (own_files and lazy.is_loaded(item)):
+                    continue
+                item = lazy.resolve(item)
+
+            elif not isinstance(item, BaseMOEA):
+                # lists are homogeneous
+                if items is value:
+                    break
+                continue
+
+            if own_files or not item.own_file:
+                yield item
+
+
 # 3. Main Exec =================================================================
 if __name__ == '__main__':
     print('Testing')
@@ -0,0 +1,171 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Flyweight registry for sharing identical agent & appliance definitions.
+#
+# Many consumer units reference byte-identical agent or appliance files. When
+# loading with deduplication enabled, each distinct source is parsed once and
+# the resulting object is shared by all references. Shared objects carry their
+# content hash in .shared_key and are read-only: inserting changed values
+# into a shared object or any of its parts, or marking it as modified, raises
+# an AttributeError (see BaseMOEA.set_shared). The owning consumer unit or room
+# replaces them by a private copy first (copy-on-write, see detach()), which
+# keeps the content hash in .origin_key. Direct attribute changes aren't
+# checked, so those need a detached copy as well.
+#
+# The registry may be used by several loader threads at once.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import copy
+import hashlib
+import threading
+
+# internal
+from ..util import yaml_io as yaml_io
+
+# 1. Global vars ===============================================================
+_lock = threading.Lock()  # guards all registries, keeps them copyable
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class FlyweightRegistry(object):
+    # Maps the content hash of a source file to the shared object built from it.
+
+    def __init__(self):
+
+        self.items = {}  # (kind, content hash) -> shared object
+        self.num_hits = 0  # number of references served by a shared object
+
+    def get_or_create(self, kind: str, source: bytes, factory):
+        """
+        Returns the shared object for the given source, creating it if needed.
+
+        Inputs:
+
+        kind
+            (string) Kind of object, e.g. 'agent' or 'appliance'.
+        source
+            (bytes) Raw content of the source file.
+        factory
+            Function creating the object from the parsed source data.
+        """
+
+        key = (kind, hashlib.sha1(source).hexdigest())
+
+        with _lock:
+            obj = self.items.get(key)
+            if obj is not None:
+                self.num_hits += 1
+                return obj
+
+        # parsed outside of the lock, a concurrent creation of the same
+        # object is resolved when storing it
+        obj = factory(yaml_io.parse(source))
+        obj.shared_key = key[1]
+        obj.set_shared(True)
+
+        with _lock:
+            shared = self.items.setdefault(key, obj)
+            if shared is not obj:
+                self.num_hits += 1
+
+        return shared
+
+    def adopt(self, kind: str, obj):
+        """
+        Registers an object shared elsewhere, e.g. loaded by a process worker,
+        unless the registry already holds one for its content. Returns the
+        registered object.
+
+        Inputs:
+
+        kind
+            (string) Kind of object, e.g. 'agent' or 'appliance'.
+        obj
+            Shared object.
+        """
+
+        with _lock:
+            return self.items.setdefault((kind, obj.shared_key), obj)
+
+    def __len__(self):
+        return len(self.items)
+
+
+# 2. Functions =================================================================
+def is_shared(obj):
+    return getattr(obj, 'shared_key', None) is not None
+
+
+def detach(obj):
+    """
+    Returns a private, modifiable copy of a shared object (or the object
+    itself, if it isn't shared).
+
+    Inputs:
+
+    obj
+        Object to detach.
+    """
+
+    if not is_shared(obj):
+        return obj
+
+    return make_private(copy.deepcopy(obj))
+
+
+def make_private(obj):
+    """
+    Turns a copy of a shared object (e.g. a deep copy or one read back from a
+    store) into a private, modifiable one in place and returns it. The content
+    hash is kept in .origin_key.
+
+    Inputs:
+
+    obj
+        Object to make private.
+    """
+
+    if is_shared(obj):
+        obj.set_shared(False)
+        obj.origin_key = obj.shared_key
+        obj.shared_key = None
+
+    return obj
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
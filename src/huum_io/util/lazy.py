@@ -0,0 +1,157 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Lazy loading proxies.
+#
+# A LazyProxy stands in for a model element (e.g. a holding) that hasn't been
+# loaded yet. The element is loaded by the given function on the first
+# attribute access; afterwards all attribute reads & writes are forwarded to
+# it. isinstance() checks against the element class work without loading.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+
+# internal
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class LazyProxy(object):
+
+    __slots__ = ('_lazy_loader', '_lazy_class', '_lazy_source', '_lazy_target')
+
+    def __init__(self, loader, target_class, source=None):
+        """
+        Inputs:
+
+        loader
+            Function without arguments returning the loaded element.
+        target_class
+            Class of the element returned by the loader.
+        source
+            (Optional) description of the source, e.g. the file name.
+        """
+
+        object.__setattr__(self, '_lazy_loader', loader)
+        object.__setattr__(self, '_lazy_class', target_class)
+        object.__setattr__(self, '_lazy_source', source)
+        object.__setattr__(self, '_lazy_target', None)
+
+    def lazy_resolve(self):
+        """
+        Loads the element (if not done yet) and returns it.
+        """
+
+        target = object.__getattribute__(self, '_lazy_target')
+        if target is None:
+            target = object.__getattribute__(self, '_lazy_loader')()
+            object.__setattr__(self, '_lazy_target', target)
+            object.__setattr__(self, '_lazy_loader', None)
+
+        return target
+
+    @property
+    def __class__(self):
+        return object.__getattribute__(self, '_lazy_class')
+
+    def __getattr__(self, name):
+        return getattr(self.lazy_resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.lazy_resolve(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.lazy_resolve(), name)
+
+    def __reduce__(self):
+        # pickle/copy the loaded element itself
+        return (_identity, (self.lazy_resolve(), ))
+
+    def __repr__(self):
+
+        target = object.__getattribute__(self, '_lazy_target')
+        if target is None:
+            source = object.__getattribute__(self, '_lazy_source')
+            name = object.__getattribute__(self, '_lazy_class').__name__
+            return f'<LazyProxy {name} {source} (not loaded)>'
+
+        return repr(target)
+
+
+# 2. Functions =================================================================
+def is_proxy(obj):
+    return type(obj) is LazyProxy
+
+
+def is_loaded(obj):
+    """
+    Whether the given element is loaded, i.e. isn't an unresolved proxy.
+    """
+
+    if not is_proxy(obj):
+        return True
+
+    return object.__getattribute__(obj, '_lazy_target') is not None
+
+
+def source_of(obj):
+    """
+    Returns the source description of a proxy (None for other objects).
+    """
+
+    if not is_proxy(obj):
+        return None
+
+    return object.__getattribute__(obj, '_lazy_source')
+
+
+def resolve(obj):
+    """
+    Returns the loaded element behind a proxy (or the object itself).
+    """
+
+    if not is_proxy(obj):
+        return obj
+
+    return obj.lazy_resolve()
+
+
+def _identity(obj):
+    return obj
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
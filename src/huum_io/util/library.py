@@ -0,0 +1,121 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Shared library for writing identical agent & appliance files only once.
+#
+# Scenario batches often hold thousands of byte-identical agent or appliance
+# definitions. When writing with a SharedLibrary, the content of each agent &
+# appliance file is stored once below the library directory of the model root,
+# named by its content hash, and the consumer unit & room files reference the
+# shared file instead of a private copy. The files are loaded as usual, as all
+# references are relative to the model root.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import hashlib
+import threading
+
+# internal
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class SharedLibrary(object):
+    # Content addressed store of the shared files of one model root.
+    #
+    # A library can be reused for writing several models into the same model
+    # root (e.g. a batch of scenarios); files written once are skipped then.
+
+    def __init__(self, dir_library: str = 'library/'):
+
+        self.dir_library = dir_library  # relative to the model root
+        self.written = set()  # paths of the shared files written already
+        self.num_refs = 0  # number of references to shared files
+
+        self._lock = threading.Lock()
+
+    def document(self, kind: str, name: str, text: str):
+        """
+        Returns (shared file path relative to the model root, function
+        returning the file content) for the given content.
+
+        Inputs:
+
+        kind
+            (string) Kind of file, e.g. 'agents' or 'appliances'.
+        name
+            (string) Name of the element, kept in the filename for readability.
+        text
+            (string) Rendered file content.
+        """
+
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+        path = f'{self.dir_library}{kind}/{name}_{digest}.yaml'
+
+        with self._lock:
+            self.num_refs += 1
+
+        return path, lambda: text
+
+    def filter(self, documents):
+        """
+        Yields the given documents, skipping the shared files already written
+        by this library.
+
+        Inputs:
+
+        documents
+            Iterable of (file path relative to the model root, function
+            returning the file content) pairs.
+        """
+
+        for path, render in documents:
+            if path.startswith(self.dir_library):
+                with self._lock:
+                    if path in self.written:
+                        continue
+                    self.written.add(path)
+
+            yield path, render
+
+    def __len__(self):
+        return len(self.written)
+
+
+# 2. Functions =================================================================
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
@@ -0,0 +1,233 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Emitter for the numeric lists of the model files (usage patterns, usage
+# templates & translator tables).
+#
+# By default the lists are written in flow style with the shortest repr that
+# reads back to the identical value, as str(list) did. Optionally, the number
+# of significant digits can be limited (shorter files for long curves from an
+# optimisation) and long lists can be wrapped over several lines or written in
+# block style (see set_format). All forms read back via the YAML loaders:
+# integers stay integers, floats stay floats (e.g. 600.0 instead of 600 when
+# rounding) and non-finite values are written as .inf / .nan.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import math
+import numbers
+
+# internal
+
+# 1. Global vars ===============================================================
+STYLES = ('flow', 'wrapped', 'block')
+
+_digits = None  # significant digits, None: shortest round-trip repr
+_style = 'flow'  # list style, see STYLES
+_width = 79  # maximum line length of the wrapped style
+
+
+# 1.1 Classes ------------------------------------------------------------------
+
+
+# 2. Functions =================================================================
+def set_format(digits: int = None, style: str = 'flow', width: int = 79):
+    """
+    Sets the format of the numeric lists written from now on.
+
+    Inputs:
+
+    digits
+        (int) Number of significant digits of floats, None for the shortest
+        repr reading back to the identical value.
+    style
+        (string) 'flow' (one line), 'wrapped' (flow style, wrapped at width)
+        or 'block' (one item per line).
+    width
+        (int) Maximum line length of the wrapped style.
+    """
+
+    global _digits, _style, _width
+
+    if digits is not None and digits < 1:
+        raise ValueError(f'number_lists: invalid number of digits {digits}')
+    if style not in STYLES:
+        raise ValueError(f'Unknown list style {style}, use one of {STYLES}.')
+
+    _digits = digits
+    _style = style
+    _width = width
+
+
+def get_format():
+    return {'digits': _digits, 'style': _style, 'width': _width}
+
+
+def format_value(value, digits: int = None):
+    """
+    Returns a number as YAML scalar.
+
+    Inputs:
+
+    value
+        Number (Python or NumPy type).
+    digits
+        (int) Number of significant digits of floats, None for the shortest
+        round-trip repr.
+    """
+
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+
+    value = float(value)
+    if not math.isfinite(value):
+        if value != value:
+            return '.nan'
+        return '.inf' if value > 0 else '-.inf'
+
+    if digits is None:
+        return repr(value)
+
+    text = '%.*g' % (digits, value)
+    if '.' not in text and 'e' not in text:
+        text += '.0'  # keep it a float
+
+    return text
+
+
+def format_items(values, digits: int = None):
+    """
+    Returns a sequence of numbers as list of YAML scalars.
+
+    Inputs:
+
+    values
+        Sequence of numbers (list, tuple, NumPy array, ...).
+    digits
+        (int) Number of significant digits of floats, None for the shortest
+        round-trip repr.
+    """
+
+    if hasattr(values, 'tolist'):
+        values = values.tolist()  # NumPy arrays
+
+    # fast path for the common case of finite Python floats
+    if all(type(x) is float for x in values) and all(
+            map(math.isfinite, values)):
+        if digits is None:
+            return list(map(float.__repr__, values))
+
+        items = list(map(('%.' + str(digits) + 'g').__mod__, values))
+
+        # keep integral values floats
+        return [
+            item if '.' in item or 'e' in item else item + '.0'
+            for item in items
+        ]
+
+    return [format_value(x, digits) for x in values]
+
+
+def format_list(values, digits: int = None):
+    """
+    Returns a sequence of numbers as YAML flow sequence on one line.
+
+    Inputs:
+
+    values
+        Sequence of numbers (list, tuple, NumPy array, ...).
+    digits
+        (int) Number of significant digits of floats, None for the shortest
+        round-trip repr.
+    """
+
+    if digits is None and type(values) is list:
+        # str() is exact for plain Python numbers, anything else (NumPy
+        # scalars, inf, nan) has an 'n' in its repr
+        text = str(values)
+        if 'n' not in text:
+            return text
+
+    return '[' + ', '.join(format_items(values, digits)) + ']'
+
+
+def write_list(f, key: str, values, indent: str):
+    """
+    Writes a key and its list of numbers in the format set via set_format.
+
+    Inputs:
+
+    f
+        file object
+    key
+        text preceding the list, e.g. '\\n    Usage_t:      '
+    values
+        sequence of numbers
+    indent
+        indentation of continuation lines and block items, deeper than the key
+    """
+
+    if _style == 'flow':
+        f.write(key + format_list(values, _digits))
+        return
+
+    items = format_items(values, _digits)
+
+    if _style == 'block' and len(items) > 0:
+        f.write(key.rstrip(' '))
+        for item in items:
+            f.write('\n' + indent + '- ' + item)
+        return
+
+    # wrapped flow sequence
+    f.write(key + '[')
+    column = len(key) - key.rfind('\n') - 1 + 1  # after the '['
+    for i, item in enumerate(items):
+        if i > 0:
+            f.write(',')
+            column += 1
+            if column + len(item) + 2 > _width:
+                f.write('\n' + indent)
+                column = len(indent)
+            else:
+                f.write(' ')
+                column += 1
+        f.write(item)
+        column += len(item)
+    f.write(']')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
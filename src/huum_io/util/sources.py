@@ -0,0 +1,207 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tracking of the source files of loaded elements, for refreshing a model
+# after some of its files have been edited (see IOModel.refresh).
+#
+# Every element loaded from a model file (model, holding, consumer unit, room,
+# agent & appliance) keeps its file name and the modification time of the file
+# at loading in its 'source' attribute. Elements loaded from a zip archive have
+# no source and are never refreshed.
+#
+# Shared agents & appliances (see util.flyweight) have no source either, as the
+# same object stands for several files. They are matched via the content hash
+# of the files listed in their parent's file instead.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import hashlib
+import os
+
+# internal
+from ..util import flyweight as flyweight
+from ..util import lazy as lazy
+from ..util import yaml_io as yaml_io
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+
+
+# 2. Functions =================================================================
+def stamp(fn):
+    """
+    Returns the modification time [ns] of a file, None if it doesn't exist.
+
+    Inputs:
+
+    fn
+        (string) Path of the file.
+    """
+
+    try:
+        return os.stat(fn).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def source_of(fn, dir_root, zfile=None):
+    """
+    Returns the source record of an element about to be loaded, None when
+    loading from a zip archive.
+
+    Inputs:
+
+    fn
+        (string) File name of the element, relative to dir_root.
+    dir_root
+        (string) Model data structure root directory.
+    zfile
+        Zip file object when loading from a zip.
+    """
+
+    if zfile is not None:
+        return None
+
+    return (fn, stamp(dir_root + fn))
+
+
+def is_changed(node, dir_root):
+    """
+    Whether the source file of an element changed since it was loaded.
+
+    Inputs:
+
+    node
+        Element with a 'source' attribute.
+    dir_root
+        (string) Model data structure root directory.
+    """
+
+    if node.source is None:
+        return False
+
+    fn, mtime = node.source
+
+    return stamp(dir_root + fn) != mtime
+
+
+def is_pending(node):
+    """
+    Whether the element is a lazy proxy which hasn't been loaded yet (and
+    thus needs no refreshing).
+    """
+    return lazy.is_proxy(node) and not lazy.is_loaded(node)
+
+
+def has_shared(nodes):
+    return any(flyweight.is_shared(node) for node in nodes)
+
+
+def refresh_list(nodes, dir_root, changed, registry=None):
+    """
+    Refreshes the given elements, returns the list of refreshed elements.
+
+    Inputs:
+
+    nodes
+        List of elements.
+    dir_root
+        (string) Model data structure root directory.
+    changed
+        List collecting the (file name, element) pairs of reloaded files.
+    registry
+        Flyweight registry of the model, if loaded with dedup (default: None).
+    """
+
+    return [
+        node if is_pending(node) else node.refresh(dir_root, changed, registry)
+        for node in nodes
+    ]
+
+
+def splice_list(nodes, fns, dir_root, changed, load, registry=None):
+    """
+    Returns the element list for the given file names, reusing (and
+    refreshing) the existing elements where possible, loading the others.
+
+    Inputs:
+
+    nodes
+        List of the existing elements.
+    fns
+        List of the file names of the elements, as given in the parent file.
+    dir_root
+        (string) Model data structure root directory.
+    changed
+        List collecting the (file name, element) pairs of reloaded files.
+    load
+        Function loading a new element from a file name.
+    registry
+        Flyweight registry of the model, if loaded with dedup (default: None).
+    """
+
+    by_file = {}
+    by_hash = {}
+    for node in nodes:
+        if is_pending(node):
+            by_file.setdefault(lazy.source_of(node), node)
+        elif flyweight.is_shared(node):
+            by_hash.setdefault(node.shared_key, node)
+        elif node.source is not None:
+            by_file.setdefault(node.source[0], node)
+
+    result = []
+    for fn in fns:
+        node = by_file.get(fn)
+
+        if node is None and len(by_hash) > 0:
+            digest = hashlib.sha1(yaml_io.read_file(dir_root + fn)).hexdigest()
+            node = by_hash.get(digest)
+
+        if node is None:
+            node = load(fn)
+            changed.append((fn, node))
+        elif not is_pending(node):
+            node = node.refresh(dir_root, changed, registry)
+
+        result.append(node)
+
+    return result
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
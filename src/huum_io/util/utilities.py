@@ -41,6 +41,7 @@
 # 0. Imports ===================================================================
 
 # general
+import os
 
 # internal
 
@@ -99,6 +100,50 @@ def get_dict_item_if_exists(dict, item: str, default: str):
         return default
 
 
+def write_file(fn: str, text: str):
+    """
+    Writes the complete content of a (text) file in one go. Opened in text
+    mode, i.e. with the platform's default encoding and newlines, as before.
+
+    Inputs:
+
+    fn
+        (string) Path of the file to write.
+    text
+        (string) File content.
+    """
+
+    with open(fn, 'w') as f:
+        f.write(text)
+
+
+def write_documents(dir_root: str, documents):
+    """
+    Writes a sequence of documents below a root directory, creating the
+    needed directories on the way.
+
+    Inputs:
+
+    dir_root
+        (string) Root directory of the documents.
+    documents
+        Iterable of (file path relative to dir_root, function returning the
+        file content) pairs, as given by the iter_documents() methods.
+    """
+
+    dirs_known = set()
+    for path, render in documents:
+        fn = os.path.join(dir_root, path)
+
+        dir_file = os.path.dirname(fn)
+        if dir_file not in dirs_known:
+            if dir_file != '' and not os.path.exists(dir_file):
+                os.makedirs(dir_file)
+            dirs_known.add(dir_file)
+
+        write_file(fn, render())
+
+
 # 3. Main Exec =================================================================
 if __name__ == '__main__':
     print('Testing')
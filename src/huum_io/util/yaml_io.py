@@ -0,0 +1,325 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Reading of the model YAML files, including the optional on-disk parse cache.
+#
+# The YAML loader is created once per thread and reused for every file. By
+# default the libyaml based C parser is used when ruamel.yaml.clib is
+# available, falling back to the pure Python parser otherwise. The backend can
+# be selected via set_backend() or the HUUM_IO_YAML_BACKEND environment
+# variable ('auto', 'c' or 'pure').
+#
+# The parse cache stores the parsed content of each file as a pickle, keyed by
+# the absolute path, size & modification time of the source file (or the
+# archive member name, size & CRC when loading from a zip). Any edit of a
+# source file changes the key, so stale entries are never used.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import hashlib
+import logging
+import os
+import pickle
+import ruamel.yaml as YAML
+import ruamel.yaml.main as YAML_main
+import tempfile
+import threading
+
+# internal
+
+# 1. Global vars ===============================================================
+mod_logger = logging.getLogger(__name__)
+
+ENV_CACHE_DIR = 'HUUM_IO_CACHE_DIR'  # environment variable enabling the cache
+ENV_BACKEND = 'HUUM_IO_YAML_BACKEND'  # environment variable selecting the parser
+
+BACKENDS = ('auto', 'c', 'pure')
+
+_cache_dir = os.environ.get(ENV_CACHE_DIR) or None  # None: cache disabled
+_backend = os.environ.get(ENV_BACKEND, 'auto').lower()  # selected parser
+_loaders = threading.local()  # per thread loader instances, by backend
+
+
+# 1.1 Classes ------------------------------------------------------------------
+
+
+# 2. Functions =================================================================
+def set_cache_dir(dir_cache):
+    """
+    Enables (or disables) the on-disk parse cache.
+
+    Inputs:
+
+    dir_cache
+        (string) Directory holding the cache entries, None to disable the cache.
+    """
+
+    global _cache_dir
+    _cache_dir = dir_cache
+
+
+def get_cache_dir():
+    return _cache_dir
+
+
+def set_backend(backend):
+    """
+    Selects the YAML parser used for loading model files.
+
+    Inputs:
+
+    backend
+        (string) 'auto' (C parser if available), 'c' or 'pure'.
+    """
+
+    global _backend
+    _backend = _check_backend(backend)
+
+
+def get_backend():
+    return _backend
+
+
+def has_c_loader():
+    """
+    Whether the libyaml based parser of ruamel.yaml.clib is available.
+    """
+    return YAML_main.CParser is not None
+
+
+def get_loader(backend=None):
+    """
+    Returns the YAML loader of the current thread for the given backend,
+    creating it on first use.
+
+    Inputs:
+
+    backend
+        (string) 'auto', 'c' or 'pure'. Defaults to the selected backend.
+    """
+
+    pure = _resolve_pure(backend)
+
+    loader = getattr(_loaders, 'pure' if pure else 'c', None)
+    if loader is None:
+        loader = YAML.YAML(typ='safe', pure=pure)
+        setattr(_loaders, 'pure' if pure else 'c', loader)
+
+    return loader
+
+
+def parse(f_obj, backend=None):
+    """
+    Parses a YAML document from a file object or string.
+
+    Inputs:
+
+    f_obj
+        File object (text or binary) or string to parse.
+    backend
+        (string) 'auto', 'c' or 'pure'. Defaults to the selected backend.
+    """
+    return get_loader(backend).load(f_obj)
+
+
+def load_file(fn):
+    """
+    Loads and parses a YAML file, using the parse cache if enabled.
+
+    Inputs:
+
+    fn
+        (string) Path of the file to load.
+    """
+
+    if _cache_dir is None:
+        with open(fn, 'r') as f:
+            return parse(f)
+
+    stat = os.stat(fn)
+    key = f'{os.path.abspath(fn)}|{stat.st_size}|{stat.st_mtime_ns}'
+
+    data = _cache_get(key)
+    if data is None:
+        with open(fn, 'r') as f:
+            data = parse(f)
+        _cache_put(key, data)
+
+    return data
+
+
+def load_zip_member(zfile, name):
+    """
+    Loads and parses a YAML file from a zip archive, using the parse cache if
+    enabled.
+
+    Inputs:
+
+    zfile
+        Opened zipfile.ZipFile object.
+    name
+        (string) Name of the archive member.
+    """
+
+    if _cache_dir is None:
+        with zfile.open(name) as f_obj:
+            return parse(f_obj)
+
+    info = zfile.getinfo(name)
+    key = f'zip|{name}|{info.file_size}|{info.CRC}|{info.date_time}'
+
+    data = _cache_get(key)
+    if data is None:
+        with zfile.open(info) as f_obj:
+            data = parse(f_obj)
+        _cache_put(key, data)
+
+    return data
+
+
+def read_file(fn):
+    """
+    Returns the raw content of a file.
+
+    Inputs:
+
+    fn
+        (string) Path of the file to read.
+    """
+
+    with open(fn, 'rb') as f:
+        return f.read()
+
+
+def read_zip_member(zfile, name):
+    """
+    Returns the raw content of a zip archive member.
+
+    Inputs:
+
+    zfile
+        Opened zipfile.ZipFile object.
+    name
+        (string) Name of the archive member.
+    """
+    return zfile.read(name)
+
+
+def clear_cache():
+    """
+    Removes all entries from the parse cache directory.
+    """
+
+    if _cache_dir is None or not os.path.isdir(_cache_dir):
+        return
+
+    for dir_sub, _, files in os.walk(_cache_dir):
+        for fn in files:
+            if fn.endswith(('.pickle', '.tmp')):
+                os.remove(os.path.join(dir_sub, fn))
+
+
+def _check_backend(backend):
+
+    backend = backend.lower()
+    if backend not in BACKENDS:
+        raise ValueError(
+            f'Unknown YAML backend {backend}, use one of {BACKENDS}.')
+
+    return backend
+
+
+def _resolve_pure(backend):
+
+    backend = _check_backend(_backend if backend is None else backend)
+
+    if backend == 'pure':
+        return True
+
+    if not has_c_loader():
+        if backend == 'c':
+            mod_logger.warning(
+                'yaml_io: C YAML parser requested, but ruamel.yaml.clib is '
+                'not available. Using the pure Python parser.')
+        return True
+
+    return False
+
+
+def _cache_path(key):
+
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    return os.path.join(_cache_dir, digest[:2], digest + '.pickle')
+
+
+def _cache_get(key):
+
+    try:
+        with open(_cache_path(key), 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        mod_logger.warning(f'yaml_io: ignoring unreadable cache entry: {err}')
+        return None
+
+
+def _cache_put(key, data):
+
+    fn = _cache_path(key)
+    fn_tmp = None
+    try:
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+
+        # write to a temporary file of its own first (per process & thread),
+        # so that concurrent loads never see a partial entry
+        with tempfile.NamedTemporaryFile('wb',
+                                         dir=os.path.dirname(fn),
+                                         prefix=os.path.basename(fn) + '.',
+                                         suffix='.tmp',
+                                         delete=False) as f:
+            fn_tmp = f.name
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fn_tmp, fn)
+
+    except OSError as err:
+        mod_logger.warning(f'yaml_io: could not write cache entry: {err}')
+        if fn_tmp is not None and os.path.exists(fn_tmp):
+            os.remove(fn_tmp)
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
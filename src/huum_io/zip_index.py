@@ -0,0 +1,301 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Index of a zipped model, for random access to single holdings.
+#
+# The index maps the holding, consumer unit, room, agent & appliance names of
+# a zipped model to their archive members. Building it reads the model,
+# holding, consumer unit & room files once; agents and appliances are indexed
+# by their file name (without .yaml), as written by the IO classes. The index
+# can be cached as a JSON sidecar next to the archive, which is invalidated by
+# any change of the archive's size or modification time.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import json
+import logging
+import os
+import posixpath
+
+# internal
+from .util import utilities as util
+from .util import yaml_io as yaml_io
+
+# 1. Global vars ===============================================================
+mod_logger = logging.getLogger(__name__)
+
+_index_version = 1  # format version of the sidecar file
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ZipIndex(object):
+
+    def __init__(self):
+
+        self.base_dir = None  # model root directory within the archive
+        self.fn_model = None  # model file name
+        self.holdings = {}  # holding name -> holding entry, in model order
+        self.stamp = None  # [size, mtime] of the indexed archive
+
+    @classmethod
+    def build(cls, zfile, base_dir: str, fn_model: str):
+        """
+        Builds the index of a zipped model.
+
+        Inputs:
+
+        zfile
+            Opened zipfile.ZipFile object.
+        base_dir
+            (string) Model root directory within the archive.
+        fn_model
+            (string) Model file name.
+        """
+
+        cls = ZipIndex()
+        cls.base_dir = base_dir
+        cls.fn_model = fn_model
+
+        model_data = yaml_io.load_zip_member(zfile, f'{base_dir}{fn_model}')
+        for fn_holding in model_data['Holdings']:
+            holding_data = yaml_io.load_zip_member(zfile,
+                                                   f'{base_dir}{fn_holding}')
+            name = util.safe_get_dict_item(holding_data, 'Name',
+                                           'ZipIndex.build')
+
+            consumer_units = {}
+            for fn_cu in holding_data['Consumer_Units']:
+                cu_data = yaml_io.load_zip_member(zfile, f'{base_dir}{fn_cu}')
+
+                rooms = {}
+                for fn_room in util.get_dict_item_if_exists(
+                        cu_data, 'Rooms', []):
+                    room_data = yaml_io.load_zip_member(
+                        zfile, f'{base_dir}{fn_room}')
+                    rooms[room_data['Name']] = {
+                        'member': fn_room,
+                        'appliances': _by_stem(room_data['Appliances'])
+                    }
+
+                consumer_units[cu_data['Name']] = {
+                    'member': fn_cu,
+                    'rooms': rooms,
+                    'agents': _by_stem(cu_data['Agents'])
+                }
+
+            cls.holdings[name] = {
+                'member': fn_holding,
+                'consumer_units': consumer_units
+            }
+
+        return cls
+
+    @classmethod
+    def load_or_build(cls,
+                      zfile,
+                      base_dir: str,
+                      fn_model: str,
+                      use_sidecar: bool = True):
+        """
+        Returns the index of a zipped model, read from its sidecar file if that
+        is up to date. Otherwise the index is built and (optionally) saved as
+        sidecar.
+
+        Inputs:
+
+        zfile
+            Opened zipfile.ZipFile object, opened from a file name.
+        base_dir
+            (string) Model root directory within the archive.
+        fn_model
+            (string) Model file name.
+        use_sidecar
+            (bool) Whether to read & write the sidecar file.
+        """
+
+        fn_zip = zfile.filename
+        if fn_zip is None or not use_sidecar:
+            return ZipIndex.build(zfile, base_dir, fn_model)
+
+        stamp = _stamp(fn_zip)
+        fn_sidecar = sidecar_name(fn_zip)
+
+        if os.path.isfile(fn_sidecar):
+            cls = ZipIndex.load(fn_sidecar)
+            if (cls is not None and cls.stamp == stamp
+                    and cls.base_dir == base_dir
+                    and cls.fn_model == fn_model):
+                return cls
+
+        cls = ZipIndex.build(zfile, base_dir, fn_model)
+        cls.stamp = stamp
+        try:
+            cls.save(fn_sidecar)
+        except OSError as err:
+            mod_logger.warning(f'ZipIndex: could not write sidecar: {err}')
+
+        return cls
+
+    @classmethod
+    def load(cls, fn: str):
+        """
+        Loads an index from a sidecar file. Returns None for outdated formats.
+        """
+
+        with open(fn, 'r') as f:
+            data = json.load(f)
+
+        if data.get('Version') != _index_version:
+            return None
+
+        cls = ZipIndex()
+        cls.base_dir = data['Base_Dir']
+        cls.fn_model = data['File_Model']
+        cls.stamp = data['Stamp']
+        cls.holdings = data['Holdings']
+
+        return cls
+
+    def save(self, fn: str):
+
+        data = {
+            'Version': _index_version,
+            'Base_Dir': self.base_dir,
+            'File_Model': self.fn_model,
+            'Stamp': self.stamp,
+            'Holdings': self.holdings
+        }
+
+        # write to a temporary file first, as workers may share the sidecar
+        fn_tmp = f'{fn}.{os.getpid()}.tmp'
+        with open(fn_tmp, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(fn_tmp, fn)
+
+    def holding_names(self):
+        return list(self.holdings.keys())
+
+    def holding_member(self, name: str):
+        """
+        Returns the holding file (relative to the model root) of a holding.
+        """
+
+        if name not in self.holdings:
+            raise KeyError(f'Holding {name} not found in zip index.')
+
+        return self.holdings[name]['member']
+
+    def members_of_holding(self, name: str):
+        """
+        Returns all archive members (full names) belonging to a holding.
+        """
+
+        entry = self.holdings.get(name)
+        if entry is None:
+            raise KeyError(f'Holding {name} not found in zip index.')
+
+        members = [entry['member']]
+        for cu in entry['consumer_units'].values():
+            members.append(cu['member'])
+            members += list(cu['agents'].values())
+            for chamber in cu['rooms'].values():
+                members.append(chamber['member'])
+                members += list(chamber['appliances'].values())
+
+        return [f'{self.base_dir}{item}' for item in members]
+
+    def find(self, kind: str, name: str):
+        """
+        Returns the archive members (full names) of all elements of the given
+        kind & name.
+
+        Inputs:
+
+        kind
+            (string) 'holding', 'consumer_unit', 'room', 'agent' or 'appliance'
+        name
+            (string) Name of the element.
+        """
+
+        if kind not in ('holding', 'consumer_unit', 'room', 'agent',
+                        'appliance'):
+            raise ValueError(f'Unknown element kind {kind}.')
+
+        found = []
+        for hold_name, entry in self.holdings.items():
+            if kind == 'holding':
+                if hold_name == name:
+                    found.append(entry['member'])
+                continue
+
+            for cu_name, cu in entry['consumer_units'].items():
+                if kind == 'consumer_unit':
+                    if cu_name == name:
+                        found.append(cu['member'])
+                elif kind == 'agent':
+                    if name in cu['agents']:
+                        found.append(cu['agents'][name])
+                else:
+                    for room_name, chamber in cu['rooms'].items():
+                        if kind == 'room' and room_name == name:
+                            found.append(chamber['member'])
+                        elif kind == 'appliance' and name in chamber[
+                                'appliances']:
+                            found.append(chamber['appliances'][name])
+
+        return [f'{self.base_dir}{item}' for item in found]
+
+
+# 2. Functions =================================================================
+def sidecar_name(fn_zip: str):
+    return f'{fn_zip}.index.json'
+
+
+def _stamp(fn_zip: str):
+
+    stat = os.stat(fn_zip)
+
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _by_stem(members: list):
+    return {
+        posixpath.splitext(posixpath.basename(item))[0]: item
+        for item in members
+    }
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    print('Testing')
@@ -0,0 +1,94 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the helpers of the optimisation base class (see
+# util.base_optimisation).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import unittest
+
+import numpy as np
+
+# internal
+from huum_io.elements import probability
+from huum_io.util import base_optimisation
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestVecChecksum(unittest.TestCase):
+
+    def test_values(self):
+
+        checksum = base_optimisation.vec_checksum([1, 2.5, 3])
+        self.assertEqual(base_optimisation.vec_checksum([1.0, 2.5, 3.0]),
+                         checksum)
+        self.assertEqual(
+            base_optimisation.vec_checksum(np.array([1.0, 2.5, 3.0])),
+            checksum)
+        self.assertNotEqual(base_optimisation.vec_checksum([1.0, 2.5, 3.1]),
+                            checksum)
+        self.assertNotEqual(base_optimisation.vec_checksum([1.0, 2.5]),
+                            checksum)
+
+    def test_nan(self):
+
+        # distinct NaN objects, as e.g. from slicing a NumPy array
+        self.assertEqual(
+            base_optimisation.vec_checksum([float('nan'), 1.0]),
+            base_optimisation.vec_checksum([float('nan'), 1.0]))
+
+    def test_vec_debug(self):
+
+        # the remembered vector is checked on insert
+        prob = probability.IOProbability()
+        prob.load({'Type': 'Gauss', 'Mu': float('nan'), 'Sigma': 1.0})
+        vec, _, _ = prob.moea_gen_vectors(True)
+        self.assertIn('checksum', base_optimisation.format_vec_check(
+            prob.get_vec()))
+
+        self.assertEqual(prob.moea_insert_vector([float('nan'), 1.0]), 2)
+        with self.assertRaises(SystemExit):
+            prob.moea_insert_vector([float('nan'), 2.0])
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
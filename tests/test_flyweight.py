@@ -0,0 +1,142 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of sharing identical agent & appliance files when loading (see
+# util.flyweight).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import tempfile
+import unittest
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+from huum_io.util import flyweight
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestFlyweight(unittest.TestCase):
+
+    def setUp(self):
+
+        with tempfile.TemporaryDirectory() as dir_tmp:
+            fn_settings = generate_model.write_model(dir_tmp, 3)
+            self.plain = model_io.IOModelHUUM.load(fn_settings).model
+            self.shared = model_io.IOModelHUUM.load(fn_settings,
+                                                    dedup=True).model
+
+    def elements(self, io_model):
+
+        for unit in io_model.holdings:
+            for cu in unit.cu:
+                yield from cu.agents
+                for chamber in cu.rooms:
+                    yield from chamber.appliances
+
+    def documents(self, io_model):
+
+        return [(path, render())
+                for unit in io_model.holdings
+                for path, render in unit.iter_documents(unit.id)]
+
+    def test_load(self):
+
+        # 2 agent & 4 appliance archetypes
+        elements = list(self.elements(self.shared))
+        self.assertTrue(all(flyweight.is_shared(item) for item in elements))
+        self.assertEqual(len({id(item) for item in elements}), 6)
+        self.assertEqual(len(self.shared.registry), 6)
+        self.assertIsNone(self.plain.registry)
+        self.assertFalse(
+            any(flyweight.is_shared(item)
+                for item in self.elements(self.plain)))
+
+        self.assertEqual(self.documents(self.shared),
+                         self.documents(self.plain))
+
+    def test_detach(self):
+
+        cu = self.shared.holdings[0].cu[0]
+        shared = cu.agents[0]
+        daemon = cu.detach_agent(0)
+
+        self.assertIsNot(daemon, shared)
+        self.assertIs(cu.agents[0], daemon)
+        self.assertFalse(flyweight.is_shared(daemon))
+        self.assertEqual(daemon.origin_key, shared.shared_key)
+        self.assertIs(flyweight.detach(daemon), daemon)
+
+        # the private copy can be changed, the shared object is untouched
+        daemon.moea_insert_vector(
+            [value * 1.1 for value in daemon.moea_gen_vectors(False)[0]])
+        self.assertTrue(daemon.is_modified())
+        self.assertFalse(shared.is_modified())
+        self.assertIs(self.shared.holdings[0].cu[1].agents[0], shared)
+
+    def test_copy_on_write(self):
+
+        # inserting into a consumer unit only copies its changed elements
+        cu = self.shared.holdings[1].cu[1]
+        before = list(self.elements(self.shared))
+        vec, _, _ = cu.moea_gen_vectors(False)
+        cu.moea_insert_vector([value * 1.1 for value in vec])
+
+        after = list(self.elements(self.shared))
+        changed = [i for i, (old, new) in enumerate(zip(before, after))
+                   if old is not new]
+        self.assertEqual(changed, list(range(18, 24)))
+        self.assertNotEqual(cu.moea_gen_vectors(False)[0], vec)
+        self.assertTrue(
+            all(flyweight.is_shared(item) for item in after[:18]))
+
+        # the other consumer units still render as loaded
+        def others(io_model):
+            return [(path, text) for path, text in self.documents(io_model)
+                    if not path.startswith('H1/CU1/')]
+
+        self.assertEqual(others(self.shared), others(self.plain))
+        self.assertNotEqual(self.documents(self.shared),
+                            self.documents(self.plain))
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of loading holdings & consumer units on first access (see util.lazy).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import consumer_unit
+from huum_io import holding
+from huum_io import model_io
+from huum_io.util import lazy
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestLazy(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+        self.fn_settings = generate_model.write_model(self.dir_tmp.name, 3)
+        self.dir_model = os.path.join(self.dir_tmp.name, 'model') + '/'
+        self.full = model_io.IOModelHUUM.load(self.fn_settings).model
+
+    def tearDown(self):
+        self.dir_tmp.cleanup()
+
+    def documents(self, unit):
+        return [(path, render())
+                for path, render in unit.iter_documents(unit.id)]
+
+    def test_only_model(self):
+
+        io_model = model_io.IOModelHUUM.load(self.fn_settings,
+                                             only_model=True).model
+        holdings = io_model.holdings
+        self.assertTrue(all(lazy.is_proxy(unit) for unit in holdings))
+        self.assertFalse(any(lazy.is_loaded(unit) for unit in holdings))
+        self.assertTrue(isinstance(holdings[1], holding.IOHolding))
+        self.assertEqual(lazy.source_of(holdings[1]), 'H1/holding.yaml')
+        self.assertIn('not loaded', repr(holdings[1]))
+
+        # first access loads the one holding only
+        self.assertEqual(holdings[1].id, 'H1')
+        self.assertEqual([lazy.is_loaded(unit) for unit in holdings],
+                         [False, True, False])
+        self.assertEqual(self.documents(holdings[1]),
+                         self.documents(self.full.holdings[1]))
+
+        # writes go to the loaded holding
+        holdings[2].id = 'renamed'
+        self.assertEqual(lazy.resolve(holdings[2]).id, 'renamed')
+
+    def test_copy(self):
+
+        io_model = model_io.IOModelHUUM.load(self.fn_settings,
+                                             only_model=True).model
+        proxy = io_model.holdings[0]
+        for unit in (copy.deepcopy(proxy), pickle.loads(pickle.dumps(proxy))):
+            self.assertIs(type(unit), holding.IOHolding)
+            self.assertEqual(self.documents(unit),
+                             self.documents(self.full.holdings[0]))
+
+    def test_only_consumer_units(self):
+
+        unit = holding.IOHolding()
+        unit.load('H0/holding.yaml', self.dir_model,
+                  only_consumer_units=True)
+        self.assertEqual(unit.id, 'H0')
+        self.assertFalse(any(lazy.is_loaded(cu) for cu in unit.cu))
+        self.assertTrue(isinstance(unit.cu[0], consumer_unit.IOConsumerUnit))
+
+        self.assertEqual(len(unit.cu[1].agents), 2)
+        self.assertEqual([lazy.is_loaded(cu) for cu in unit.cu],
+                         [False, True])
+        self.assertEqual(self.documents(unit),
+                         self.documents(self.full.holdings[0]))
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of writing identical agent & appliance files once (see util.library).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import os
+import tempfile
+import unittest
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+from huum_io.util import library
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestLibrary(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+        fn_settings = generate_model.write_model(self.dir_tmp.name, 3)
+        self.huum = model_io.IOModelHUUM.load(fn_settings)
+        self.expected = self.documents(self.huum)
+
+        self.dir_out = os.path.join(self.dir_tmp.name, 'out')
+        self.dir_root = os.path.join(self.dir_out, 'model') + '/'
+        self.fn_out = os.path.join(self.dir_out, 'settings.yaml')
+
+    def tearDown(self):
+        self.dir_tmp.cleanup()
+
+    def documents(self, huum):
+
+        # rendered without library, i.e. independent of the file layout
+        return [(unit.id, render())
+                for unit in huum.model.holdings
+                for _, render in unit.iter_documents(unit.id)]
+
+    def files(self):
+
+        return sorted(
+            os.path.relpath(os.path.join(dir_cur, fn), self.dir_root)
+            for dir_cur, _, fns in os.walk(self.dir_root) for fn in fns)
+
+    def write(self, shared, **kwargs):
+
+        self.huum.write(self.fn_out,
+                        root_dir=self.dir_root,
+                        library=shared,
+                        **kwargs)
+
+        return model_io.IOModelHUUM.load(self.fn_out)
+
+    def test_write(self):
+
+        for workers in (None, 2):
+            with self.subTest(workers=workers):
+                shared = library.SharedLibrary()
+                huum = self.write(shared, workers=workers)
+                self.assertEqual(self.documents(huum), self.expected)
+
+                files = self.files()
+                in_library = [fn for fn in files if fn.startswith('library/')]
+                self.assertEqual(len(in_library), 6)
+                self.assertEqual(len(shared), 6)
+                self.assertEqual(shared.num_refs, 36)
+                self.assertFalse(any('/agents/' in fn for fn in files
+                                     if fn not in in_library))
+
+    def test_reuse(self):
+
+        shared = library.SharedLibrary()
+        self.write(shared)
+        written = set(shared.written)
+
+        # a second scenario only adds its changed files
+        daemon = self.huum.model.holdings[0].cu[0].agents[0]
+        vec, _, _ = daemon.moea_gen_vectors(False)
+        daemon.moea_insert_vector([value * 1.1 for value in vec])
+        huum = self.write(shared)
+
+        self.assertEqual(len(shared.written - written), 1)
+        self.assertEqual(len(self.files()), len(written) + 1 + 1 + 3 + 3 * 4)
+        self.assertEqual(self.documents(huum), self.documents(self.huum))
+
+    def test_only_modified(self):
+
+        shared = library.SharedLibrary()
+        self.write(shared)
+        for fn in self.files():
+            os.utime(os.path.join(self.dir_root, fn), ns=(0, 0))
+
+        # the consumer unit references the new file
+        daemon = self.huum.model.holdings[1].cu[0].agents[1]
+        vec, _, _ = daemon.moea_gen_vectors(False)
+        daemon.moea_insert_vector([value * 1.1 for value in vec])
+        huum = self.write(shared, only_modified=True)
+
+        rewritten = [
+            fn for fn in self.files()
+            if os.stat(os.path.join(self.dir_root, fn)).st_mtime_ns != 0
+        ]
+        self.assertEqual(len(rewritten), 2)
+        self.assertEqual(rewritten[0], 'H1/CU0/cu.yaml')
+        self.assertTrue(rewritten[1].startswith('library/agents/agent1_'))
+        self.assertEqual(self.documents(huum), self.documents(self.huum))
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of loading & writing full models (see model_io).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import os
+import tempfile
+import unittest
+import zipfile
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestModelIO(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+        self.fn_settings = generate_model.write_model(self.dir_tmp.name, 3)
+        self.huum = model_io.IOModelHUUM.load(self.fn_settings)
+
+    def tearDown(self):
+        self.dir_tmp.cleanup()
+
+    def documents(self, huum):
+
+        io_model = huum.model
+        documents = {huum.settings.fn_model: io_model.render()}
+        for unit in io_model.holdings:
+            for path, render in unit.iter_documents(unit.id):
+                documents[path] = render()
+
+        return documents
+
+    def test_load_parallel(self):
+
+        expected = self.documents(self.huum)
+        ids = [unit.id for unit in self.huum.model.holdings]
+        for pool in ('thread', 'process'):
+            with self.subTest(pool=pool):
+                huum = model_io.IOModelHUUM.load(self.fn_settings,
+                                                 workers=2,
+                                                 pool=pool)
+                self.assertEqual([unit.id for unit in huum.model.holdings],
+                                 ids)
+                self.assertEqual(self.documents(huum), expected)
+
+        with self.assertRaises(ValueError):
+            model_io.IOModelHUUM.load(self.fn_settings, workers=2, pool='gpu')
+
+    def test_iter_holdings(self):
+
+        expected = [[(path, render())
+                     for path, render in unit.iter_documents(unit.id)]
+                    for unit in self.huum.model.holdings]
+
+        fn_zip = os.path.join(self.dir_tmp.name, 'model.zip')
+        self.huum.write_zip(fn_zip)
+        for filename in (self.fn_settings, fn_zip):
+            with self.subTest(filename=os.path.basename(filename)):
+                holdings = model_io.IOModelHUUM.iter_holdings(filename)
+                documents = []
+                for unit in holdings:
+                    documents.append([
+                        (path, render())
+                        for path, render in unit.iter_documents(unit.id)
+                    ])
+                self.assertEqual(documents, expected)
+
+    def files(self, dir_root):
+
+        files = {}
+        for dir_cur, _, fns in os.walk(dir_root):
+            for fn in fns:
+                path = os.path.join(dir_cur, fn)
+                with open(path, 'rb') as f:
+                    files[os.path.relpath(path, dir_root)] = f.read()
+
+        return files
+
+    def write(self, name, **kwargs):
+
+        dir_out = os.path.join(self.dir_tmp.name, name)
+        self.huum.write(os.path.join(dir_out, 'settings.yaml'),
+                        root_dir=os.path.join(dir_out, 'model') + '/',
+                        **kwargs)
+
+        return self.files(os.path.join(dir_out, 'model'))
+
+    def test_write(self):
+
+        # loading & writing again gives the same files
+        files = self.write('out')
+        self.assertEqual(files,
+                         self.files(os.path.join(self.dir_tmp.name, 'model')))
+        self.assertEqual(
+            {path: text.decode() for path, text in files.items()},
+            self.documents(self.huum))
+
+    def test_write_parallel(self):
+
+        expected = self.write('serial')
+        for pool in ('thread', 'process'):
+            with self.subTest(pool=pool):
+                self.assertEqual(self.write(pool, workers=2, pool=pool),
+                                 expected)
+
+    def test_write_zip(self):
+
+        expected = self.documents(self.huum)
+        for workers in (None, 2):
+            for compression in (zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED):
+                fn = os.path.join(self.dir_tmp.name,
+                                  f'model_{workers}_{compression}.zip')
+                self.huum.write_zip(fn,
+                                    compression=compression,
+                                    workers=workers)
+
+                with zipfile.ZipFile(fn) as zf:
+                    self.assertIsNone(zf.testzip())
+                    names = zf.namelist()
+                    self.assertEqual(len(names), len(set(names)))
+                    self.assertTrue(
+                        all(info.compress_type == compression
+                            for info in zf.infolist()))
+
+                huum = model_io.IOModelHUUM.load(fn)
+                self.assertEqual(huum.settings.dir_modelRoot, 'model/')
+                self.assertEqual(self.documents(huum), expected)
+
+    def test_write_zip_sub_directory(self):
+
+        fn = os.path.join(self.dir_tmp.name, 'model.zip')
+        with self.assertRaises(ValueError):
+            self.huum.write_zip(fn, model_root='/')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the SQLite model store (see model_store).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import os
+import tempfile
+import unittest
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import appliance
+from huum_io import model_io
+from huum_io import model_store
+from huum_io.util import flyweight
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestModelStore(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+        self.fn_settings = generate_model.write_model(self.dir_tmp.name, 4)
+        self.model = model_io.IOModelHUUM.load(self.fn_settings).model
+        self.fn_store = os.path.join(self.dir_tmp.name, 'model.sqlite')
+
+    def tearDown(self):
+        self.dir_tmp.cleanup()
+
+    def documents(self, io_model):
+
+        documents = {'model': io_model.render()}
+        for unit in io_model.holdings:
+            for path, render in unit.iter_documents(unit.id):
+                documents[path] = render()
+
+        return documents
+
+    def test_round_trip(self):
+
+        expected = self.documents(self.model)
+        with model_store.ModelStore.from_model(self.model,
+                                               self.fn_store) as store:
+            self.assertEqual(self.documents(store.load_model()), expected)
+
+        # reopened, saving again replaces the content
+        with model_store.ModelStore(self.fn_store) as store:
+            self.assertEqual(store.holding_names(), ['H0', 'H1', 'H2', 'H3'])
+            store.save_model(self.model)
+            self.assertEqual(self.documents(store.load_model()), expected)
+
+    def test_shared(self):
+
+        shared = model_io.IOModelHUUM.load(self.fn_settings,
+                                           dedup=True).model
+        with model_store.ModelStore.from_model(shared, self.fn_store) as store:
+            io_model = store.load_model()
+
+        self.assertIsNone(io_model.registry)
+        agents = [cu.agents[0] for unit in io_model.holdings
+                  for cu in unit.cu]
+        self.assertFalse(any(flyweight.is_shared(item) for item in agents))
+        self.assertEqual(len({id(item) for item in agents}), len(agents))
+        self.assertEqual(agents[0].origin_key,
+                         shared.holdings[0].cu[0].agents[0].shared_key)
+        self.assertEqual(self.documents(io_model), self.documents(self.model))
+
+    def test_holdings(self):
+
+        with model_store.ModelStore.from_model(self.model,
+                                               self.fn_store) as store:
+            io_model = store.load_model(holdings=['H3', 'H1'])
+            self.assertEqual([unit.id for unit in io_model.holdings],
+                             ['H1', 'H3'])
+
+            io_model = store.load_model(holding_range=('H2', 'H1'))
+            self.assertEqual([unit.id for unit in io_model.holdings],
+                             ['H1', 'H2'])
+
+            unit = store.load_holding('H2')
+            self.assertEqual(
+                [(path, render()) for path, render in unit.iter_documents('H2')],
+                [(path, render()) for path, render in
+                 self.model.holdings[2].iter_documents('H2')])
+
+            with self.assertRaises(KeyError):
+                store.load_holding('H4')
+            with self.assertRaises(KeyError):
+                store.load_model(holding_range=('H0', 'H4'))
+
+    def test_queries(self):
+
+        with model_store.ModelStore.from_model(self.model,
+                                               self.fn_store) as store:
+            showers = store.appliances(appliance_class='shower',
+                                       holding_range=('H1', 'H2'))
+            self.assertEqual(len(showers), 4)
+            self.assertTrue(
+                all(isinstance(item, appliance.IOAppliance)
+                    for item in showers))
+            self.assertEqual({item.name for item in showers}, {'shower0'})
+
+            self.assertEqual(
+                len(store.appliances(name=['tap3', 'toilet2'],
+                                     holdings=['H0'])), 4)
+            self.assertEqual(len(store.agents(changeover_type='Gauss')), 16)
+            self.assertEqual(store.agents(changeover_type='Uniform'), [])
+            self.assertEqual(
+                [item.id for item in store.agents(name='agent1',
+                                                  holdings=['H3'])],
+                ['agent1', 'agent1'])
+
+            columns = store.columns('usage_pattern', ['name', 'demand_type'],
+                                    holdings=['H0'])
+            self.assertEqual(columns['name'], ['default'] * 8)
+            self.assertEqual(columns['demand_type'], ['water'] * 8)
+
+            with self.assertRaises(ValueError):
+                store.columns('appliance', ['data; DROP TABLE appliance'])
+            with self.assertRaises(ValueError):
+                store.columns('appliance', ['name'], colour='red')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
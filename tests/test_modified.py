@@ -0,0 +1,193 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the modification tracking (see BaseMOEA.is_modified) & writing only
+# the modified files.
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import os
+import tempfile
+import unittest
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+from huum_io import parameter_layout
+from huum_io.elements import probability
+from huum_io.util import flyweight
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestModified(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+        self.fn_settings = generate_model.write_model(self.dir_tmp.name, 3)
+
+        # written again by the model, so the file times can be compared
+        self.dir_out = os.path.join(self.dir_tmp.name, 'out')
+        self.fn_out = os.path.join(self.dir_out, 'settings.yaml')
+        self.huum = model_io.IOModelHUUM.load(self.fn_settings)
+        self.write()
+
+    def tearDown(self):
+        self.dir_tmp.cleanup()
+
+    def write(self, only_modified=False):
+
+        files = {}
+        self.huum.write(self.fn_out,
+                        root_dir=os.path.join(self.dir_out, 'model') + '/',
+                        only_modified=only_modified)
+        for dir_cur, _, fns in os.walk(self.dir_out):
+            for fn in fns:
+                path = os.path.join(dir_cur, fn)
+                files[path] = os.stat(path).st_mtime_ns
+
+        return files
+
+    def modified(self, huum=None):
+
+        huum = huum or self.huum
+        return [
+            path for path, _ in huum.model.iter_documents(
+                huum.settings.fn_model, only_modified=True)
+        ]
+
+    def rewritten(self):
+
+        for dir_cur, _, fns in os.walk(self.dir_out):
+            for fn in fns:
+                os.utime(os.path.join(dir_cur, fn), ns=(0, 0))
+        after = self.write(only_modified=True)
+
+        return sorted(
+            os.path.relpath(path, self.dir_out) for path in after
+            if after[path] != 0)
+
+    def test_clean_after_load(self):
+
+        huum = model_io.IOModelHUUM.load(self.fn_settings)
+        self.assertEqual(self.modified(huum), [])
+        self.assertEqual(self.modified(), [])
+
+    def test_same_insert(self):
+
+        vec, _, _ = self.huum.model.moea_gen_vectors(False)
+        self.huum.model.moea_insert_vector(vec)
+        self.assertEqual(self.modified(), [])
+        self.assertEqual(self.rewritten(), ['settings.yaml'])
+
+    def test_changed_insert(self):
+
+        # changes all values of the last holding
+        vec, _, _ = self.huum.model.moea_gen_vectors(False)
+        num = self.huum.model.holdings[-1].get_data_extend()
+        vec[-num:] = [value * 1.01 for value in vec[-num:]]
+        self.huum.model.moea_insert_vector(vec)
+
+        # only the files below the last holding (& the settings) are written
+        unit = self.huum.model.holdings[-1]
+        modified = self.modified()
+        self.assertGreater(len(modified), 0)
+        self.assertTrue(all(path.startswith(unit.id) for path in modified),
+                        modified)
+        self.assertEqual(
+            self.rewritten(),
+            sorted(['settings.yaml'] +
+                   [os.path.join('model', path) for path in modified]))
+        self.assertEqual(self.modified(), [])
+
+    def test_layout_insert(self):
+
+        # the layout holds floats only, so integer values change once
+        layout = parameter_layout.ParameterLayout.compile(self.huum.model)
+        layout.insert(layout.values)
+        self.write(only_modified=True)
+        layout.insert(layout.values)
+        self.assertEqual(self.modified(), [])
+
+        vec = layout.values.copy()
+        vec[layout.node_slice(self.huum.model.holdings[0])] *= 1.01
+        layout.insert(vec)
+        unit = self.huum.model.holdings[0]
+        modified = self.modified()
+        self.assertGreater(len(modified), 0)
+        self.assertTrue(all(path.startswith(unit.id) for path in modified),
+                        modified)
+
+    def test_number_type(self):
+
+        # 1 and 1.0 are written differently
+        prob = probability.IOProbability()
+        prob.type = 'Constant'
+        prob.constant = 1
+        prob.set_data_extend(1)
+        prob.mark_clean()
+        prob.moea_insert_vector([1])
+        self.assertFalse(prob.is_modified())
+        prob.moea_insert_vector([1.0])
+        self.assertTrue(prob.is_modified())
+
+    def test_shared_read_only(self):
+
+        huum = model_io.IOModelHUUM.load(self.fn_settings, dedup=True)
+        cu = huum.model.holdings[0].cu[0]
+        agent = cu.agents[0]
+        self.assertTrue(flyweight.is_shared(agent))
+
+        vec, _, _ = agent.moea_gen_vectors(False)
+        agent.moea_insert_vector(vec)
+        vec = [value * 1.01 for value in vec]
+        with self.assertRaises(AttributeError):
+            agent.moea_insert_vector(vec)
+
+        # a detached copy can be changed, without touching the shared one
+        private = flyweight.detach(agent)
+        private.moea_insert_vector(vec)
+        self.assertTrue(private.is_modified())
+        self.assertIs(huum.model.holdings[1].cu[0].agents[0], agent)
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the numeric list emitter (see util.number_lists).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import io
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+from huum_io.util import number_lists
+from huum_io.util import yaml_io
+
+
+# 1. Global vars ===============================================================
+_values = [0, 60, 0.1, 1 / 3, 600.0, 1e-7, 2.5e20, -4.25]
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestNumberLists(unittest.TestCase):
+
+    def setUp(self):
+        self.format_before = number_lists.get_format()
+
+    def tearDown(self):
+        number_lists.set_format(**self.format_before)
+
+    def read_back(self, values):
+
+        f = io.StringIO()
+        f.write('Name: test')
+        number_lists.write_list(f, '\nValues:    ', values, '  ')
+
+        return yaml_io.parse(f.getvalue())['Values']
+
+    def test_format_value(self):
+
+        self.assertEqual(number_lists.format_value(np.int64(3)), '3')
+        self.assertEqual(number_lists.format_value(np.float32(0.5)), '0.5')
+        self.assertEqual(number_lists.format_value(0.1), '0.1')
+        self.assertEqual(number_lists.format_value(599.96, 3), '600.0')
+        self.assertEqual(number_lists.format_value(1 / 3, 3), '0.333')
+        self.assertEqual(number_lists.format_value(math.inf), '.inf')
+        self.assertEqual(number_lists.format_value(-math.inf), '-.inf')
+        self.assertEqual(number_lists.format_value(math.nan), '.nan')
+
+    def test_format_list(self):
+
+        values = [0.1, 0.25, 1 / 3]
+        self.assertEqual(number_lists.format_list(values), str(values))
+        self.assertEqual(number_lists.format_list(np.array(values)),
+                         str(values))
+        self.assertEqual(number_lists.format_list([0, 1.0, math.inf]),
+                         '[0, 1.0, .inf]')
+        self.assertEqual(number_lists.format_list(values, 2),
+                         '[0.1, 0.25, 0.33]')
+
+    def test_read_back(self):
+
+        for style in number_lists.STYLES:
+            with self.subTest(style=style):
+                number_lists.set_format(style=style, width=30)
+                values = self.read_back(_values)
+                self.assertEqual(values, _values)
+                self.assertEqual([type(x) for x in values],
+                                 [type(x) for x in _values])
+
+                values = self.read_back([math.inf, math.nan, 1.0])
+                self.assertEqual(values[0], math.inf)
+                self.assertTrue(math.isnan(values[1]))
+
+                self.assertEqual(self.read_back([]), [])
+
+                number_lists.set_format(digits=3, style=style, width=30)
+                values = self.read_back(_values)
+                np.testing.assert_allclose(values, _values, rtol=5e-3)
+                self.assertEqual([type(x) for x in values],
+                                 [type(x) for x in _values])
+
+    def test_wrapped(self):
+
+        number_lists.set_format(style='wrapped', width=40)
+        f = io.StringIO()
+        number_lists.write_list(f, '\n    Usage_t:      ',
+                                list(range(0, 3000, 60)), ' ' * 18)
+        lines = f.getvalue().split('\n')[1:]
+        self.assertGreater(len(lines), 1)
+        self.assertTrue(all(len(line) <= 40 for line in lines))
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            number_lists.set_format(digits=0)
+        with self.assertRaises(ValueError):
+            number_lists.set_format(style='table')
+
+    def test_model(self):
+
+        with tempfile.TemporaryDirectory() as dir_tmp:
+            fn_settings = generate_model.write_model(dir_tmp, 2)
+            huum = model_io.IOModelHUUM.load(fn_settings)
+
+            # every style reads back the same model
+            for style in number_lists.STYLES:
+                with self.subTest(style=style):
+                    number_lists.set_format(style=style, width=40)
+                    fn_out = os.path.join(dir_tmp, style, 'settings.yaml')
+                    huum.write(fn_out,
+                               root_dir=os.path.join(dir_tmp, style, 'model') +
+                               '/')
+
+                    number_lists.set_format()
+                    reloaded = model_io.IOModelHUUM.load(fn_out)
+                    self.assertEqual(
+                        reloaded.model.moea_gen_vectors(False),
+                        huum.model.moea_gen_vectors(False))
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the parameter-delta overlays (see overlay).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+# 0. Imports ===================================================================
+
+# general
+import copy
+import os
+import tempfile
+import unittest
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import overlay
+from huum_io import parameter_layout
+from huum_io.events import event
+
+# 1. Global vars ===============================================================
+_event = {
+    'Name': 'party',
+    'Type': 'x',
+    'Probability': {
+        'Type': 'Uniform',
+        'Val_from': 0.1,
+        'Val_to': 0.5
+    },
+    'Effects': [{
+        'Target': 't',
+        'Action': 'a',
+        'Effect_Type': 'Probability',
+        'Probability': {
+            'Type': 'Gauss',
+            'Mu': 3.0,
+            'Sigma': 1.0
+        }
+    }]
+}
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestOverlay(unittest.TestCase):
+
+    def setUp(self):
+
+        # with events, which moea_insert_vector doesn't take
+        self.io_model = generate_model.gen_model(2, distinct=True)
+        for unit in self.io_model.holdings:
+            for cu in unit.cu:
+                for daemon in cu.agents:
+                    party = event.IOEvent()
+                    party.load(copy.deepcopy(_event))
+                    daemon.events.append(party)
+
+        self.reference = copy.deepcopy(self.io_model)
+        self.base = overlay.BaseModel(self.io_model)
+
+    def candidate(self, num_changed):
+
+        vec = list(self.base.vec_var)
+        for i in range(0, len(vec), len(vec) // num_changed)[:num_changed]:
+            vec[i] = vec[i] * 1.02 + 0.5
+
+        return vec
+
+    def test_size_choice(self):
+
+        # sparse entries take 16 bytes, dense ones 8
+        length = len(self.base.vec_var)
+        num_even = length // 2
+
+        ovl = self.base.make_overlay(self.candidate(num_even - 1))
+        self.assertTrue(ovl.is_sparse())
+        self.assertEqual(len(ovl.dumps()),
+                         overlay._header.size + 16 * (num_even - 1))
+
+        ovl = self.base.make_overlay(self.candidate(num_even))
+        self.assertFalse(ovl.is_sparse())
+        self.assertEqual(len(ovl.dumps()), overlay._header.size + 8 * length)
+
+        ovl = self.base.make_overlay(self.candidate(1), sparse=False)
+        self.assertFalse(ovl.is_sparse())
+
+    def test_round_trip(self):
+
+        layout = parameter_layout.ParameterLayout.compile(self.reference)
+        with tempfile.TemporaryDirectory() as dir_tmp:
+            for num_changed in (3, len(self.base.vec_var)):
+                vec = self.candidate(num_changed)
+                fn = os.path.join(dir_tmp, f'{num_changed}.ovl')
+                self.base.save_overlay(fn, vec)
+
+                ovl = overlay.Overlay.load(fn)
+                self.assertEqual(ovl.to_vector(self.base.vec_var), vec)
+
+                layout.insert(vec)
+                self.assertEqual(self.base.apply(fn).render(),
+                                 self.reference.render())
+                self.assertEqual(overlay.fingerprint(self.io_model),
+                                 overlay.fingerprint(self.reference))
+
+        self.base.reset()
+        self.assertEqual(overlay.fingerprint(self.io_model),
+                         self.base.fingerprint)
+
+    def test_other_base(self):
+
+        ovl = self.base.make_overlay(self.candidate(3))
+        agent = self.reference.holdings[0].cu[0].agents[0]
+        agent.lifecycle[0].probability.mu += 1.0
+        with self.assertRaises(ValueError):
+            overlay.BaseModel(self.reference).apply(ovl)
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
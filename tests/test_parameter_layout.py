@@ -0,0 +1,312 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the saved parameter layout (see parameter_layout).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import copy
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+from huum_io import parameter_layout
+from huum_io.events import event
+from huum_io.translators import storage
+from huum_io.translators import translator
+
+# 1. Global vars ===============================================================
+_storage = {
+    'Name': 'tank',
+    'Initial_Volume': 10.0,
+    'Rates': [{
+        'Name': 'fill',
+        'Type': 'constant',
+        'Const_Val': 2.0
+    }],
+    'Translators': [{
+        'Active_for': 'x',
+        'Table_x': [1.0, 2.0, 4.0],
+        'Table_y': [0.5, 0.7, 0.9]
+    }]
+}
+_event = {
+    'Name': 'party',
+    'Type': 'x',
+    'Probability': {
+        'Type': 'Uniform',
+        'Val_from': 0.1,
+        'Val_to': 0.5
+    },
+    'Effects': [{
+        'Target': 't',
+        'Action': 'a',
+        'Effect_Type': 'Probability',
+        'Probability': {
+            'Type': 'Gauss',
+            'Mu': 3.0,
+            'Sigma': 1.0
+        }
+    }, {
+        'Target': 't',
+        'Action': 'a',
+        'Effect_Type': 'Usage_Pattern',
+        'Pattern': {
+            'Name': 'p1',
+            'Type': 'water',
+            'Usage_Length': 100,
+            'Usage_t': [10, 20, 30],
+            'Usage_val': [0, 0.3, 0]
+        }
+    }]
+}
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestLayout(unittest.TestCase):
+
+    def test_vectors(self):
+
+        for ts in (True, False):
+            with self.subTest(timeseries_adjustment=ts):
+                io_model = gen_model_with_parts()
+                reference = copy.deepcopy(io_model)
+                layout = parameter_layout.ParameterLayout.compile(io_model, ts)
+
+                expected = reference.moea_gen_vectors(False, ts)
+                self.assertEqual(layout.vectors(), expected)
+                self.assertEqual(len(layout), len(expected[0]))
+                np.testing.assert_array_equal(layout.bounds(),
+                                              np.array(expected[1]))
+
+                # slices of single elements
+                unit = io_model.holdings[1]
+                vec, _, _ = copy.deepcopy(unit).moea_gen_vectors(False, ts)
+                part = layout.node_slice(unit)
+                self.assertEqual(layout.values[part].tolist(), vec)
+                with self.assertRaises(KeyError):
+                    layout.node_slice(reference.holdings[1])
+
+    def test_fill(self):
+
+        # changed changeover times of one lifecycle
+        io_model = generate_model.gen_model(2, distinct=True)
+        layout = parameter_layout.ParameterLayout.compile(io_model)
+        daemon = io_model.holdings[1].cu[0].agents[1]
+        part = layout.node_slice(daemon.lifecycle[0])
+        values = layout.values.copy()
+        values[part] *= 1.1
+
+        layout.insert(values)
+        np.testing.assert_allclose(layout.fill(), values)
+        self.assertEqual(layout.vectors(),
+                         copy.deepcopy(io_model).moea_gen_vectors(False))
+
+        with self.assertRaises(ValueError):
+            layout.insert(values[1:])
+
+    def test_freeze(self):
+
+        io_model = generate_model.gen_model(2, distinct=True)
+        layout = parameter_layout.ParameterLayout.compile(io_model)
+        lower, upper = layout.lower.copy(), layout.upper.copy()
+        epsilon = layout.epsilon.copy()
+
+        # the bounds of a frozen layout stay those of the baseline
+        daemon = io_model.holdings[0].cu[1].agents[0]
+        part = layout.node_slice(daemon.lifecycle[1])
+        values = layout.values.copy()
+        values[part] *= 1.2
+        self.assertIs(layout.freeze(), layout)
+        layout.insert(values)
+        np.testing.assert_allclose(layout.fill(), values)
+        np.testing.assert_array_equal(layout.lower, lower)
+        np.testing.assert_array_equal(layout.upper, upper)
+        np.testing.assert_array_equal(layout.epsilon, epsilon)
+
+        reference = parameter_layout.ParameterLayout.compile(io_model)
+        np.testing.assert_array_equal(reference.values, layout.values)
+        self.assertFalse(np.array_equal(reference.upper, upper))
+
+
+class TestSavedLayout(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+
+        huum = model_io.IOModelHUUM()
+        huum.settings = generate_model.gen_settings(
+            os.path.join(self.dir_tmp.name, 'model') + '/')
+        huum.model = gen_model_with_parts()
+
+        self.fn_settings = os.path.join(self.dir_tmp.name, 'settings.yaml')
+        huum.write(self.fn_settings)
+
+    def tearDown(self):
+        self.dir_tmp.cleanup()
+
+    def load(self):
+        return model_io.IOModelHUUM.load(self.fn_settings).model
+
+    def test_insert_after_load(self):
+
+        # first call compiles & saves, the second one loads the layout
+        parameter_layout.load_or_compile(self.load())
+        io_model = self.load()
+        layout = parameter_layout.load_or_compile(io_model)
+        self.assertTrue(layout.frozen)
+        self.assertIsNotNone(layout.part_length)
+
+        # same as inserting via a freshly compiled layout
+        reference = self.load()
+        layout_ref = parameter_layout.ParameterLayout.compile(reference)
+        np.testing.assert_array_equal(layout.values, layout_ref.values)
+
+        vec = layout.values * 1.1
+        layout.insert(vec)
+        layout_ref.insert(vec)
+
+        self.assertEqual(io_model.render(), reference.render())
+        for unit, unit_ref in zip(io_model.holdings, reference.holdings):
+            documents = [(path, render())
+                         for path, render in unit.iter_documents(unit.id)]
+            documents_ref = [
+                (path, render())
+                for path, render in unit_ref.iter_documents(unit_ref.id)
+            ]
+            self.assertEqual(documents, documents_ref)
+
+    def test_old_layout_recompiled(self):
+
+        # layouts without the extends of the block parts are recompiled
+        io_model = self.load()
+        layout = parameter_layout.ParameterLayout.compile(io_model)
+        fn = parameter_layout.layout_file(io_model)
+        layout.freeze()
+        np.savez_compressed(fn,
+                            timeseries_adjustment=True,
+                            values=layout.values,
+                            lower=layout.lower,
+                            upper=layout.upper,
+                            epsilon=layout.epsilon,
+                            is_int=layout.is_int,
+                            node_offset=layout.node_offset,
+                            node_length=layout.node_length,
+                            signature=layout._signature())
+
+        with self.assertRaises(ValueError):
+            parameter_layout.ParameterLayout.load(fn, self.load())
+
+        layout = parameter_layout.load_or_compile(self.load())
+        layout.insert(layout.values)
+
+
+class TestSlots(unittest.TestCase):
+
+    def test_as_tree_insert(self):
+
+        # usage patterns & templates, with negative deltas for the clamped
+        # pattern times
+        io_model = generate_model.gen_model(2, distinct=True)
+        reference = copy.deepcopy(io_model)
+        vec, _, _ = reference.moea_gen_vectors(False)
+        layout = parameter_layout.ParameterLayout.compile(io_model)
+
+        rng = np.random.default_rng(7)
+        for _ in range(3):
+            vec = np.array(vec) * rng.uniform(0.5, 1.5, size=len(vec))
+            vec[rng.integers(0, len(vec), 20)] *= -30
+            reference.moea_insert_vector(vec.tolist())
+            layout.insert(vec)
+
+            self.assertEqual(io_model.render(), reference.render())
+            for unit, unit_ref in zip(io_model.holdings, reference.holdings):
+                documents = [(path, render()) for path, render in
+                             unit.iter_documents(unit.id)]
+                documents_ref = [(path, render()) for path, render in
+                                 unit_ref.iter_documents(unit_ref.id)]
+                self.assertEqual(documents, documents_ref)
+
+    def test_translator(self):
+
+        table = translator.IOTranslator()
+        table.load(copy.deepcopy(_storage['Translators'][0]))
+        vec, _, _ = table.moea_gen_vectors(False)
+        reference = copy.deepcopy(table)
+
+        vec = [value * 1.3 + 0.1 for value in vec]
+        reference.moea_insert_vector(vec)
+        (target, writer, length), = table.moea_slots()
+        self.assertEqual(writer([0.0, 0.0] + vec, 2), 2 + length)
+
+        self.assertEqual(table.table_x, reference.table_x)
+        self.assertEqual(table.table_y, reference.table_y)
+
+
+# 2. Functions =================================================================
+def gen_model_with_parts():
+
+    # agents with storages (rates & translators) and events (probability &
+    # usage pattern effects), whose parts only get their data extends when
+    # generating vectors
+    io_model = generate_model.gen_model(2, distinct=True)
+    rng = random.Random(1)
+    for unit in io_model.holdings:
+        for cu in unit.cu:
+            for daemon in cu.agents:
+                tank = storage.IOStorage()
+                tank.load(_storage)
+                tank.initial_volume = rng.uniform(5.0, 15.0)
+                daemon.storages.append(tank)
+
+                party = event.IOEvent()
+                party.load(_event)
+                daemon.events.append(party)
+
+    return io_model
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the named parameter paths (see parameter_registry).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import csv
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import parameter_layout
+from huum_io import parameter_registry
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestParameterRegistry(unittest.TestCase):
+
+    def setUp(self):
+
+        self.model = generate_model.gen_model(2)
+        self.layout = parameter_layout.ParameterLayout.compile(self.model)
+        self.registry = parameter_registry.ParameterRegistry.from_layout(
+            self.layout)
+
+    def test_paths(self):
+
+        registry = self.registry
+        self.assertEqual(len(registry), len(self.layout))
+        self.assertEqual(len(set(registry)), len(registry))
+        self.assertEqual(registry.path(0),
+                         'H0/CU0/agent:agent0/lifecycle:sleep/changeover.mu')
+        self.assertEqual(
+            registry.path(len(registry) - 1),
+            'H1/CU1/room:bathroom/appliance:tap3/pattern:default/usage_length')
+
+        for i, path in enumerate(registry):
+            self.assertEqual(registry.index(path), i)
+        self.assertNotIn('H2/CU0', registry)
+        with self.assertRaises(KeyError):
+            registry.index('H2/CU0')
+
+        # the values are those of the named parameters
+        i = registry.index('H1/CU0/agent:agent1/habit:wash/data_value')
+        habit = self.model.holdings[1].cu[0].agents[1].usage_habits[0]
+        self.assertEqual(self.layout.values[i], habit.data_value)
+
+    def test_duplicates(self):
+
+        self.model.holdings[1].id = 'H0'
+        registry = parameter_registry.ParameterRegistry.compile(self.model)
+        self.assertEqual(len(set(registry)), len(registry))
+        self.assertEqual(registry.path(len(registry) // 2),
+                         'H0/CU0/agent:agent0/lifecycle:sleep/changeover.mu#2')
+
+    def test_select(self):
+
+        registry = self.registry
+        indices = registry.select('*/lifecycle:sleep/changeover.mu')
+        self.assertEqual(len(indices), 8)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices.dtype, np.int64)
+
+        indices = registry.select('H1/*/usage_t[[]0]', 'H1/*usage_length')
+        self.assertEqual(len(indices), 16)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertEqual(len(registry.select('H2/*')), 0)
+
+    def test_files(self):
+
+        with tempfile.TemporaryDirectory() as dir_tmp:
+            fn = os.path.join(dir_tmp, 'paths.npz')
+            self.registry.save_npz(fn, self.layout)
+            registry = parameter_registry.ParameterRegistry.load_npz(fn)
+            self.assertEqual(registry.paths, self.registry.paths)
+            with np.load(fn) as data:
+                np.testing.assert_array_equal(data['upper'],
+                                              self.layout.upper)
+
+            fn = os.path.join(dir_tmp, 'paths.csv')
+            self.registry.to_csv(fn, self.layout)
+            with open(fn, newline='') as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(
+                rows[0], ['index', 'path', 'value', 'lower', 'upper',
+                          'epsilon'])
+            self.assertEqual(len(rows), len(self.registry) + 1)
+            self.assertEqual(rows[1][1], self.registry.path(0))
+            self.assertEqual(float(rows[1][2]), self.layout.values[0])
+
+            # other layouts are refused
+            other = parameter_layout.ParameterLayout.compile(
+                generate_model.gen_model(1))
+            with self.assertRaises(ValueError):
+                self.registry.to_csv(fn, other)
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the parameter selection rules and the reduced layouts (see
+# parameter_selection, parameter_layout.ParameterSubset).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import copy
+import unittest
+
+import numpy as np
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import parameter_layout
+from huum_io import parameter_registry
+from huum_io import parameter_selection
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestParameterSelection(unittest.TestCase):
+
+    def setUp(self):
+
+        self.model = generate_model.gen_model(2, distinct=True)
+        self.layout = parameter_layout.ParameterLayout.compile(self.model)
+        self.registry = parameter_registry.ParameterRegistry.from_layout(
+            self.layout)
+
+    def selected(self, selection):
+        indices = selection.indices(self.registry)
+        return [self.registry.path(i) for i in indices]
+
+    def test_rules(self):
+
+        selection = parameter_selection.ParameterSelection()
+        self.assertEqual(len(self.selected(selection)), len(self.registry))
+
+        # 2 lifecycles per agent, 8 agents
+        selection.include(types='lifecycle')
+        self.assertEqual(len(self.selected(selection)), 32)
+        selection.exclude(paths='*.sigma')
+        paths = self.selected(selection)
+        self.assertEqual(len(paths), 16)
+        self.assertTrue(all(path.endswith('/changeover.mu') for path in paths))
+
+        selection = parameter_selection.ParameterSelection().include(
+            names='sleep')
+        self.assertEqual(len(self.selected(selection)), 16)
+
+        # holding ids, name globs within a segment
+        selection = parameter_selection.ParameterSelection().include(
+            names='H1', types='appliance').exclude(names=['tap*', 'H0'])
+        paths = self.selected(selection)
+        self.assertEqual(len(paths), len(self.registry) // 2 - 2 * 23)
+        self.assertFalse(any('tap3' in path for path in paths))
+        self.assertFalse(any(path.startswith('H0/') for path in paths))
+
+        selection = parameter_selection.ParameterSelection().include(
+            names='agent*/')
+        self.assertEqual(len(self.selected(selection)), 0)
+
+    def test_from_dict(self):
+
+        selection = parameter_selection.ParameterSelection.from_dict({
+            'Include': {
+                'Types': ['lifecycle', 'habit']
+            },
+            'Exclude': {
+                'Names': ['awake'],
+                'Paths': ['*.sigma']
+            }
+        })
+        expected = parameter_selection.ParameterSelection().include(
+            types=['lifecycle', 'habit']).exclude(names='awake',
+                                                  paths='*.sigma')
+        self.assertEqual(self.selected(selection), self.selected(expected))
+        self.assertEqual(len(self.selected(selection)), 16)
+
+        mask = selection.mask(self.registry)
+        self.assertEqual(mask.dtype, bool)
+        self.assertEqual(mask.sum(), 16)
+
+    def test_subset(self):
+
+        selection = parameter_selection.ParameterSelection().include(
+            paths='*/changeover.mu')
+        indices = selection.indices(self.registry)
+        subset = self.layout.subset(indices)
+        self.assertEqual(len(subset), 16)
+        np.testing.assert_array_equal(subset.values,
+                                      self.layout.values[indices])
+        self.assertEqual(subset.bounds().shape, (16, 2))
+
+        # the other parameters keep the values of the layout
+        vec = self.layout.values.copy()
+        vec[indices] *= 1.1
+        reference = copy.deepcopy(self.model)
+        subset.insert(subset.values * 1.1)
+        self.assertEqual(
+            copy.deepcopy(self.model).moea_gen_vectors(False)[0],
+            vec.tolist())
+
+        # and their elements are not touched
+        self.assertEqual(
+            [(path, render())
+             for path, render in self.model.holdings[0].iter_documents('H0')
+             if '/rooms/' in path],
+            [(path, render())
+             for path, render in reference.holdings[0].iter_documents('H0')
+             if '/rooms/' in path])
+
+        # fill only updates the blocks holding selected parameters
+        values = self.layout.values.copy()
+        np.testing.assert_allclose(subset.fill(), vec[indices])
+        changed = np.flatnonzero(self.layout.values != values)
+        np.testing.assert_array_equal(changed, indices)
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            self.layout.subset([0, len(self.layout)])
+        with self.assertRaises(ValueError):
+            self.layout.subset([0, 1]).insert([1.0])
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
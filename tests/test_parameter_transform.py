@@ -0,0 +1,129 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the transforms of the parameter values (see parameter_transform).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import unittest
+
+import numpy as np
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import parameter_layout
+from huum_io import parameter_transform
+
+
+# 1. Global vars ===============================================================
+_lower = [1.0, 0.0, -1.0, 5.0]
+_upper = [100.0, 1000.0, 1.0, 6.0]
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestParameterTransform(unittest.TestCase):
+
+    def test_scales(self):
+
+        # wide, starting at 0, negative & narrow windows
+        transform = parameter_transform.ParameterTransform(_lower, _upper)
+        self.assertEqual(transform.log.tolist(), [True, True, False, False])
+
+        transform = parameter_transform.ParameterTransform(_lower,
+                                                           _upper,
+                                                           scale='log')
+        self.assertEqual(transform.log.tolist(), [True, True, False, True])
+
+        transform = parameter_transform.ParameterTransform(_lower,
+                                                           _upper,
+                                                           scale='linear')
+        self.assertFalse(transform.log.any())
+
+    def test_unit(self):
+
+        transform = parameter_transform.ParameterTransform(_lower, _upper)
+        np.testing.assert_allclose(transform.forward(_lower), 0.0, atol=1e-12)
+        np.testing.assert_allclose(transform.forward(_upper), 1.0)
+
+        # log scaled, the middle is the geometric one
+        middle = transform.inverse([0.5, 0.5, 0.5, 0.5])
+        self.assertAlmostEqual(middle[0], 10.0)
+        self.assertLess(middle[1], 10.0)
+        self.assertAlmostEqual(middle[2], 0.0)
+        self.assertAlmostEqual(middle[3], 5.5)
+
+    def test_log(self):
+
+        transform = parameter_transform.ParameterTransform(_lower,
+                                                           _upper,
+                                                           space='log')
+        values = np.array([10.0, 0.0, 0.5, 5.5])
+        np.testing.assert_allclose(transform.forward(values)[[0, 2, 3]],
+                                   [np.log(10.0), 0.5, 5.5])
+        np.testing.assert_allclose(transform.bounds()[1],
+                                   [np.log(0.1), np.log(1000.1)])
+
+    def test_round_trip(self):
+
+        layout = parameter_layout.ParameterLayout.compile(
+            generate_model.gen_model(2, distinct=True))
+
+        rng = np.random.default_rng(3)
+        population = rng.uniform(layout.lower, layout.upper,
+                                 (5, len(layout)))
+        population[0] = layout.lower
+        for space in parameter_transform.SPACES:
+            transform = parameter_transform.ParameterTransform.from_layout(
+                layout, space)
+            np.testing.assert_allclose(
+                transform.inverse(transform.forward(population)),
+                population,
+                rtol=1e-9,
+                atol=1e-9)
+
+    def test_clip(self):
+
+        # clipped after mapping back, to the raw bounds
+        transform = parameter_transform.ParameterTransform(_lower, _upper)
+        np.testing.assert_allclose(
+            transform.inverse([1.5, -0.5, 2.0, 0.5], clip=True),
+            [100.0, 0.0, 1.0, 5.5])
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
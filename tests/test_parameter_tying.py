@@ -0,0 +1,110 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of tying the parameters of identical agents & appliances (see
+# parameter_tying).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import tempfile
+import unittest
+
+import numpy as np
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+from huum_io import parameter_layout
+from huum_io import parameter_tying
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestParameterTying(unittest.TestCase):
+
+    def test_content(self):
+
+        # the same archetypes under other names
+        io_model = generate_model.gen_model(3)
+        for i, cu in enumerate(io_model.holdings[-1].cu):
+            for daemon in cu.agents:
+                daemon.id = f'renamed_{i}_{daemon.id}'
+            for space in cu.rooms:
+                for device in space.appliances:
+                    device.name = f'renamed_{i}_{device.name}'
+
+        layout = parameter_layout.ParameterLayout.compile(io_model)
+        tying = parameter_tying.ParameterTying(layout, 'content')
+        self.assertEqual(len(tying.groups), 6)
+        self.assertEqual(
+            sorted(len(members) for members in tying.groups.values()),
+            [6, 6, 6, 6, 6, 6])
+
+        # broadcast on insert
+        tying.insert(tying.values * 1.1)
+        for members in tying.groups.values():
+            vec, _, _ = members[0].moea_gen_vectors(False)
+            for element in members[1:]:
+                self.assertEqual(element.moea_gen_vectors(False)[0], vec)
+
+    def test_shared_after_detach(self):
+
+        with tempfile.TemporaryDirectory() as dir_tmp:
+            fn_settings = generate_model.write_model(dir_tmp, 3)
+            io_model = model_io.IOModelHUUM.load(fn_settings,
+                                                 dedup=True).model
+
+        layout = parameter_layout.ParameterLayout.compile(io_model)
+        tying = parameter_tying.ParameterTying(layout, 'shared')
+
+        # inserting detaches the shared elements, their archetypes remain
+        layout.insert(layout.values)
+        tying_detached = parameter_tying.ParameterTying(layout, 'shared')
+        self.assertEqual(tying_detached.groups.keys(), tying.groups.keys())
+        np.testing.assert_array_equal(tying_detached.representatives,
+                                      tying.representatives)
+        self.assertTrue(
+            all(element.shared_key is None
+                for members in tying_detached.groups.values()
+                for element in members))
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
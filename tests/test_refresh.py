@@ -0,0 +1,141 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of re-reading the changed files of a loaded model (see
+# model.IOModel.refresh).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import os
+import tempfile
+import unittest
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+from huum_io.util import flyweight
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestRefresh(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+        self.fn_settings = generate_model.write_model(self.dir_tmp.name, 2)
+        self.dir_model = os.path.join(self.dir_tmp.name, 'model')
+
+    def tearDown(self):
+
+        self.dir_tmp.cleanup()
+
+    def edit(self, relpath):
+
+        fn = os.path.join(self.dir_model, relpath)
+        with open(fn) as f:
+            text = f.read()
+        with open(fn, 'w') as f:
+            f.write(text.replace('Sigma:     1800.0', 'Sigma:     1900.0'))
+
+        # same size, thus make sure the modification time differs
+        stat = os.stat(fn)
+        os.utime(fn, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_edit(self):
+
+        huum = model_io.IOModelHUUM.load(self.fn_settings)
+        old = huum.model.holdings[0].cu[0].agents[1]
+        kept = huum.model.holdings[0].cu[1].agents[1]
+
+        self.edit('H0/CU0/agents/agent1.yaml')
+        changed = huum.refresh()
+        self.assertEqual([fn for fn, _ in changed],
+                         ['H0/CU0/agents/agent1.yaml'])
+
+        new = huum.model.holdings[0].cu[0].agents[1]
+        self.assertIs(new, old)
+        self.assertEqual(new.lifecycle[0].probability.sigma, 1900.0)
+        self.assertEqual(kept.lifecycle[0].probability.sigma, 1800.0)
+        self.assertEqual(huum.refresh(), [])
+
+    def check_dedup(self, **kwargs):
+
+        huum = model_io.IOModelHUUM.load(self.fn_settings, dedup=True,
+                                         **kwargs)
+        agents = [cu.agents[1] for unit in huum.model.holdings
+                  for cu in unit.cu]
+        self.assertIs(agents[1], agents[0])
+        self.assertIs(agents[3], agents[2])
+
+        # the same edit in two holdings gives one new shared agent
+        self.edit('H0/CU0/agents/agent1.yaml')
+        self.edit('H1/CU1/agents/agent1.yaml')
+        huum.refresh()
+
+        new = [cu.agents[1] for unit in huum.model.holdings
+               for cu in unit.cu]
+        self.assertTrue(flyweight.is_shared(new[0]))
+        self.assertIs(new[3], new[0])
+        self.assertIsNot(new[0], agents[0])
+        self.assertEqual(new[0].lifecycle[0].probability.sigma, 1900.0)
+        self.assertIs(new[1], agents[1])
+        self.assertIs(new[2], agents[2])
+
+        # the unchanged files still share their object
+        self.edit('H0/CU1/agents/agent1.yaml')
+        huum.refresh()
+        self.assertIs(huum.model.holdings[0].cu[1].agents[1], new[0])
+
+    def test_dedup(self):
+
+        self.check_dedup()
+
+    def test_dedup_parallel(self):
+
+        for pool in ('thread', 'process'):
+            with self.subTest(pool=pool):
+                self.check_dedup(workers=2, pool=pool)
+                self.tearDown()
+                self.setUp()
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
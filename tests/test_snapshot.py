@@ -0,0 +1,118 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the binary model snapshots (see snapshot).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import os
+import tempfile
+import unittest
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+from huum_io import snapshot
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+        self.fn_settings = generate_model.write_model(self.dir_tmp.name, 3)
+        self.huum = model_io.IOModelHUUM.load(self.fn_settings)
+
+    def tearDown(self):
+        self.dir_tmp.cleanup()
+
+    def documents(self, huum):
+
+        io_model = huum.model
+        documents = {huum.settings.fn_model: io_model.render()}
+        for unit in io_model.holdings:
+            for path, render in unit.iter_documents(unit.id):
+                documents[path] = render()
+
+        return documents
+
+    def test_round_trip(self):
+
+        expected = self.documents(self.huum)
+        for compress in (False, True):
+            with self.subTest(compress=compress):
+                fn = os.path.join(self.dir_tmp.name, f'model_{compress}.snap')
+                self.huum.save_snapshot(fn, compress=compress)
+
+                huum = model_io.IOModelHUUM.load_snapshot(fn)
+                self.assertIs(type(huum), model_io.IOModelHUUM)
+                self.assertEqual(vars(huum.settings), vars(self.huum.settings))
+                self.assertEqual(self.documents(huum), expected)
+
+    def test_shared(self):
+
+        huum = model_io.IOModelHUUM.load(self.fn_settings, dedup=True)
+        restored = snapshot.loads(snapshot.dumps(huum))
+
+        agents = [cu.agents[0] for unit in restored.model.holdings
+                  for cu in unit.cu]
+        self.assertTrue(all(daemon is agents[0] for daemon in agents))
+        self.assertEqual(agents[0].shared_key,
+                         huum.model.holdings[0].cu[0].agents[0].shared_key)
+        self.assertEqual(self.documents(restored), self.documents(huum))
+
+    def test_lazy(self):
+
+        huum = model_io.IOModelHUUM.load(self.fn_settings, only_model=True)
+        restored = snapshot.loads(snapshot.dumps(huum))
+        self.assertEqual(self.documents(restored), self.documents(self.huum))
+
+    def test_invalid(self):
+
+        data = snapshot.dumps(self.huum)
+        for broken in (data[:10], b'NOTHUUM!' + data[8:]):
+            with self.assertRaises(ValueError):
+                snapshot.loads(broken)
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
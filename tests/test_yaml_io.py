@@ -0,0 +1,178 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of the YAML parsers & the parse cache (see util.yaml_io).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import concurrent.futures
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# internal
+from huum_io.util import yaml_io
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+        self.dir_cache = os.path.join(self.dir_tmp.name, 'cache')
+        self.fn = os.path.join(self.dir_tmp.name, 'agent.yaml')
+
+        self.dir_cache_before = yaml_io.get_cache_dir()
+        yaml_io.set_cache_dir(self.dir_cache)
+
+    def tearDown(self):
+
+        yaml_io.set_cache_dir(self.dir_cache_before)
+        self.dir_tmp.cleanup()
+
+    def write(self, content, mtime_ns):
+
+        with open(self.fn, 'w') as f:
+            f.write(content)
+        os.utime(self.fn, ns=(mtime_ns, mtime_ns))
+
+    def entries(self):
+
+        return sorted(fn for _, _, fns in os.walk(self.dir_cache)
+                      for fn in fns)
+
+    def test_hit(self):
+
+        self.write('Name: a\nValue: 1\n', 10**18)
+        self.assertEqual(yaml_io.load_file(self.fn), {'Name': 'a', 'Value': 1})
+        self.assertEqual(len(self.entries()), 1)
+
+        # unchanged files are not parsed again
+        with mock.patch.object(yaml_io, 'parse') as parse:
+            self.assertEqual(yaml_io.load_file(self.fn), {
+                'Name': 'a',
+                'Value': 1
+            })
+            parse.assert_not_called()
+
+    def test_invalidation(self):
+
+        self.write('Name: a\nValue: 1\n', 10**18)
+        yaml_io.load_file(self.fn)
+
+        # other size
+        self.write('Name: a\nValue: 10\n', 10**18)
+        self.assertEqual(yaml_io.load_file(self.fn)['Value'], 10)
+
+        # same size, other modification time
+        self.write('Name: a\nValue: 20\n', 10**18 + 1)
+        self.assertEqual(yaml_io.load_file(self.fn)['Value'], 20)
+
+        self.assertEqual(len(self.entries()), 3)
+        yaml_io.clear_cache()
+        self.assertEqual(self.entries(), [])
+
+    def test_concurrent_put(self):
+
+        # threads writing the same entry each use a temporary file of their own
+        data = {'Name': 'a', 'Values': list(range(10000))}
+        with self.assertNoLogs(yaml_io.mod_logger, 'WARNING'):
+            with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                list(
+                    executor.map(lambda _: yaml_io._cache_put('key', data),
+                                 range(32)))
+
+        self.assertEqual(len(self.entries()), 1)
+        self.assertTrue(self.entries()[0].endswith('.pickle'))
+        self.assertEqual(yaml_io._cache_get('key'), data)
+
+
+class TestBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.backend_before = yaml_io.get_backend()
+
+    def tearDown(self):
+        yaml_io.set_backend(self.backend_before)
+
+    def test_select(self):
+
+        yaml_io.set_backend('PURE')
+        self.assertEqual(yaml_io.get_backend(), 'pure')
+        with self.assertRaises(ValueError):
+            yaml_io.set_backend('fast')
+        self.assertEqual(yaml_io.get_backend(), 'pure')
+
+    def test_parse(self):
+
+        text = ('Name: shower\n'
+                'Usage_t: [60, 120, 180]\n'
+                'Usage_val: [0.0, 0.15, 0.0]\n'
+                'Valid_t_Start: 06:00\n')
+        expected = yaml_io.parse(text, 'pure')
+        self.assertEqual(expected['Usage_val'], [0.0, 0.15, 0.0])
+        for backend in ('auto', 'c'):
+            self.assertEqual(yaml_io.parse(text, backend), expected)
+            self.assertEqual(yaml_io.parse(text.encode(), backend), expected)
+
+    def test_loader_reuse(self):
+
+        loader = yaml_io.get_loader('pure')
+        self.assertIs(yaml_io.get_loader('pure'), loader)
+
+        # loaders aren't shared between threads
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            other = executor.submit(yaml_io.get_loader, 'pure').result()
+        self.assertIsNot(other, loader)
+
+    def test_missing_c_parser(self):
+
+        with mock.patch.object(yaml_io, 'has_c_loader', return_value=False):
+            with self.assertLogs(yaml_io.mod_logger, 'WARNING'):
+                loader = yaml_io.get_loader('c')
+            self.assertIs(loader, yaml_io.get_loader('pure'))
+            self.assertIs(yaml_io.get_loader('auto'), loader)
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()
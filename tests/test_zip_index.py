@@ -0,0 +1,141 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: HUUM_io contributors
+#
+# Changelog:
+#
+# 2026.10.18 - HUUM_io contributors - Initial version
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, HUUM_io contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests of loading single holdings from zipped models via the zip index (see
+# zip_index).
+#
+# Usage:
+#   python -m pytest tests
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+# internal
+import generate_model  # benchmarks/, see pyproject.toml
+from huum_io import model_io
+from huum_io import zip_index
+
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class TestZipIndex(unittest.TestCase):
+
+    def setUp(self):
+
+        self.dir_tmp = tempfile.TemporaryDirectory()
+        fn_settings = generate_model.write_model(self.dir_tmp.name, 3)
+        self.huum = model_io.IOModelHUUM.load(fn_settings)
+        self.fn_zip = os.path.join(self.dir_tmp.name, 'model.zip')
+        self.huum.write_zip(self.fn_zip)
+
+    def tearDown(self):
+        self.dir_tmp.cleanup()
+
+    def documents(self, unit):
+        return [(path, render())
+                for path, render in unit.iter_documents(unit.id)]
+
+    def index(self):
+
+        zf, model_settings, base_dir = model_io.open_zip(self.fn_zip)
+        with zf:
+            return zip_index.ZipIndex.load_or_build(zf, base_dir,
+                                                    model_settings.fn_model)
+
+    def test_subset(self):
+
+        huum = model_io.IOModelHUUM.load_zip(self.fn_zip,
+                                             holdings=['H2', 'H0'])
+        self.assertEqual([unit.id for unit in huum.model.holdings],
+                         ['H2', 'H0'])
+        for unit, i in zip(huum.model.holdings, (2, 0)):
+            self.assertEqual(self.documents(unit),
+                             self.documents(self.huum.model.holdings[i]))
+
+        with self.assertRaises(KeyError):
+            model_io.IOModelHUUM.load_zip(self.fn_zip, holdings=['H3'])
+
+    def test_sidecar(self):
+
+        fn_sidecar = zip_index.sidecar_name(self.fn_zip)
+        self.assertFalse(os.path.exists(fn_sidecar))
+        index = self.index()
+        self.assertTrue(os.path.isfile(fn_sidecar))
+
+        # up to date sidecar
+        with mock.patch.object(zip_index.ZipIndex, 'build') as build:
+            self.assertEqual(self.index().holdings, index.holdings)
+        build.assert_not_called()
+
+        # changed archive
+        with zipfile.ZipFile(self.fn_zip, 'a') as zf:
+            top = zf.namelist()[0].split('/')[0]
+            zf.writestr(f'{top}/notes.txt', 'changed')
+        with mock.patch.object(zip_index.ZipIndex, 'build',
+                               wraps=zip_index.ZipIndex.build) as build:
+            self.assertEqual(self.index().holdings, index.holdings)
+        build.assert_called_once()
+
+    def test_find(self):
+
+        index = self.index()
+        base_dir = index.base_dir
+        self.assertEqual(index.holding_names(), ['H0', 'H1', 'H2'])
+        self.assertEqual(index.holding_member('H1'), 'H1/holding.yaml')
+
+        members = index.members_of_holding('H1')
+        self.assertEqual(len(members), 17)
+        with zipfile.ZipFile(self.fn_zip) as zf:
+            self.assertTrue(set(members) <= set(zf.namelist()))
+
+        self.assertEqual(index.find('consumer_unit', 'CU1'), [
+            f'{base_dir}H{i}/CU1/cu.yaml' for i in range(3)
+        ])
+        self.assertEqual(len(index.find('agent', 'agent1')), 6)
+        self.assertEqual(len(index.find('appliance', 'tap3')), 6)
+        self.assertEqual(index.find('room', 'kitchen'), [])
+        with self.assertRaises(ValueError):
+            index.find('pump', 'tap3')
+
+
+# 3. Main Exec =================================================================
+if __name__ == '__main__':
+    unittest.main()